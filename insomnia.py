@@ -1,3 +1,6 @@
+import time
+PROCESS_START = time.perf_counter()
+
 import sys
 import os
 import ctypes
@@ -5,11 +8,9 @@ import logging
 from datetime import datetime
 import shutil
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QPushButton, QVBoxLayout, QHBoxLayout, 
-                             QWidget, QCheckBox, QLineEdit, QScrollArea,
-                             QProgressBar, QMessageBox, QFrame, QMenu, QLabel, QStackedWidget)
+                             QWidget, QProgressBar, QMessageBox, QFrame, QMenu, QLabel, QStackedWidget)
 from PyQt6.QtCore import Qt, QSize, QPoint
-from PyQt6.QtGui import QIcon, QMouseEvent, QAction
-import winshell
+from PyQt6.QtGui import QMouseEvent, QAction
 import subprocess
 import requests
 
@@ -25,6 +26,7 @@ SCRIPTS_DIR = os.path.join(ROOT_DIR, "scripts")
 LOGS_DIR = os.path.join(ROOT_DIR, "logs")
 ERROR_LOGS_DIR = os.path.join(LOGS_DIR, "errors")
 OLD_LOGS_DIR = os.path.join(ERROR_LOGS_DIR, "old")
+STARTUP_LOG_FILE = os.path.join(LOGS_DIR, "startup_times.csv")
 
 # Create necessary directories
 os.makedirs(ROOT_DIR, exist_ok=True)
@@ -57,6 +59,17 @@ def log_error(message):
         shutil.move(current_log, old_log_file)
         setup_logging()  # Reset the log file
 
+def record_startup_time(window_start):
+    # Time to first window paint, from process start and from window creation.
+    # Appended on every launch so startup can be compared between releases.
+    now = time.perf_counter()
+    new_file = not os.path.exists(STARTUP_LOG_FILE)
+    with open(STARTUP_LOG_FILE, 'a') as f:
+        if new_file:
+            f.write("timestamp,startup_ms,window_ms\n")
+        f.write(f"{datetime.now().isoformat(timespec='seconds')},"
+                f"{(now - PROCESS_START) * 1000:.0f},{(now - window_start) * 1000:.0f}\n")
+
 def check_for_updates():
     update_script_url = "https://raw.githubusercontent.com/Rieversed/Insomnia.cc/main/scripts/update_files.py"
     update_script_path = os.path.join(SCRIPTS_DIR, "update_files.py")
@@ -74,6 +87,8 @@ def check_for_updates():
 class InsomniaApp(QMainWindow):
     def __init__(self):
         super().__init__()
+        self.window_start = time.perf_counter()
+        self.first_paint_recorded = False
         self.setWindowTitle("Insomnia")
         self.setFixedSize(800, 500)  # Increased from 700x400 to 800x500
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
@@ -90,10 +105,15 @@ class InsomniaApp(QMainWindow):
             }
         """)
 
-        # Initialize directories
-        self.directories = {}
-
-        self.load_settings()
+        self.settings = SettingsModel(self)
+        self.worker_client = None
+        self.empty_trash_thread = None
+        self.main_button = None
+        self.watch_cleaner = WatchCleaner(self.settings, self)
+        self.watch_cleaner.error.connect(log_error)
+        self.settings.changed.connect(self.settings_changed)
+        self.watch_cleaner.apply_settings()
+        self.last_summary = {}
 
         self.central_widget = QWidget()
         self.central_widget.setObjectName("centralWidget")
@@ -107,9 +127,9 @@ class InsomniaApp(QMainWindow):
 
         self.oldPos = self.pos()
 
-        icon_path = os.path.join(ASSETS_DIR, "icon.png")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        app_icon = get_icon("icon.png")
+        if not app_icon.isNull():
+            self.setWindowIcon(app_icon)
 
         self.current_tab = "Home"  # Add this line to track the current tab
 
@@ -119,10 +139,10 @@ class InsomniaApp(QMainWindow):
         title_bar_layout.setContentsMargins(10, 10, 10, 5)
         title_bar_layout.setSpacing(10)
 
-        icon_path = os.path.join(ASSETS_DIR, "icon.png")
-        if os.path.exists(icon_path):
+        app_icon = get_icon("icon.png")
+        if not app_icon.isNull():
             app_icon_label = QLabel()
-            app_icon_label.setPixmap(QIcon(icon_path).pixmap(32, 32))
+            app_icon_label.setPixmap(app_icon.pixmap(32, 32))
             title_bar_layout.addWidget(app_icon_label)
 
         self.title_label = QLabel("Insomnia")
@@ -150,9 +170,9 @@ class InsomniaApp(QMainWindow):
                 }}
             """)
             if button_data[0] == "restart":
-                restart_icon_path = os.path.join(ASSETS_DIR, "restart.png")
-                if os.path.exists(restart_icon_path):
-                    button.setIcon(QIcon(restart_icon_path))
+                restart_icon = get_icon("restart.png")
+                if not restart_icon.isNull():
+                    button.setIcon(restart_icon)
                     button.setIconSize(QSize(16, 16))
                 button.setText("")  # Remove text to show only icon
             button.clicked.connect(button_data[2])
@@ -226,28 +246,46 @@ class InsomniaApp(QMainWindow):
         content_layout = QVBoxLayout(self.content_area)
         content_layout.setContentsMargins(20, 20, 20, 20)
 
+        # Tabs are built the first time they are shown
+        self.tab_builders = {
+            "Home": self.create_home_tab,
+            "Tweaks": self.create_tweaks_tab,
+            "Temp Files": self.create_temp_files_tab,
+            "More Apps": self.create_more_apps_tab,
+            "Settings": self.create_settings_tab
+        }
+        self.tab_indexes = {}
         self.stacked_widget = QStackedWidget()
-        self.create_home_tab()
-        self.create_tweaks_tab()
-        self.create_temp_files_tab()
-        self.create_more_apps_tab()
-        self.create_settings_tab()
+        for tab_name in self.tab_builders:
+            self.tab_indexes[tab_name] = self.stacked_widget.addWidget(QWidget())
+        self.ensure_tab("Home")
 
         content_layout.addWidget(self.stacked_widget)
 
+    def ensure_tab(self, tab_name):
+        builder = self.tab_builders.pop(tab_name, None)
+        if builder is None:
+            return
+        index = self.tab_indexes[tab_name]
+        placeholder = self.stacked_widget.widget(index)
+        self.stacked_widget.insertWidget(index, builder())
+        self.stacked_widget.removeWidget(placeholder)
+        placeholder.deleteLater()
+
     def create_home_tab(self):
         home_widget = QWidget()
         home_layout = QVBoxLayout(home_widget)
         home_layout.addWidget(QLabel("Welcome to Insomnia"))
-        # Add more widgets and content for the home tab
-        self.stacked_widget.addWidget(home_widget)
+        self.space_analyzer_view = SpaceAnalyzerView()
+        home_layout.addWidget(self.space_analyzer_view)
+        return home_widget
 
     def create_tweaks_tab(self):
         tweaks_widget = QWidget()
         tweaks_layout = QVBoxLayout(tweaks_widget)
         tweaks_layout.addWidget(QLabel("Tweaks"))
         # Add more widgets and content for the tweaks tab
-        self.stacked_widget.addWidget(tweaks_widget)
+        return tweaks_widget
 
     def create_temp_files_tab(self):
         temp_files_widget = QWidget()
@@ -262,9 +300,9 @@ class InsomniaApp(QMainWindow):
 
         self.main_button = QPushButton("Remove Temp Files")
         self.main_button.setFixedSize(350, 50)
-        icon_path = os.path.join(ASSETS_DIR, "speedmeter.png")
-        if os.path.exists(icon_path):
-            self.main_button.setIcon(QIcon(icon_path))
+        main_icon = get_icon("speedmeter.png")
+        if not main_icon.isNull():
+            self.main_button.setIcon(main_icon)
             self.main_button.setIconSize(QSize(32, 32))
         self.main_button.setStyleSheet("""
             QPushButton {
@@ -285,9 +323,9 @@ class InsomniaApp(QMainWindow):
         
         self.settings_button = QPushButton()
         self.settings_button.setFixedSize(50, 50)
-        settings_icon_path = os.path.join(ASSETS_DIR, "settings.png")
-        if os.path.exists(settings_icon_path):
-            self.settings_button.setIcon(QIcon(settings_icon_path))
+        settings_icon = get_icon("settings.png")
+        if not settings_icon.isNull():
+            self.settings_button.setIcon(settings_icon)
         self.settings_button.setIconSize(QSize(32, 32))
         self.settings_button.setStyleSheet("""
             QPushButton {
@@ -307,8 +345,7 @@ class InsomniaApp(QMainWindow):
         
         self.temp_files_layout.addWidget(self.button_container)
         
-        self.settings_scroll_area = QScrollArea()
-        self.settings_scroll_area.setWidgetResizable(True)
+        self.settings_scroll_area = SettingsView(self.settings)
         self.settings_scroll_area.setStyleSheet("""
             QScrollArea {
                 border: none;
@@ -328,134 +365,37 @@ class InsomniaApp(QMainWindow):
             }
         """)
         
-        settings_content = QWidget()
-        settings_layout = QVBoxLayout(settings_content)
-        
-        self.settings_widget, self.toggle_all_checkbox, self.directories_layout, self.new_directory_input = create_settings_widget(
-            self, self.directories, self.move_to_trash, self.skip_errors, self.clear_recycle_bin,
-            self.update_skip_errors, self.update_move_to_trash, self.update_clear_recycle_bin,
-            self.update_directories, self.confirm_delete_directory, self.add_directory, self.reset_temp_file_settings
-        )
-        settings_layout.addWidget(self.settings_widget)
-        self.toggle_all_checkbox.stateChanged.connect(self.toggle_all_directories)
-        
-        # Add custom directory input
-        custom_dir_layout = QHBoxLayout()
-        self.custom_dir_input = QLineEdit()
-        self.custom_dir_input.setPlaceholderText("Enter custom directory")
-        add_custom_dir_button = QPushButton("Add")
-        add_custom_dir_button.clicked.connect(self.add_custom_directory)
-        custom_dir_layout.addWidget(self.custom_dir_input)
-        custom_dir_layout.addWidget(add_custom_dir_button)
-        settings_layout.addLayout(custom_dir_layout)
-        
-        # Add reset settings button
-        reset_button = QPushButton("Reset Temp File Settings")
-        reset_button.clicked.connect(self.reset_temp_file_settings)
-        settings_layout.addWidget(reset_button)
-        
-        self.settings_scroll_area.setWidget(settings_content)
         self.settings_scroll_area.hide()
         self.temp_files_layout.addWidget(self.settings_scroll_area)
         
-        self.stacked_widget.addWidget(temp_files_widget)
-
-    def add_custom_directory(self):
-        new_dir = self.custom_dir_input.text()
-        if new_dir and new_dir not in self.directories:
-            self.directories[new_dir] = True
-            self.update_settings_widget()
-            self.save_settings()
-            self.custom_dir_input.clear()
+        return temp_files_widget
 
     def create_more_apps_tab(self):
         more_apps_widget = QWidget()
         more_apps_layout = QVBoxLayout(more_apps_widget)
         more_apps_layout.addWidget(QLabel("More Apps"))
         # Add more widgets and content for the more apps tab
-        self.stacked_widget.addWidget(more_apps_widget)
+        return more_apps_widget
 
     def create_settings_tab(self):
-        self.settings_widget, self.toggle_all_checkbox, self.directories_layout, self.new_directory_input = create_settings_widget(
-            self, self.directories, self.move_to_trash, self.skip_errors, self.clear_recycle_bin,
-            self.update_skip_errors, self.update_move_to_trash, self.update_clear_recycle_bin,
-            self.update_directories, self.confirm_delete_directory, self.add_directory, self.reset_settings
-        )
-        self.toggle_all_checkbox.stateChanged.connect(self.toggle_all_directories)
-        self.stacked_widget.addWidget(self.settings_widget)
+        return SettingsView(self.settings)
 
     def switch_tab(self, tab_name):
-        index_map = {
-            "Home": 0,
-            "Tweaks": 1,
-            "Temp Files": 2,
-            "More Apps": 3,
-            "Settings": 4
-        }
-        self.stacked_widget.setCurrentIndex(index_map.get(tab_name, 0))
+        if tab_name not in self.tab_indexes:
+            tab_name = "Home"
+        self.ensure_tab(tab_name)
+        self.stacked_widget.setCurrentIndex(self.tab_indexes[tab_name])
         self.current_tab = tab_name
         self.update_title()
 
     def update_title(self):
         self.title_label.setText(f"Insomnia / {self.current_tab}")
 
-    def load_settings(self):
-        settings = load_settings()
-        self.directories = settings.get('directories', {})
-        self.skip_errors = settings.get('skip_errors', False)
-        self.move_to_trash = settings.get('move_to_trash', True)
-        self.clear_recycle_bin = settings.get('clear_recycle_bin', False)
-
-    def save_settings(self):
-        settings = {
-            'directories': self.directories,
-            'skip_errors': self.skip_errors,
-            'move_to_trash': self.move_to_trash,
-            'clear_recycle_bin': self.clear_recycle_bin
-        }
-        save_settings(settings)
-
-    def update_skip_errors(self, state):
-        self.skip_errors = state == Qt.CheckState.Checked.value
-        self.save_settings()
-
-    def update_move_to_trash(self, state):
-        self.move_to_trash = state == Qt.CheckState.Checked.value
-        self.save_settings()
-
-    def update_clear_recycle_bin(self, state):
-        self.clear_recycle_bin = state == Qt.CheckState.Checked.value
-        self.save_settings()
-
-    def update_directories(self, directory, state):
-        self.directories[directory] = state == Qt.CheckState.Checked.value
-        self.save_settings()
-
-    def confirm_delete_directory(self, directory):
-        reply = QMessageBox.question(
-            self, 'Confirm Deletion',
-            f"Are you sure you want to delete the directory '{directory}' from settings?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
-        )
-        if reply == QMessageBox.StandardButton.Yes:
-            self.delete_directory(directory)
-
-    def delete_directory(self, directory):
-        if directory in self.directories:
-            del self.directories[directory]
-            self.save_settings()
-            self.update_settings_widget()
-
-    def add_directory(self):
-        new_directory = self.new_directory_input.text()
-        if new_directory and new_directory not in self.directories:
-            self.directories[new_directory] = True
-            add_directory_to_layout(new_directory, self.directories, self.directories_layout, self.update_directories, self.confirm_delete_directory)
-            self.new_directory_input.clear()
-            self.save_settings()
-
     def confirm_optimize(self):
+        if self.empty_trash_thread is not None and self.empty_trash_thread.isRunning():
+            self.empty_trash_thread.requestInterruption()
+            self.main_button.setText("Cancelling...")
+            return
         reply = QMessageBox.question(
             self, 'Confirm Optimization',
             "Are you sure you want to delete files in the selected directories?",
@@ -467,13 +407,22 @@ class InsomniaApp(QMainWindow):
 
     def optimize(self):
         self.main_button.setEnabled(False)
-        self.optimize_thread = OptimizeThread(self.directories, self.move_to_trash, self.skip_errors)
+        job = self.settings.cleanup_job()
+        if self.settings.get('out_of_process'):
+            if self.worker_client is None:
+                self.worker_client = CleanupWorkerClient(self)
+                self.worker_client.progress.connect(self.update_progress)
+                self.worker_client.error.connect(self.show_error)
+                self.worker_client.finished.connect(self.optimization_finished)
+            self.worker_client.start_job(job)
+            return
+        self.optimize_thread = OptimizeThread(**job)
         self.optimize_thread.progress.connect(self.update_progress)
         self.optimize_thread.error.connect(self.show_error)
         self.optimize_thread.finished.connect(self.optimization_finished)
         self.optimize_thread.start()
 
-    def update_progress(self, value):
+    def update_progress(self, value, text="Remove Temp Files"):
         bright_green = "#00FF00"  # Brighter green color
         self.main_button.setStyleSheet(f"""
             QPushButton {{
@@ -496,19 +445,41 @@ class InsomniaApp(QMainWindow):
         """)
         
         # Create a custom formatted text with the icon
-        icon = self.main_button.icon()
+        icon = get_icon("speedmeter.png")
         if not icon.isNull():
-            pixmap = icon.pixmap(32, 32)
             self.main_button.setIconSize(QSize(32, 32))
-            self.main_button.setIcon(QIcon(pixmap))
+            self.main_button.setIcon(icon)
         
-        self.main_button.setText("Remove Temp Files")
+        self.main_button.setText(text)
         self.main_button.setLayoutDirection(Qt.LayoutDirection.LeftToRight)
 
     def show_error(self, message):
         QMessageBox.warning(self, "Error", message)
 
     def optimization_finished(self):
+        self.last_summary = self.sender().summary
+        self.reset_main_button()
+        if self.settings.get('move_to_trash') and self.settings.get('clear_recycle_bin') and can_empty_trash():
+            self.empty_trash()
+        else:
+            self.show_completion("File cleanup has been completed.")
+
+    def show_completion(self, message):
+        skipped = self.last_summary.get('skipped_in_use', [])
+        box = QMessageBox(QMessageBox.Icon.Information, "Optimization Complete", message, parent=self)
+        if skipped:
+            box.setInformativeText(f"{len(skipped)} files were skipped because they are in use.")
+            box.setDetailedText("\n".join(skipped))
+        elif self.last_summary.get('in_use_unavailable'):
+            box.setInformativeText("Files in use could not be detected on this system (psutil is not installed), "
+                                   "so none were skipped.")
+        if self.last_summary.get('timed_out'):
+            box.setText(f"{message}\n\nThe time budget ran out after freeing "
+                        f"{format_size(self.last_summary.get('bytes_freed', 0))}. About "
+                        f"{format_size(self.last_summary.get('bytes_remaining', 0))} is left to clean.")
+        box.exec()
+
+    def reset_main_button(self):
         self.main_button.setEnabled(True)
         self.main_button.setText("Remove Temp Files")
         self.main_button.setStyleSheet("""
@@ -526,14 +497,34 @@ class InsomniaApp(QMainWindow):
                 background-color: #e0e0e0;
             }
         """)
-        if self.move_to_trash and self.clear_recycle_bin:
-            try:
-                winshell.recycle_bin().empty(confirm=False, show_progress=False, sound=False)
-                QMessageBox.information(self, "Optimization Complete", "File cleanup has been completed and the recycle bin has been emptied.")
-            except Exception as e:
-                QMessageBox.warning(self, "Error", f"File cleanup completed, but there was an error emptying the recycle bin: {str(e)}")
+
+    def empty_trash(self):
+        self.empty_trash_error_message = None
+        self.empty_trash_text = "Emptying recycle bin... (click to cancel)"
+        self.main_button.setText(self.empty_trash_text)
+        self.empty_trash_thread = EmptyTrashThread()
+        self.empty_trash_thread.sized.connect(self.empty_trash_sized)
+        self.empty_trash_thread.progress.connect(lambda value: self.update_progress(value, self.empty_trash_text))
+        self.empty_trash_thread.error.connect(self.empty_trash_error)
+        self.empty_trash_thread.finished.connect(self.empty_trash_finished)
+        self.empty_trash_thread.start()
+
+    def empty_trash_sized(self, items, size):
+        self.empty_trash_text = f"Emptying {items} items, {size / (1024 * 1024):.0f} MB... (click to cancel)"
+        self.main_button.setText(self.empty_trash_text)
+
+    def empty_trash_error(self, message):
+        self.empty_trash_error_message = message
+
+    def empty_trash_finished(self):
+        thread = self.empty_trash_thread
+        self.reset_main_button()
+        if self.empty_trash_error_message is not None:
+            QMessageBox.warning(self, "Error", f"File cleanup completed, but there was an error emptying the recycle bin: {self.empty_trash_error_message}")
+        elif thread.cancelled:
+            self.show_completion("File cleanup has been completed. Emptying the recycle bin was cancelled.")
         else:
-            QMessageBox.information(self, "Optimization Complete", "File cleanup has been completed.")
+            self.show_completion("File cleanup has been completed and the recycle bin has been emptied.")
 
     def show_restart_menu(self):
         menu = QMenu(self)
@@ -554,50 +545,19 @@ class InsomniaApp(QMainWindow):
     def restart_computer(self):
         os.system("shutdown /r /t 0")
 
-    def reset_settings(self):
-        reply = QMessageBox.question(
-            self, 'Confirm Reset',
-            "Are you sure you want to reset settings to default?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
-        )
-        if reply == QMessageBox.StandardButton.Yes:
-            default_settings = fetch_default_settings()
-            self.directories = default_settings.get('directories', {})
-            self.skip_errors = default_settings.get('skip_errors', False)
-            self.move_to_trash = default_settings.get('move_to_trash', True)
-            self.clear_recycle_bin = default_settings.get('clear_recycle_bin', False)
-            self.save_settings()
-            self.update_settings_widget()
-            QMessageBox.information(self, "Settings Reset", "Settings have been reset to default.")
-
-    def update_settings_widget(self):
-        skip_errors_checkbox = self.settings_widget.findChild(QCheckBox, "skip_errors_checkbox")
-        if skip_errors_checkbox:
-            skip_errors_checkbox.setChecked(self.skip_errors)
-
-        move_to_trash_checkbox = self.settings_widget.findChild(QCheckBox, "move_to_trash_checkbox")
-        if move_to_trash_checkbox:
-            move_to_trash_checkbox.setChecked(self.move_to_trash)
-
-        clear_recycle_bin_checkbox = self.settings_widget.findChild(QCheckBox, "clear_recycle_bin_checkbox")
-        if clear_recycle_bin_checkbox:
-            clear_recycle_bin_checkbox.setChecked(self.clear_recycle_bin)
-
-        self.toggle_all_checkbox.setChecked(all(self.directories.values()))
-
-        for i in reversed(range(self.directories_layout.count())):
-            widget = self.directories_layout.itemAt(i).widget()
-            if widget is not None:
-                self.directories_layout.removeWidget(widget)
-                widget.deleteLater()
-
-        for directory, enabled in self.directories.items():
-            add_directory_to_layout(directory, self.directories, self.directories_layout, self.update_directories, self.confirm_delete_directory)
-
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self.main_button.setGeometry(self.main_button.rect())
+        if self.main_button is not None:
+            self.main_button.setGeometry(self.main_button.rect())
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.first_paint_recorded:
+            self.first_paint_recorded = True
+            try:
+                record_startup_time(self.window_start)
+            except OSError as e:
+                log_error(f"Could not record startup time: {str(e)}")
 
     def toggle_settings(self):
         if self.settings_scroll_area.isVisible():
@@ -607,6 +567,20 @@ class InsomniaApp(QMainWindow):
         
         self.settings_scroll_area.setFixedHeight(self.height() - self.button_container.height() - 40)
 
+    def settings_changed(self, key):
+        if key in ('watch_mode', 'directories', ''):
+            self.watch_cleaner.apply_settings()
+
+    def closeEvent(self, event):
+        self.watch_cleaner.stop()
+        if self.worker_client is not None:
+            self.worker_client.shutdown()
+        if self.empty_trash_thread is not None and self.empty_trash_thread.isRunning():
+            self.empty_trash_thread.requestInterruption()
+            self.empty_trash_thread.wait()
+        self.space_analyzer_view.stop()
+        super().closeEvent(event)
+
     def mousePressEvent(self, event: QMouseEvent):
         self.oldPos = event.globalPosition().toPoint()
 
@@ -615,30 +589,6 @@ class InsomniaApp(QMainWindow):
         self.move(self.x() + delta.x(), self.y() + delta.y())
         self.oldPos = event.globalPosition().toPoint()
 
-    def toggle_all_directories(self, state):
-        checked = state == Qt.CheckState.Checked.value
-        for directory in self.directories:
-            self.directories[directory] = checked
-        self.update_settings_widget()
-        self.save_settings()
-
-    def reset_temp_file_settings(self):
-        reply = QMessageBox.question(
-            self, 'Confirm Reset',
-            "Are you sure you want to reset Temp File settings to default?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
-        )
-        if reply == QMessageBox.StandardButton.Yes:
-            default_settings = fetch_default_settings()
-            self.directories = default_settings.get('directories', {})
-            self.skip_errors = default_settings.get('skip_errors', False)
-            self.move_to_trash = default_settings.get('move_to_trash', True)
-            self.clear_recycle_bin = default_settings.get('clear_recycle_bin', False)
-            self.save_settings()
-            self.update_settings_widget()
-            QMessageBox.information(self, "Settings Reset", "Temp File settings have been reset to default.")
-
 if __name__ == "__main__":
     try:
         if not ctypes.windll.shell32.IsUserAnAdmin():
@@ -651,15 +601,22 @@ if __name__ == "__main__":
             
             # Move the imports here and wrap them in a try-except block
             try:
-                from scripts.TempFilesDeleter.settings_manager import load_settings, save_settings, fetch_default_settings
+                from scripts.TempFilesDeleter.settings_model import SettingsModel
                 from scripts.TempFilesDeleter.optimize_thread import OptimizeThread
-                from scripts.TempFilesDeleter.ui_components import create_settings_widget, add_directory_to_layout
+                from scripts.TempFilesDeleter.worker_client import CleanupWorkerClient
+                from scripts.TempFilesDeleter.empty_trash_thread import EmptyTrashThread
+                from scripts.TempFilesDeleter.watch_mode import WatchCleaner
+                from scripts.TempFilesDeleter.ui_components import SettingsView, SpaceAnalyzerView
+                from scripts.TempFilesDeleter.asset_cache import get_icon, preload as preload_assets
+                from scripts.TempFilesDeleter.space_analyzer import format_size
+                from scripts.TempFilesDeleter.trash_backend import can_empty_trash
             except ImportError as e:
                 print(f"Error importing modules: {e}")
                 print("Some modules might be missing. Please ensure all required files are present.")
                 sys.exit(1)
             
             app = QApplication(sys.argv)
+            preload_assets()
             window = InsomniaApp()
             window.show()
             sys.exit(app.exec())
@@ -0,0 +1,23 @@
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from scripts.TempFilesDeleter.space_analyzer import SpaceAnalyzer, get_directory_cache
+
+class AnalyzerThread(QThread):
+    partial = pyqtSignal(object)
+    error = pyqtSignal(str)
+    finished = pyqtSignal(object)
+
+    def __init__(self, root):
+        super().__init__()
+        self.root = root
+
+    def run(self):
+        cache = get_directory_cache()
+        analyzer = SpaceAnalyzer(self.root, cache=cache, on_partial=self.partial.emit,
+                                 should_stop=self.isInterruptionRequested)
+        result = analyzer.run()
+        try:
+            cache.save()
+        except OSError as e:
+            self.error.emit(f"Could not save the analyzer cache: {str(e)}")
+        self.finished.emit(result)
@@ -0,0 +1,59 @@
+from PyQt6.QtGui import QIcon, QPixmap
+import os
+import base64
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+ASSETS_DIR = os.path.join(ROOT_DIR, "assets")
+
+_bundle = None
+_pixmaps = {}
+_icons = {}
+
+def load_bundle():
+    """
+    Load the asset bundle once. Falls back to the assets directory when the
+    bundle has not been built.
+    """
+    global _bundle
+    if _bundle is not None:
+        return _bundle
+    try:
+        from scripts.TempFilesDeleter.assets_bundle import ASSETS
+        _bundle = {name: base64.b64decode(data) for name, data in ASSETS.items()}
+    except ImportError:
+        _bundle = {}
+        if os.path.isdir(ASSETS_DIR):
+            for name in os.listdir(ASSETS_DIR):
+                path = os.path.join(ASSETS_DIR, name)
+                if os.path.isfile(path):
+                    with open(path, 'rb') as f:
+                        _bundle[name] = f.read()
+    return _bundle
+
+def preload():
+    """
+    Decode every asset up front. Needs a QApplication.
+    """
+    for name in load_bundle():
+        get_icon(name)
+
+def get_pixmap(name):
+    pixmap = _pixmaps.get(name)
+    if pixmap is None:
+        pixmap = QPixmap()
+        data = load_bundle().get(name)
+        if data is not None:
+            pixmap.loadFromData(data)
+        _pixmaps[name] = pixmap
+    return pixmap
+
+def get_icon(name):
+    """
+    Shared QIcon for an asset. A null icon is returned for unknown assets.
+    """
+    icon = _icons.get(name)
+    if icon is None:
+        pixmap = get_pixmap(name)
+        icon = QIcon(pixmap) if not pixmap.isNull() else QIcon()
+        _icons[name] = icon
+    return icon
@@ -0,0 +1,728 @@
+# Generated by scripts/build_assets.py from the assets directory. Do not edit.
+ASSETS = {
+    'icon.png': (
+        "iVBORw0KGgoAAAANSUhEUgAAALQAAAC0BAMAAADP4xsBAAAAIGNIUk0AAHomAACAhAAA+gAAAIDo"
+        "AAB1MAAA6mAAADqYAAAXcJy6UTwAAAAtUExURQAAAMgEBBgmOf8GBpq7t/////9aKVV2ciEhIVBr"
+        "aOfn56CgoBIcKSwsLJASEtPIl4gAAAABdFJOUwBA5thmAAAAAWJLR0QF+G/pxwAAAAd0SU1FB+gK"
+        "ERERFMAxJT4AAAD7SURBVGje7dlBDcJAFEXRWsACFmqhFmoBC1jAAhawgIVawEI1kP8W80LzSWYG"
+        "aEJy72qg5bSbn2nDMBARERER/UOHkr87JkFDQ+9Cj5FWYqZoLuljx0WgoaHb51LqqTQnyT9HHbcO"
+        "DQ1dkSdb027/UrpG2dxDQ0N/ic62WPta3aJ71OZDQ0PX0pmqNNnja6J1YHNy6kNDQzfRS6RH2ox+"
+        "RH5XVRktQBQ0NHQvbX8z7dpdNdmZ7/P0s1SFhoZupze+k+9X0jXynyw1KjQ0dDttX5vo9C77WtWo"
+        "0NDQ7bT97CJ+1v3o1qGhodtbknx0LUFDQ/+aJiIiIiLavyeg4XgVNGvOygAAACV0RVh0ZGF0ZTpj"
+        "cmVhdGUAMjAyNC0xMC0xN1QxNzoxNzoyMCswMDowMM4O2WgAAAAldEVYdGRhdGU6bW9kaWZ5ADIw"
+        "MjQtMTAtMTdUMTc6MTc6MjArMDA6MDC/U2HUAAAAKHRFWHRkYXRlOnRpbWVzdGFtcAAyMDI0LTEw"
+        "LTE3VDE3OjE3OjIwKzAwOjAw6EZACwAAAABJRU5ErkJggg=="
+    ),
+    'restart.png': (
+        "iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAYAAAD0eNT6AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAg"
+        "AElEQVR4nO3de7hdZX3g8a9nzmQyaZrJYJrJpGmayVCaRgoxQsxQ6nQoArU0RbGMVdF2HKodqlaE"
+        "9ulo9bHWYSjaTquUMnZqUetlalu8VAtaqyPKPQSKFCnFGDCNKQQMMYZwOMwf796ek5Nz2Ze11+99"
+        "1/p+nuf37BDO2euXvffa72+9t/U0JElqvuXABmAzMA5MTvt/48CdwD3A7vpTi/G06AQkVWIR6Qtu"
+        "BbAKmAAOA2uAtZ0/9/t8u4AHO38eB/Z0Ygmwd4DnlOqyFDgPeBawCThlgOd4L3A78H9paFFgASDl"
+        "ZxFwDOlLbAuwEvgeYHXnz2tJjfyKqARneIhUGOwiFQa7gX8iFQ8PAfuAuzjyikuq2lLghcCFwEkV"
+        "P/f9wLtJRUFjigELAKl+Y8BxpCuT1aQr6h9lqoFfGZfayD0KfBbYTyoWbiEVB/digaDBLAbeClxc"
+        "0/F2ARcA19V0vJGxAJBGp9vQHw+cSGrwTyV11Wt2jwLXAzuAO7A40NzqbvhnKr4QsACQhmdDP3rd"
+        "wuBu4KPAl2LTUbAXAR+MTqLjI8BradDQgKTZjZFmEm8DrgS+BTxlhMQjwMeBy4Ct871paowx4PPE"
+        "f/Zmi+eN8N8tKcAy0tXGm0jj1dFfMsb88S3gClKBtmGW91PlOo/4z9dC8Wcj+9dLGrllwAtIjYhX"
+        "9+XHw8C1wH8B1qNSXUr8Z6nXeGBEr4Gkik1v8B8j/svDGG10C4Kfw4KgFJ8m/nPTb3yNtAeHpMxs"
+        "Bq7CBt9In4F3korAZSg3JTb+3bAIkDKwmHTFdzvxXwpG3nETaWnZFhSt5Ma/Gw4HSAFs9I1h4zFS"
+        "T9FmVLe3Ef/+VxUWAVINNpGW5tm1b1Qdj5E+W5vQqJUw27/fcHWANAI2+kbdYTEwWk1dfXNWlS+S"
+        "1FbjwEXA48Sf1Ea7w2KgWk0Y958vnBQoDWAx8DLgNuJPYsOYLR4j3TEul7s0lqaJXf8z408re7Wk"
+        "Fjge+DDxJ65h9BO3kArWxahXTe36nxkOBUjzWEG6knJc3yg9HCLoTZNm/S8UX6voNZMa5RTSLWCj"
+        "T1DDGEU8DryGdEMbHaltxb69ABJpQt9rcEKf0Z5wrsCRStrnv6pwbwC12vGk+3lHn4iGERm3k3q+"
+        "2uxh4t+HiHBFgFrnFNydzzBmRnd4YJx2OQ94gvjXPyLcHEitYDe/YfQW3e2H2zI8cC3xr3lkSI01"
+        "DvwSNvyGMUh8mObfofAbxL/OkXHG8C/h4JyNqlFYQbqKeYR0q9VFselIRToP+CbNnSdwHO6T4I2m"
+        "1BjLcdMewxhVNK0QaNPa/7niq0O/ikOwB0BV6Db8j5CuWiRVbxPwRZpTCHj1C+siD24BoGEsw4Zf"
+        "qlu3ELiNsgsBC4BkbdSBLQA0iO7kvn/Chl+KsplUCHyQ1AtXkjFsf7qOjzqwb4D60W34v4WT+6Rc"
+        "vIjUC1dSIXAs7dvzYC4nRB3YAkC9GMOGX8rd9EJgaXAuC7HtmTIZdWDfBC1kK+nWpjb8UhleRNpe"
+        "97+R71X2CbgEsOuZUQe2ANBclgN/AtyAk3Wk0iwCriBtwhW62cwcwq56M2QPgLKxlNTwPwK8ODgX"
+        "ScMZI223exupN0/5sQBQFs4g7Txmwy81y2ZSb96fkP/8ANXEAkCQrgxuI10p+JmQmuvFTM0P8Fxv"
+        "OT8A7dbt7necX2qP7vyAm3BYoNUsANrrdOzul9rsJBwWaDULgPbpXvV/Gt9/Seki4JukiwK1iA1A"
+        "e4yRxv0exqt+SUcaI10UvA97A1rDAqAdVpMm+V2Bm/lImttLmZokqIazAGi2MeBXgK+T7iAmSQvp"
+        "ThK0N6DhLACaq3vVf1l0IpKKZG9Aw1kANM8YcDFe9Usa3vTegGXBuahiFgDNspJ01X95dCKSGuWl"
+        "pO3BXSnQIBYAzXE68I941S9pNKavFLA3oAEsAMq3hHRCuq5fUh3sDWgIG4yynQJ8nnRCSlJdur0B"
+        "F0cnosFZAJTrYuCLpO08JSnC5TgkUCwLgPIsI51wTvSTlIPukMBp0YmoPxYAZTmddKLZ5S8pJ2PA"
+        "XwMXAePBuahHFgDluAgn+knK2zuAW0hLkpU5G5P8dWf5vyM6EUnqwSbSkmSHBDJnAZC3lcAXsMtf"
+        "UlmmDwkoUxYA+TqNVEVvjk5Ekgb0DuBqUk+mMmMBkKeLSNWz74+k0r2M1JPpvIDM2MDkZQmpWna8"
+        "X1KTbObIeQGHAnNRh8s18rES+BR2+Utqpu68gB8FJjqhQBYAeVgLfC06CUmqwReAD2EBEM4hgHin"
+        "Af8QnYQk1ehFwPLoJNrOAiBWd7KfPTGSpFrZ8MQYA34ZJ/tJkoJYANRvHPg/pKUxkiSFcAigXkuw"
+        "8ZckZcAegPosJ433u8xPkhTOHoB6rMTGX5KUEXsARs81/srZBH4PSK3kiT9azwH+JjoJNdIEMAkc"
+        "7jx2YzGwE7gfWArs6vz3ohm/vwh4oPNz64Hv6zxX12FgHamAPdD5mXVMbeE6Nu05xzv/3Q1JBbAA"
+        "GJ3Tgb/EL0T1b5LUwB9m6gp9L/DZzuPDwG7gUeDWzmPErmprSUXGamBFJ36ENN9lXef/T5IKBQsE"
+        "KTMWAKPxPFLjL81nekM/BuwBrgduB+7qxJ6w7Ba2q/N497S/e9eMn1lFmvuyjFQgnAyc2vn7bnHQ"
+        "7UGQVCMLgOrZ+Gs23cZ+knT1fj1wB3An+Tf0w9gDfHKO/7cKOB44Dng5sIlUDI2ThjIkjdDTohNo"
+        "GBt/dU0AB0kN2Q7SbZ7vBz6Ht0KdzypSQXAucA5wDKkg6A4jSE3zfuD8iANbAFTHxr/durc33QPc"
+        "SLq18yeAfZFJNcQWYCvwEuAEpiY7WhCoCSwACmfj304HSY3QPcBlwHXY4NehWxCcTxpCmCTtsimV"
+        "yAKgYDb+7dGdsPcQaVz7KlL3vmJtAl4JnE0aQnC1gUoSVgBoOM8DnjIaHU8Aj5Nm5r8UJ87mbgvw"
+        "GuAW0vv2BPGfIcOYL96HinM68R8cYzTRbfTvwEa/ZOOk9+8OLAaMfMMCoDCnkr5Qoj84RnXxBPBt"
+        "bPSbanox8CTxnzfD6EZYAeA4Wf/WAp/n6K1VVaZJ0lr8VwDfDZxIGpOL2FlPozNBel9PBH4A+EPg"
+        "QVySqRbzKqc/K/HGPk2xG/gYTuRro/uBCzp/3kj6DGxlamdCqRXsAejdctLabpXrMOlq/3zg3wG/"
+        "iI1/290N/CjwL0lFwV3Y+yNpmiXAbcSPFRmDxePAF4E1M99YaRYbgS8Q/7k12hHOAcjYOHAl6YYm"
+        "KscEqZv/t4B/QbpL3YOhGakU3V6B7lyB3bHpSIpyNfEVotFffBnYNtubKQ3oMuDruJTQqD5cBpip"
+        "i4j/cBi9xRPY8Gv0ziF9zqI/70ZzwgIgQzb+ZcSTpPH9jbO/jdJIWAgYVYUFQGZOI/5DYSwcNvyK"
+        "ZiFgDBtOAszISuDT0UloXncDzydN7Ls7OBe12zXAM0ifRz+LKooFwJG6a/19XfLUbfifQfrilXLR"
+        "LQR+nXS3SEkFWYxr/XONr5C6WqVSXA78I/HnjpF/OASQgatwrX9u9pHW8f8QXvGrLJcA/xb4q+hE"
+        "pLlYACQXAS+LTkJHuBE4GfhV0h7tUol+grTt9M3RiUgzWQCkGf/viE5C33EPcCbwH0g3bZFKtxN4"
+        "NnAucG9sKtKUthcAK4Bro5MQAI8CbyZ1918XnIs0Cn9O+ny/nTS8JYVqewFwLd4SOQc3A88CfiM6"
+        "EWnEJknzA04mDXNJYdpcAFyEk/6i3UPqFn02dverXe4nDXO9mdT7Jakm7vQXHw69SMl64Abiz0kj"
+        "JlwGWCN3+ot1H2lm9JnRiUiZsDdAIdpWACzGnf4iXUe6x7pro6Wj/QZpLoxzA1SLtjWE78Zx/wj3"
+        "4lW/1At7A6QRcNw/JhzrlwZzLG5P3oZwDsCIOe5fv32kqxiv+qXB3EcaEvhMdCJqprYUANfSnn9r"
+        "DraTlva5rl8a3nNJy2V3BuehhmlDo3gxsCk6iRa5jnTVcl90IlKD/DmpN217dCJqjqYXAKeRbsup"
+        "0TuIXf7SKN1LKq7dKluVaHIBsBTH/etyL/CfsctfqsOZpHPtYHQiKluTC4Arafa/LxfXAT8IfCI6"
+        "EalF3kwqundFJ6JyNbWBPA14aXQSLXANdvlLUT5BmiDovAANpIkFgF3/o3eQ1AX5/OhEpJZzXoAG"
+        "1sQCwK7/0dpF6np8c3Qikr6jOy9Aai13+xtt3AIc1/O7IalurwK+Sfx3hdF7hO0EOB514BGw63+0"
+        "Pgf8p+gkpJZb1HlcTOrp7D4u6fz9/wX+I/Ci+lNTaZpUANj1PzrX4WQ/aVTma9THSFuZjwOrSeP9"
+        "46T7BCwCNnR+fkW9KasJmlIAnI6z/kflGpzsJw1inKlGfHqjPk5qsMeBVcDJpMZ8PTbqqlETCoCl"
+        "eMe5UfkNnOwnzWcJsIz0PTQOLCc14OPA9wMndf58XOdnbdSVjSYUAHb9V28S+B/Y+EuzWQms68RP"
+        "Ac8B1gbmIw2k9AJgK3b9j8KvkwoASUm3a/4s4OXAxth0pOGVXACMAe+MTqJhDgJvw8Zf6loOrAEu"
+        "AF4TnItUqZILgFeRxtdUjb3AK3BPfwnSFf9a0hDj6cG5SCNR6tj5UuAd0Uk0yF7SFY6Nv5TG9n8H"
+        "+Hts/NVgpfYAXEVaJqPhHSQ1/h+LTkQKNk7qVbyWNLNfarQSewC2Ai+OTqJBLsXGX1oOvAW4ARt/"
+        "tURpPQBO/KvWG3DCn7SatB/7adGJSHUqrQBw4l91bPyl1Pjf0nmUWqWkIQAn/lXHxl9Kjf5NncfJ"
+        "4Fyk2pVUADjxrxq/gY2/tBz4ImmN/yRlfRdKlSjlQ78MJ/5V4WO4va+0CLiCtNwPyvkelCpVygf/"
+        "yugEGuCvgJ+OTkLKwEV4QSEVUQC47G94twI/EZ2ElIFzSMv9pNYroQC4IjqBwt0NnB+dhJSBY0j7"
+        "XizCSX9S9gXAVmBzdBIF2wmcC9wTnIcUbYy0imjDtP+WWi33k8Cr/8EdBF6Hjb8EsA04LzoJKSc5"
+        "FwBn4NX/MC4FrolOQsrAGPBaYAl2/UvfkWsBMA58KjqJgl0H/GZ0ElImtgGbOn/O9TtPql2uJ8Mv"
+        "kG9uubsVODM6CSkjF5I2/vHqX5omx0Z2nHQvbvVvJ874l6Y7jql9/nP8vpPC5HhC/AJpmY7646Q/"
+        "6WivAzZGJyHlKLcCwKv/wb0NJ/1J0y0Gjo9OQspVbgWAV/+DuQ5v8CPNtIV0sx8pZ+NRB86pAFiM"
+        "V/+DuAcn/UmzOYGp8X8pVweiDpxTAfBCvPrv10Hg16KTkDL1E/idovz9XdSBcyoAXh2dQIEc95fm"
+        "Fta1KvXhUNSBcykAtpLG69S7L+G4vzSXVaSb/0i5uzfqwLkUAO753599wAXRSUgZ2wCsjE5C6sH+"
+        "qAPnUABsxD3/+/U7pNv8SprdKmBpdBJSD26OOnAOBcAbohMojPv8SwtbjHMAlL/tkQePLgCOAV4c"
+        "nENJXPIn9eYHgGXRSUgL+GzkwaMLgEuDj18al/xJvXk8OgGpBx+MPHhkATCOV//9uBGX/Em9+mfR"
+        "CUg92Bl58MgC4FU4SadXjwKviE5CKshjePtf5e2TpBVdYSILgHcEHrs0l+Osf6kfOwn+cpUWEL75"
+        "XVQBsBW36OyVG/5I/ZvEHgDl6wBwf3QSUQXAlUHHLc1D2PUvDeJuYG90EtIczo9OAGIKgHFgU8Bx"
+        "S/SHpKV/kvqzE4cAlKcDwGeik4CYAuC/BRyzRPcCb4lOQirUIdLdMqXcnEvgLYCniygALg84Zoku"
+        "IfAuUVIDhI+xSjPsJu3mmoW6C4BTcPJfL24EPhadhFS4j5O+cKVcnBydwHR1FwDe9W9hh4Gfj05C"
+        "aoB7cR6A8vFrZFaQ1lkALMbJf724GSf+SVW4n8B7rUvTPAj8dnQSM9VZALywxmOVah/wyugkpAb5"
+        "CzKZcKXWehB4Nql3Nyt1FgCvrfFYpfoD3PFPqtL7Cb7lqlrtAKnxz6rrv6uuAuAE4KSajlWqPcBb"
+        "o5OQGujW6ATUSvuB55Np4w/1FQB2ay/sj3HZnzQKlwM7opNQq+wnrffPYsOfaI8BTxlzxldIkyQl"
+        "jcZlxJ/nRjvia8DpCEgz/6PfkNxj28CvrqRerAS+SPy5bjQ7vgysoRB1DAFcUMMxSnY3bvojjdpe"
+        "4J14h0CNxj7SvVueQZr1rw67/+cPr/6l+vwf4s95oznxOHAHcAY6it3/88cdg7+0kgZwDHAD8ee+"
+        "UX78A/BLaE5XEv8m5RpPAi8d/KWVNKAXkM6/p6Y9GkYv8W3gFuAqYDWFe9qIn/8xYOmIj1GqvcAP"
+        "kJaLSKrXG5nad2OSmDujqgwHgZ2kcf4PA+8KzaZC4yN87k3Y+M/nj7Dxl6L8JjABXEpq/C0CBOk7"
+        "eYzU4O8nfUb+FPgIabO2RhllAeDmP3PbDbwlOgmp5f5n57FbBKh59s94fJRU7B3gyHtEjAN3keZl"
+        "jQOfpAWz+UdZADi+PbeP4a5/Ug6mFwEqw/RGfZLUqENq0LtX8OOkJda3d/7ffZ3Hezu/s7eWTDM3"
+        "qjkAm5h64XWkSeCZwJ3RiUj6jhcCbwOOi06kpRZq1AEWYaNeqVH1ANj9P7frsfGXcvMRUuPyTuC0"
+        "4Fya5CDwUOfP3UZ9/7T/Nwbcw1Sjfj+pMbdRr8GoegCc/T+7CeCHSR94SflZRrp50M+Rrjh1tANM"
+        "jaM/NO3Pk6RGvdv9PgH8PVO3OL+v83c26pkYRQGwBPjWCJ63Ce4iFQCS8nYecCGwhXbcqKufRv0r"
+        "ncddpO80r9QLNYoC4GXA1SN43iZ4CfCB6CQk9ey/Aj8LnEJ5hUC3Ad8/7XFf5/9Nb9QPk67UD5Nm"
+        "vtuot8QoCoDbgM0jeN7S7QZ+CNf+SyX6r8DzgbXA8YF5HCRdfc/VqHfH1Kc36juZumLfVW+6ytko"
+        "CoCnRvCcTfAHwC9GJyFpKCtJe3hsBFZ0YuWQzzlXoz5JWi48W6O+i6kr9p1DHl8tVXUB4PK/2U0A"
+        "z8LZ/1KTrCf1BjyfdA/4SdLNhgCWkyYRdncYfJT0PXCQ1MCPk2a6HyLdVOYQNuqqWdUFwJXAqyp+"
+        "zibYQVr7L6nZlpEa/HWklVCTpMZ+J0cuiZMa5zHi79aUWzyOuyJKkjJTZQ/AcuCRCp+vKSaAp+Pk"
+        "P0lSRqq8AcaPVfhcTfIlbPwlSZmpsgD48QqfqykO4bbIkqQMVTkE4Pa/R3sQ+L7oJCRJmqmqHoDl"
+        "2PjP5hPRCUiSNJuqCoAfq+h5muQwaVmkJEnZqaoAcPz/aHtx4x9JUqaqKgB+rqLnaRK7/yVJ2apq"
+        "EqD7/x/pMHAy9gBIkjJVRQ/Algqeo2l2Y+MvScpYFQXAuRU8R9N8KToBSZLmU0UBsLGC52iSCeCv"
+        "o5OQJGk+VcwBeJipW2Aqjf9/D27/K0nK2LA9AMux8Z/pTmz8JUmZG7YAOKOSLJpjEnhfdBKSJC1k"
+        "2ALghyvJojkmcQKgJKkAwxYAmyrJojkeBG6NTkKSpIUMWwCcUkkWzeHVvySpCMMUAMfgBMDpJoBP"
+        "RychSVIvhikATq8si2aYAK6JTkKSpF4MUwA4AfBIe4BHo5OQJKkXwxQATgA8kuP/kqRiDFMAOAFw"
+        "iuP/kqSiDLMVsLcAnrIf+H4cApAkFWLQHgBn/x9pETb+kqSCDFoAnFVpFuW7MzoBSZL6MWgBsKrS"
+        "LMo2CVwdnYQkSf0YtABYUmkWZTsM3BudhCRJ/Ri0AHh2pVmUbQKHACRJhRl0FcAjwPIqEynYAeC7"
+        "o5OQJKkfg/QAjGPjP93e6AQkSerXIAXAhsqzKNv10QlIktSvQQqAFZVnUa5J4I7oJCRJ6tcgBcCy"
+        "yrMolxMAJUlFGqQA+JHKsyjXIWB7dBKSJPVrkAJgZeVZlG1fdAKSJPXLIYDhPBSdgCRJgxikADit"
+        "8izK5QoASVKRBikA3AMgmQRuj05CkqRBDLoVsNI9AHZEJyFJ0iD6LQAWjSSLMk0Ce6KTkCRpEP0W"
+        "AMeOJIsyTZLuAyBJUnH6LQDcBXDKBPBgdBKSJA2i3wLgmJFkUabx6AQkSRpUvwXAmpFkUSbvAihJ"
+        "KpY9AIP7bHQCkiQNqt8C4N+NJIsy2QMgSSpWvwWAs96TSeDh6CQkSRpUvxPZnAOQTAK7o5OQJNVu"
+        "HFgNrGKqTVxDuqCe7Dx2V4jt7sQe0t1js9JvAbB+JFmUZxJvBCRJbbEa2AKsA55BagvXMLU3zly9"
+        "6TunxR5Sz/GNwM2k3WRD9VsAOASQTJDeUElSM60CTgGOB36EdCO8ftvMdZ2YbhfwOeBvScVAMTeV"
+        "ewB4yuBbwKYhX0tJUn5WAb8MXAs8yWjbkgeAS4EXUcBW+9ENby7xGKlLSJLUDCuBN5Ea/oh25U+A"
+        "U0f+rxxCdMObS3xz2BdSkpSNc4C/JL5teQC4nEzn20W/OLnEI3grZUkq3UrgCkbf1d9v3AC8eIT/"
+        "7oFEvyi5hHsASFLZtgGfIr49mS/eQSZzA5YQ/2LkEhYAklSu84DHiW9LeokPksGQwGriX4hcwgJA"
+        "ksp0MfAE8e1IP3EDwUXAqlmSamtYAEhSeS4ivv0osgiwALAAkKRSXUx821FsEWABYAEgSSV6IfHt"
+        "RpVFQCUTA13KJklqss3Ae6KTqNBW4H1VPJEFwGCyWJYhSVrQu4Gl0UlU7DzgNXUe0CGAqfjykK+l"
+        "JGn0fof49mKUMdR8gH56AOwtmHJfdAKSpHltJd3Up8k+OMwv99Oo7x/mQA2zLDoBSdK8fjc6gRps"
+        "Id3HYCD9FAAHBj1IA+2OTkCSNKfzSI1jG7xz0F/st1t/36AHapBJ4JboJCRJc7oiOoEarWHAXoB+"
+        "C4DrBzlIw0wAd0YnIUma1VZgRXQSNRuoF6DfAuDuQQ7SMIexAJCkXA3cJV6wNcAp/f5SvwXAtf0e"
+        "oIEWAw9FJyFJOsqxwEnRSQS5sI6DRK97jI4vDv8SSpJGoOnr/ueLx/t9sQZZ279zgN9pigng8ugk"
+        "JEmzGnhJXAMsIs1/6NkgBcBlA/xOU4wB10UnIUk6yhLSjrVt9oujPsAK4rs67P6XJE33IuAJ4tuJ"
+        "yPhmPy/YID0ADwE3DvB7TWD3vyTl6aeA8egkgi2jhpvVnUR8pVN3fIPUxSRJys/fE99O5BAben3B"
+        "Br3Bz3bgwQF/t1RvAw5GJyFJmlXbx/+7ju/1BwctACaBVw/4uyXaA/x+dBKSpDlNRCeQiZN7/cFh"
+        "bvF7DXDzEL9fkkvxwyVJuVqN4/9dPW+DPEwBAPCzQ/5+Cbbj1b8k5WwlFgBdPQ9VD1sA3A/81pDP"
+        "kbsL8OpfknJ2mDQ0LTiu1x8ctgAAeCvNXRb426QeAEmSStBzIVRFAXAAeAmwu4Lnysk1wOujk5Ak"
+        "qQ/39fqDVRQAkIYC/nNFz5WDHdSwpaIkSRXreSOgqgoAgOtpxtLAu4CfJy39kyTl73B0AiWqsgAA"
+        "eBdlFwF3AeeTegAkSWVYh6sA+lZ1AQDlFgE2/pJUptWMpj1rtFG9YO+irImBn8TGX5JK5VLtAYyy"
+        "YvoAaWJg7ksEf4805m/jL0kqXcgkwNlcT+oJePuIjzOIe4DXdmJvcC6SpME5CXDKrugEZvMi4Abi"
+        "b5X4BHAlcMJo/7mSpJpcBDxJfPuSQ/xCry9anbMmP0S6edALgZ8GTqnx2JDGiP4QuJa0yY8kqRme"
+        "jpMAu3oeAoiyHvgV4AuMvhr6O+Aq4Jxa/mWSpLq9j/gr71zil3p90aLWTXZvIvQRYAtwIqlH4DkV"
+        "Pf89wIOkAuMTuJ+/JDXZmugEMtJzD0D0xgn3d+JDpF6Bk0jrOZ8JrCVt7rBunt+f6Pz+eOfxS8DD"
+        "ncc9pCJAktRs+6MTyMjOXn8wugCYrlsMACwmFQKrOgGpIJh5l6OdpIZ+jLTnQJazHyVJI9XzLXBb"
+        "oOdVbU8bZRaSJNXgMWBpdBKZ+CHSMPiCnDUpSSrZGO4EON2+Xn/QAkCSVLJJbMumO9DrD/qiSZJK"
+        "tgLbsukO9vqDvmiSpJJtoYDNb3JkASBJKtkybMu6+loJ54smSSqZQwBTHurnh33RJEklOxnbsq6d"
+        "/fywL5okqWSnRieQEXsAJEmtsSI6gYxYAEiSWmPmFvFtdkM/P2wBIEkq1UryuqdNtL5uimQBIEkq"
+        "1Qm4B8B0DgFIklrhBOwBmO7efn7YAkCSVKoTsR2brq+bIvnCSZJK5RLAKY/2+wsWAJKkUq2MTiAj"
+        "1/f7CxYAkqQS2fgf6aZ+f8ECQJJUog04AXC6nm8D3GUBIEkq0bnA4ugkMrK731+wAJAkleic6AQy"
+        "s73fX3jaKLKQJGnEHgOWRieRkX+OywAlSQ23HO8BMN0++mz8wQJAklSec4Al0Ulk5EuD/JIFgCSp"
+        "NGfiCoDpdgzySxYAkqTSbIlOIDO3D/JLFgCSpJKsAFZFJ5GZuwb5JQsASVJJNmLbNdP9g/ySL6Ik"
+        "qSQ/gxsATTfQCgCwAJAklWVbdAKZ6fsmQF0WAJKkUqzohKbcOegvWgBIkkrh+P/R/nbQX/SFlCSV"
+        "wvH/o31m0F/0XgCSpFI8AKyJTiIj+4CnD/rL9gBIkkpwEq7/n2ngCYBgASBJKsMp2GbNNPAEQPDF"
+        "lCSV4Xxss2YaeAIgOAdAkpS/ZcA/AYuiE8nMvwYeHfSXraYkSbk7G9urmfYxROMPvqCSpPxdgrf/"
+        "nenWYZ/AAkCSlLNlwIboJDL0wWGfwAJAkpSzs/Hqfzb/LzoBSZJG6XbgKeOIeJgKiiJ7ACRJubL7"
+        "f3a3MuAtgKezAJAk5Wobdv/PZujxf0mScmb3/+yxfpgXtcuNgCRJOVoGfAPv/jfTPuDfUMEQgF0r"
+        "ytEKYAmwlrTz15rO48mdvzs84+fHgQOkq4V7gPuAe2f5OUnlcPb/7CoZ/wd7AFSfFaRKfh1HNurP"
+        "InVndRvr5aTGf5x0BdB9HAOWLnCMCaZ2x9rXec77gauBz1X1D5FUi78Fjo9OImooueIAABONSURB"
+        "VEOvAP6oiieyANAwVpIa8XWdx7WkBnt6oz5GasAHbdSrsAvYC9wMvBl4qIZjShrcJuA2nKg+m+8C"
+        "DlbxRBYAmmklqYFe33lcRzoJT+boRn1p58/Lp/1dXY36oO4BdgCXA9uDc5E0uyuBV0UnkaEDwHdX"
+        "9WQWAO0wV6P+LOA4prrfS23UB7EHuAZ4HXAoOBdJU5YBfwesjk4kQ78HvLaqJ3OCRbkWatQnSN3u"
+        "3ca7DY16P1aRrjBOAz4CvCE2HUkd27Dxn8vfVPlk9gDkZSWpYT6289/HAz/Q+bvjWbhRZ9qj+vNH"
+        "wKupaGxN0sCc/De3fwXsr+rJLABGb9BGHaaWw2l0JpmaaHQrcCnw53HpSK22gVQA2Dt9tO2kHt7K"
+        "WAAMptuoH0dqQDYCP8hUoz7JVMPdvSK3US/HJcDbo5OQWugLwKnRSWTq5cB7q3xCC4ApwzTqx9Du"
+        "8fQmsgiQ6rUYeAR3/ptLZcv/utrazbKGtMvUM0gN/WKmGnAb9XbrDglc3vlviwCpHm/Gxn8uBxjB"
+        "/KQ2FQCrgBcCP0Pqhl+HXfE62hhHFgFjwG+FZiQ132Lgv0QnkbH3RydQqjOALwJfBr5N/F2cjDLi"
+        "yc7jE6TeIkmjcynx53zOccLgL207nUW6Ocw3iH/zjLLjy3gCSqP0deLP81zjsSFe13k1cZ/ltcAN"
+        "wPtI+0mvjE1HDbCRNClQUvW24ff0fCqd+d9krwG+SnzFZjQzLkZS1b5M/Lmdc9j7uIA1pM0jniD+"
+        "zTKaF935AF8DNiOpKtuIP79zjm8O/tIurAlDAN1JfsfTrlUNqk/3PFkLvDIyEalhLo1OIHPO/p/H"
+        "GaQJEtFVmtGe+Cr2AkhV8Op/4bD7fw42/kZUXIWkYTn2P3+MtPsfyh0COAP4M9ypTzHOAE6KTkIq"
+        "2DbS6hrN7UOjPsA/G/UBRmANcD1pX2QpwnLgMPCp6ESkQv058D3RSWTuLEZ8e/ISewBuwi18FW8D"
+        "ZZ4/UjSv/hd2K/DQqA9S2hfYh4HV0UlIwHpga3QSUmEWM3WjLc3td+s4SEkFwGuA86KTkDrWAz8b"
+        "nYRUmDeTbrmu+X2kjoOUUgCsp6aKSOrDmugEpIKMAS+LTqIAHwIO1XGgUgqAK6ITkGaxllScSlrY"
+        "x3EItxdvretAJRQA60mzIaXcrCZNBpQ0vw34Pd6Lw8DddR2shALAq3/lagVwbHQSUgHeQxntTbTX"
+        "13mw3N8Qr/6Vs3HgxOgkpMxtwxUzvfqDOg+WewHg1b9ytzg6ASljY7jsr1cfACbqPGDOBcBSvPpX"
+        "/mo9YaXCfByX/fXqbXUfMOcC4OzoBKQeeD8KaXYb8SKuV7VO/uvKuQC4MDoBqQfj0QlImXo3ebcx"
+        "Oal18l9Xzm/OqdEJSD3I+RySovx34JToJAqxn5on/3Xl+uW1OToBqUcHohOQMrMRuCQ6iYJ8iKC5"
+        "RLkWAFaOklSmd5Numa3e/FrUgXMtAH44OgGpR/dHJyBl5I14AdeP7cC+qIPnWgA4BKBSTEYnIGVi"
+        "I0GT2QoWOtk91wLgpOgEpB48CHwhOgkpE3b992c7cGNkArkWAFIJHiSdxFLbOeu/f+FL3XMsALxd"
+        "pEpxAHgoOgkp2DnAG6KTKMxhgq/+Ic8CwI1VVIq7ohOQMnApsCQ6icK8LjoByLMAWB+dgNSD3cBf"
+        "RichBbsW2BCdRGEOAf87OgnIswCwklQJ7gU+F52EFOiNwBnRSRTo9WRyE7EcCwCXVakEO8jkJJYC"
+        "bCSTbuzCZHP1D3kWAFLu9mD3v9rtauCY6CQKlM3VP1gASP3o9k7dhd3/aq9rca+WQWR19Q8WAFI/"
+        "xkjbdv4uGVXxUo0c9x9cVlf/YAEg9ap79X8n8MnIRKQg5xB445rCHSLolr/zsQCQejMG7ARejRNV"
+        "1T4bgd/BVVqDej0Zfm9YAEi9+yRu/qN2uhpYF51EobK8+gcLAGkh3ar9HuDXIxORgjjpbzhZXv2D"
+        "BYC0kDHSrn8/Q+B9u6UgH8VJf8OYJNOrf7AAkHpxOXb9q33eCGyLTqJwZ5Lp1T9YAEgL+XUyruCl"
+        "EdmGM/6HdSvwmegk5uOd96S5vR/4n2S2dlcasXOAq3DG/7AujE5gIfYASLP7EOkEtvFXm3SX+62M"
+        "TqRwHwBujk5iIRYA0tF+E7gA2B+diFQzl/tV4xejE+iFQwDSkc4nXf175a+2+Twu96vCByjk4sEC"
+        "QEoeBZ5Lmrgjtc3ngedEJ9EAh0i9h0VwCEBKE/1+GBt/tZONf3VeBxyMTqJX9gCozW4EfhW4nozX"
+        "6koj9Cls/KtyK5nd7nchFgBqoxuBNwA7cHc/tddHgbOik2iQ4m4UZgGgNvk90vrmPdjwq90+irv8"
+        "Ven9pAuLolgAqMl2kbr3P0i6mc8u4HBoRlI8G/9qHaKQZX8zWQCodPeRGvaDwE7S8r3PA3cDB0jL"
+        "cQ5EJSdl5lq8uU/VXkeh3zEWAMrRfaTG/FDn8SDwD6TG/W7Skj1I4237Oz83Sbq67z5KOpKz/atX"
+        "3MS/6SwAVJf7O3G483gI+AqpwZ6vUe8+ujGPNDgb/9EobuLfdBYAGsZCjfo+0l4TE6QuMht1qX42"
+        "/qNxCQVO/JvOAkAL2UO6LWi3ke/Onp/ERl3K2XGkCbCboxNpoEng7dFJDMsCQAtZBZwL/FR0IpJ6"
+        "tg14J7A2OpGGem50AlVwK2D14mzSjmGS8nc28G5s/Efl/cBno5NoqrOAp4ws4/PzvG+S4r0F+Bbx"
+        "3xVNjSeBpT2/G5mzB0D9eA5wG2lsUVJePgq8CVgSnUiDPZdC1/zPxgJA/doMfJrUzSgpD5/G3f1G"
+        "za7/GjgEUEZ8i9TdKCnOcaReuejvg6ZHo7r+u+wB0KCWkLobPx2diNRSZ5POP5f5jV6juv67LAA0"
+        "rNNxXoBUt7cAH8aZ/nV4PXb918YhgDLjazgvQKrDp4k/39sSt/X4nhTJHgBVZS3pisR5AdJonE3a"
+        "avv06ERa5CejE2gbewDKD+cFSNVyfX/9cVFP74wqZQHQjPgK8DwkDcsu//rj6p7emcI5BKBROQ74"
+        "UxwSkAb1PODvscu/bpPAhdFJ1MECQKPUXSp4A3BscC5SSa4F/hLPmwiNXPI3GwsA1WErcAupGJA0"
+        "t2NJM8/PiE6kpVzyF8w5AM2Om4D1SJrpTcAjxJ+jbY1WjPvnzgKg+fEI9gZIXceSCuPo87LN0cit"
+        "fhfiEIAiLCdNDrQ3QG02BlxOOg+2BOfSdq0Z95/OAkCRtpDmBlyOn0W1ywuAvwMuBo4JzqXtHPfP"
+        "iEMA7Yx/6Lz3UtNdS/z5ZqRo9bi/V13KxXrgU6Qlgw4LqIneBHwDZ/jnYjvwyugkIlkAKDdbScug"
+        "3hidiFSRc4Avk+a9rAzORckEcCZwKDqRSBYAytFy4K2kL81zgnORBrWONMHvL4CNsalohjOBh6KT"
+        "iGYBoJxtJH153kT6MpVK8Sngqzi7P0c/iZP+AAsAlWELaU/0G7AQUN4uB/4RJ7Tm6vXAJ6OT0Nxc"
+        "BWDMFw+TvmSlXIwBl5Em+EWfH8bc0eoZ/6WwADB6iW+QvnSlKIuBl5HW80efD8b8cVvn/VLmLACM"
+        "fsJCQHVbhA1/abFi1ney5ZwDoNKtBH4F+DrwbuC42HTUcJcBDwDvATYE56KFTQDfhzP+i2EPgDFs"
+        "3ACsRaqOY/xlxmmzvZlK7AFQE20lrRr4MrAtOBeVayPwBeBxUi+Tm/iUxeV+C7AAUFMtIn2BfxS4"
+        "gzRmuyg0I5ViG2l8/w7gVPzclOh1uNyvSA4BGKOKfwSuBDYhHe0y0lySJ4n/rBqDxy/PfGNVDgsA"
+        "Y9TxJPC3pF6BcdRm20hDRd8m/nNpDB+u9S+cBYBRVzzRiS/gXu1tsonUE/QAXu03Ka7Ggr54FgBG"
+        "RDxOahAcImim9aRlog+Q3uvoz5tRbbwHG/9GsAAwosNioBnGgZeSJvN5pd/cuA1Ygvr2tOgEZnEW"
+        "6U5aUg4OA3uBTwBXATti09ECNgGvBM4GjiHN4PfKsLm2Az8OPBqdSIksAKTeHSQtnb0HeAfwIdJO"
+        "Y4qzhHS3yHOBc4BV2OC3hY3/kCwApMFMkHoH9gHXAH8G3EwqEjRaW0ibPZ1PuuKfwBu9tI2NfwUs"
+        "AKRqHCJdee4gTUi6H/h/WBBUYXqDf3zn7xbhRmZtZeNfEbvKpGp0r0BPAjaTrkongd2knoFPkeYR"
+        "7AvJrhyrSDd0Ohd4AbCc9D1lgy+w8a+UPQBSPSZIvQRjwB7getIGNJ8Fbg3MK9Iq0hX9ccDLSd35"
+        "h0kNvl36msnGv2L2AEj1GAeWdv68vhOQioJJpoqCW0i3Lt1P+sLbU2+alVtGujPjClLPyImk/fVX"
+        "kf7d3Vn63at7993XbGz8R8AeACkvk9PiMKlh3NWJR0m7Fu4jLU3cDRzo/L8I46Qu+i2dx1XA0zuP"
+        "P8bU3fO6DbyNuwZh4z8iFgBSWaYXCN0liIc7j4uAnaQJiEtJhcFOphreRaQNjh7k6Mb4MLAG+L5p"
+        "z3cYWEe6gj9A6rVYx1RhAlMN+xj2KKp6fwxciJNpR8ITVirLGEd3l0/fBW0jC9/XYK69C3r9PnDX"
+        "NdXhvcAFuNfGyFgASO3jea/cvRd4BTb+I+WyGklSTl4H/Dw2/iPnlYAkKRevB/5XdBJtYQEgScrB"
+        "TwKfjE6iTSwAJEmRJoAzSZtiqUYWAJKkSP+euL0sWs1JgJKkCNuBf4ONfxgLAElS3d4L/ChpR0sF"
+        "sQCQJNXp9aSbP7m7XzDnAEiS6vJTpNtiKwMWAJKkUZsEnosz/bPiEIAkaZTeC/xrbPyzYwGQrwng"
+        "c9hdJqlc3fH+/dGJ6GgWAPkaB/YAP03aG1uSSjEB/Djw29GJaG4WAHlbRBo7+1+kk2kyNh1JWtB2"
+        "4Huxyz97FgB5m/7+fBb4t6STS5Jy5Pr+glgA5G3mFf9e0sn1/oBcJGk+ru8vjAVAeQ4C5+OQgKQ8"
+        "TOJ4f5EsAMrVHRLYEZ2IpNZ6L/CvcLy/SBYAZdsLPAu4JDoRSa3SneX/cuBAcC4akAVA+SaBt5N2"
+        "2XJIQNKo7cBZ/o1gAdAcnyF1xTlBUNKoXELqdXSWfwNYADTLAdIEQXsDJFXpVuA/kHob/W5pCAuA"
+        "ZrI3QFJVLgGeDdwYnYiqZQHQXPYGSBqGV/0NZwHQfPYGSOqXV/0tYAHQDvYGSOqFV/0tYgHQLt3e"
+        "gA9EJyIpO78KnIxX/a1hAdA+B4CXkKr8W4NzkRSvu67/t6ITUb0sANrrRtIY34XA4eBcJNVvkjQs"
+        "+Exgd3AuCpBjAZBjTlFG/VpMAr8PPB2HBaQ2+QBpOPAz0YkoTo6N7T3RCWRkvKbjTB8W2F7TMSXV"
+        "r9vd/xLcw7/1ciwAlExSf2N8I2kSkMMCUrPY3a+j5FgA7IxOIBOHgNsDjuuwgNQch0kF/b/A7n7N"
+        "kGMBMIlFQFddQwCz6Q4LfC9wZ2AekgbzAVIh//uk2/dKR8ixAAC4OTqBDBwG7opOgtRdeCLOD5BK"
+        "sZ10vjrOr3nlWgDcEZ1ABg6R14TIG0m3AbUQkPLUbfifhZv5qAe5FgB2OefbyHYnCr4aJwpKObDh"
+        "V+M81eL4NvDC4V/CkRsHfgl4nPjXzDDaFo+Tzr9cL+SUuZw/ONdEJxDoMGm9bu4mgHcB34U9AlJd"
+        "DpPOt+8inX/etEeNcxbxFXZUPFzB6xfBHgHDGF10r/gjVwdJtYk+4aJO8vOqePECWQgYRnVxE/BS"
+        "YDFSi/wF8Sdf3fFIJa9cPk4hbWgU/boaRmlxO+n8kVppHfEnYd3xtipeuAxZCBhGb2HDL3W0qRfg"
+        "mxW9Zjk7Hvgg8a+1YeQWfwosQ9J3rCP+xKwrmnr1P5tx4DU4T8BodzxOOg+c2CfNoQ29AG24+p/N"
+        "YuBlwC3EvweGUVfYzS/1IfqEHXWUPvO/CpuAK4DHiH8/DKPqeAy4CliBpL6cTfwJPKq4tsLXqQns"
+        "FTCaFLeQPs+LkDSwNxF/Mlcdj1X6CjXPJuBK7BUwyorHgHfj1b5Uqa8Tf3JXFY8Dx1b78jTaqaQ7"
+        "RUa/b4YxV9xB+pxKGpGmFAEl3PAnR90hgtuIfw8N4zbS59Gd+qQarCf+pB82nPRXDYsBIyJs9KVA"
+        "JRcBNv6jYTFgjDJs9KWMrKO84QAb/3p0iwG3HzaGCRt9KXMlbBT0BE74i7IUeAHwTlxNYMwf3bX6"
+        "m5BUjJyXCP4NMDa6f7r6tAV4K+k2q9GfDSM+biJ9HrYgqVjryG9IwC7//G0mXfXZO9CO6F7lb0ZS"
+        "47yF+C+Zv8Gr/hItIw0XuCVxc8IrfKmFIgqBLwIb6/jHqTZbSQ2IWxPnHw8DHwcu67xvklrujcBX"
+        "Ge0Xz+U4U7gtjiP1ErwRi4LouKXzPpxH6r2R1KOnRSdQs9XAzwEXkOYLDOv3gPcAOyp4LpVtA6nn"
+        "55mkGeSnAstDM2qWR4HrSefa7cBdwL2hGUmFa1sBMNMZpIlAP9T575NI4/Ybpv3Mjs7f3Uja53sH"
+        "cA+wr740VbANwPHAiVgY9GJmQ3836XyTVLG2FwBShDHSMMImYBVpn4Jn047iYG8ndgM3k7rwD5Ia"
+        "/IcC85JaxwJAys8i4BhgCalXamXnv7+38+c1pMJhTVSCs3gQ2NN53Etajruv8+cdwH3AZFh2ko5i"
+        "ASCVbxGpMDjYeVzd+fMaYC1weIjn3UVq1BcB46Qr972k4mTvEM8tKdj/B+vDTs/k6ib1AAAAAElF"
+        "TkSuQmCC"
+    ),
+    'settings.png': (
+        "iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAYAAAD0eNT6AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAg"
+        "AElEQVR4nO3df7Bfd13n8Wcv1265g/FOtmZjgGyNJSANNZRMcGm4rdi67U53rAIFYnHWzrosbdUZ"
+        "RRnHVsetO075MQxg0S67FrdKoQVaZ8GqRShJcU1sadMEJKUmWShJtj/yS/Jjmrvt/vG5X3tzc398"
+        "v/d7znl/zvk8HzPvScX+eN/vOee+X9/z43POQFJuRoALgIuB1wGrgJcBS4Gz4tqqzQngELAfeBzY"
+        "BmwC/haYDOxLkqRGTAC3AgeB5y2OAncAlwGjQ3yukiRlZwS4ivStN3rg5ly7gWuBscV9zJIk5WM9"
+        "Dv7FBIErFvNhS5IUbRT4MHCS+IHa1roLGB/0g5ckKcoq4GHiB2gXajewdrCPX5Kk5q0F9hE/OLtU"
+        "h4FLBtkIkiQ16QLSsIoemF2s43hfgCQpQ6uBp4gflF2uo6SbKiVJysIYsJP4AVlCPQWs6G+zSJJU"
+        "rzuIH4wl1WZcNEiSFOxK4gdiifWefjaOVLozohuQOmoM+Baeko5wDPhR4NvRjUg5G4luQOqoX8Xh"
+        "H2UM+N3oJqTceQZAqt4Y8B3S2/sUYxJ4JbAruhEpV54BkKp3DQ7/aKPAddFNSDnzDIBUvS34THoO"
+        "9gMvJ50NkDSDZwCkaq3G4Z+L5bhMsDQnA4BULQdOXi6NbkDKlQFAqpYDJy9vim5AypX3AEjV+i4+"
+        "/peTSeAHSGsDSJrGMwBSdcZw+OdmFFgV3YSUIwOAVB0HTZ7OiW5AypEBQKqOz/7naTy6ASlHBgCp"
+        "OmdGN6BZLYluQMqRAUCqjq+hldQaBgBJkgpkAJAkqUAGAEmSCmQAkCSpQAYASZIKZACQJKlABgBJ"
+        "kgpkAJAkqUAGAEmSCmQAkCSpQAYASZIKZACQJKlABgBJkgpkAJAkqUAGAEmSCmQAkCSpQAYASZIK"
+        "ZACQJKlAo9ENaGjjwMuAMWAJ8CxwBNgLPBnYlyQpYwaAdhkBNgCXAhcDrwaWzvP3HwG+CWwCvgJ8"
+        "CThWb4uSJKkqq4EPA/uA54eow8BtwPpm2y/GZQy3fax66tr5Npok5WgNcDdwkup/KW4GJpr7UYpg"
+        "AMizDADSLLwJME/jpG/8DwNXUs+lmg2kywJ3ACtq+PdLkjJmAMjPBGnw/zLN3KPxduDrwFUN/Lck"
+        "SZkwAOTlWuBvgHMa/u+OA58GbsZ9QpKK4C/7fNwE3ELskxm/AfxZcA+SpAb4iz4PN5OGbw7eTtov"
+        "3gFMBvciSaqJZwDi5TT8e95CujnQgChJHeUv+Fg5Dv+et0z96ZkASTONAOeTniZ6HXAusAp4CWlV"
+        "0mdJi47tBx4HHiM9evwAcCigXykrNxP/fHQ/dRcGxX65DkCe5ToA1ZkAbgWeYnHb4iRwH3AN6eZj"
+        "qThtGf69MgT0xwCQZxkAhjNCekz4YardLgdJvwuXNfejSLHaNvx7ZQhYmAEgzzIALN56YAv1bp/D"
+        "wHvw94s6rq3Dv1eGgPkZAPIsA8DgRkmrkdaxDPlctY20/LnUOW0f/r0yBMzNAJBnGQAGs5L6v/XP"
+        "VUeBjfX/iFJzujL8e2UImJ0BIM8yAPRvDcO/dbSKuqHuH1RqQteGf68MAaczAORZBoD+rAOeIX57"
+        "9ermen9cqV5dHf69MgScygCQZxkAFraWvIZ/rwwBaqWuD/9elR4CxkjPRt9E3HVTa/4yAMwv1+Hf"
+        "K0OAWqWU4d+rkkLAGHAJaeBvBo4T//lb85cBYG65D/9eGQLUCqUN/151OQSsAq4HvoADv41lAJhd"
+        "W4Z/rwwBylqpw79XXQkBo6Rv+bcAO4n/XK3h6v10Y7+sUtuGf68MAcpS6cO/V20NAWPAlcDtpCVK"
+        "oz9Hq9o6OLVtr5za1iVr6/DvlSFAWXH4n1ptCQFjpEVH7iYtQBL9uVnN1FHSPrqR8sJA24d/rwwB"
+        "yoLDf/bKNQSMkh7XuwOHvpX2gdtJl3xG6LauDP9eGQIUyuE/f+UUAtaT1jZf7GtMre7XPuCDwAV0"
+        "T9eGf68MAQrh8O+vIkPAOOnu/W0L9GhZM2sbad/pwjvruzr8e2UIUKMc/oNV0yFggnRa10f2rGHr"
+        "OGlfmqCduj78e2UIUCMc/ourukPAGOkbm4/tWXXVdtI+1pYbB0sZ/r0yBKhWDv/hqo4QsIr0nLeP"
+        "7llN1UHSPreKfJU2/HtlCFAtHP7VVFUhYIL0+N7JDH4mq8w6Sdqfc7s8UOrw75UhQJVy+Fdbw4SA"
+        "K0hr8Ef/DJY1vbaQFhmKfpSw9OHfK0OAKuHwr6cGCQEjpEVbvJvfyr22A1cT8+SLw//UMgRoKA7/"
+        "emuhEDAKXAPszqBXyxqkdpNeQtRUEHD4z16GAC2Kw7+Zmi0EjJC+Re3OoD/LGqZ2k0JsnUHA4T9/"
+        "GQI0EId/s9ULASPAVaTTqNE9WVaVtZO0b1d9j4DDv78yBKgvDv+Y+gJe47e6X9tIN7JWweE/WBkC"
+        "NC+Hv2VZTdRm0gBfLIf/4soQMM2LohvIyM3Ab0Q3IakIK4H/SFpM6O+Bfxrgn10L/A2wtIa+uu5C"
+        "0kqOX4xuJAcGgMThL6lpI6Rh/m7gxaS1BE4u8M84/IdnCJhiAHD4S4r1faTVBH8BeAL4+hx/n8O/"
+        "OoYADAAOf0m5+H7grcAG0tmAZ6b9/xz+1Ss+BJQcABz+knK0CvhFYAnwt8B5OPzrUnQIOCO6gSAO"
+        "f0ltsIcUBBz+9Xof8N7oJppW4hmAG4Abo5uQpD6Mk24QVL2KPBNQWgC4GvhodBOSpOwUFwJKCgBr"
+        "gD8n3XErSdJMRYWAUgLAKPBXwMuiG5EkZa2YEFBKAPhV4J3RTUiSWqGIEFBCAFgGfAb4F9GNSJJa"
+        "o/MhoIQA8NvAm6KbkCS1TqdDQNcDwBjwSeCs6EYkSa3U2RDQ9QDwTuBt0U1IklqtkyGg6wHgfaRl"
+        "NSVJGsaFpCfKvhzdSFW6vBTwOPAUaYNJklSF64CPRTdRhZHoBmq0AYe/JKlaHya9vrn1uhwA3hjd"
+        "gCSpc0aBPyGdZW61LgeA1dENSJI66Rzgd6ObGFaX7wHYTlr/X5Kkqk0CrwV2RDeyWF0+A7A8ugFJ"
+        "UmeNAjdFNzGMLp8BOI4LAEmS6jMJnAc8Ft3IYnT5DIBPAEiS6jRKeiywlbp8BuAwsCS6CUlSp+0H"
+        "Xgo8F93IoLp8BuB70Q1IkjpvOWndmdbpcgDYFd2AJKkIl0Y3sBhdDgCPRzcgSSrCxdENLEaXA8BD"
+        "0Q1Ikorw6ugGFqPLAeCB6AYkSUVYSguXBu5yAHgUeDq6CUlSEc6JbmBQXQ4AzwGfi25CklSE1j12"
+        "3uUAAPBn0Q1IkopwZnQDg+p6ANgEPBLdhCSp856NbmBQXQ8AAL8f3YAkqfOORDcwqC4vBdwzAvxv"
+        "YH10I5KkzvpXwJPRTQyihAAAafhviW5CktRJR4AfiG5iUCVcAgDYCnwkuglJUid9M7qBxSglAAD8"
+        "Jt4QKEmqXisXnispABwDfhrYG92IJKlTvhzdwGKUcg/AdGuAzbRw2UZJUnaOAD9E+pLZKiWdAejZ"
+        "QXp146HoRiRJrfc5Wjj8ocwAAPAghgBJ0vD+MLqBxSo1AIAhQJI0nAdIT5m1UskBAAwBkqTF+63o"
+        "BoZRegAAQ4AkaXCfIr1vprVKfApgLuuA+/DpAEnS/A4B59Hyx8o9A/ACzwRIkvrxLlo+/MEAMJMh"
+        "QJI0nw8Ad0Y3UQUvAczOywGSpJk+Bfwc8Fx0I1UwAMzNECBJ6vkM8A5gMrqRqhgA5mcIkCR1bviD"
+        "AaAfhgBJKlcnhz8YAPplCJCk8nR2+IMBYBCGAEkqR6eHPxgABmUIkKTu6/zwBwPAYhgCJKm7ihj+"
+        "YABYLEOAJHVPMcMfDADDMARIUncUNfzBADAsQ4AktV9xwx8MAFUwBEhSexU5/MEAUBVDgCS1T7HD"
+        "HwwAVTIESFJ7FD38wQBQNUOAJOWv+OEPBoA6GAIkKV8O/ykGgHoYAiQpPw7/aQwA9TEESFI+HP4z"
+        "GADqZQiQpHgO/1mMRDfQcd8ADkU3IUkFc/jPwQBQr98EzoluQpIK5fCfh5cA6rMa2AacFd2IRPoF"
+        "+D3gxFQBPDv155lTf541VS8BRhvtTqqew38BHuT1uQWHv+o3CTwBPA7sAr4D7AGeBvYDB6b++tiA"
+        "/94x4GxgKbB86q/PAV4OrALOBV6Gv0OUJ4d/HzwDUI+rgE9HN6HO2Q98baq2k+4x+SZxv+RGgVcB"
+        "rwZeA1wwVcuD+pHA4d83A0D1xoBvASuiG1GrTQI7gE3AV4G/A74d2lH/VgI/DlwITABr8EyBmuHw"
+        "H4ABoHo3ATdEN6FW2gP8NXAvcD/deYJkHLgYuBz4KbwxVvVw+A/IAFCtFaRv/2PRjag1HgE+C9xD"
+        "+sZfgjXAlcCbgbXBvagbHP6LYACo1m3Af4huQtl7FLgLuBN4LLiXaKtJ98y8FTg/uBe1k8Nf4S4A"
+        "TgLPW9YsdZD0ZMgaNJc1pM/oIPHby2pH3YX3lygDm4k/GKz8agtwDV4WGsQY6TPbQvz2s/Ith7+y"
+        "cAXxB4OVT50k/XJaj4a1nvRZenbNml734fBXBkZIK/5FHxBWfB0FPkxaKEfVWkX6bI8Sv52t+NqG"
+        "S9krA1cRfzBYsXUUuBlYhuq2jPRZGwSsq5ACjQA7iT8QrJg6TvpW6uBv3jLSZ3+c+P3AiqmdeBlA"
+        "ga4m/iCwYup2XO0xBytI2yJ6f7Bi6hqkAKPAbuIPAKvZ2oI39+VoPT41UGLtxrMACnAN8Tu/1Vzt"
+        "Azai3G0kbavo/cVqrjwLoEZ57b+supW0nr3aYZy0zaL3G6uZ2o1nAdQg7/wvo3aS3mandprAoF5K"
+        "eXZOjfG5/+7XB3H1vi4YI23L6P3Jqre2ITXAVf+6XfuAS1DXXIL3BnS9rkCqmXcad7e+gM/0d9ky"
+        "0jaO3s+semoLUo0miN/JrerrJHA9KsX1+G6Brpb37Kg2dxG/g1vV1j78pVGiCbwk0MW6G6kGK/Fb"
+        "Q9dqM67mV7IV+BrvrtVJfBlX33ybUv+uw2dNu+QTwE8Ae4P7UJy9pH3gE8F9qDqjpN/VUmXGgIPE"
+        "p1urmroB6VQ3EL9fWtXUQXyEVxW6lvid2hq+juOCIZrbRny7YFfqWqSKbCd+h7aGq8N4s58WNkHa"
+        "V6L3V2u42j5zw0qLsZ74ndkarp4B1s3csNIc1pH2mej91hquDPwL8CbAhb07ugENZT9wEfBgdCNq"
+        "jQdJ+8z+6EY0lF+MbiB3Z0Q3kLlx4Lt4Q0lb9e7yfiy6EbXSauDL+KhoW50Afgg4FN1IrjwDML+N"
+        "OPzbaj8Ofw3nMdI+5JmAdjoLb/qdl2cA5rcNOD+6CQ3sAOkU7o7oRtQJa4CvAEujG9HAHgV+LLqJ"
+        "XHkGYG5rcfi30RHgchz+qs4O4N+S9i21y/l4A/CcDABze2d0AxrYCeDfA1ujG1HnPEjat05EN6KB"
+        "+btcAxnBF4W0sbzep7ptJH4/twarfbiMuwZwCfE7rTVYubyvmuKywe2ry2bdktIsbid+h7X6r9tm"
+        "34xSbW4jfr+3+q/bZ9+MZfMpgNONAU/h439t8QDpUa3J6EZUlFHSGgEbohtRX44BPzj1p6Z4E+Dp"
+        "rsDh3xb7gbfh8FfzJkn7nmsEtMMYcGV0E7kxAJzurdENqC+9X8B7oxtRsfZiAG0Tf7drXmPAUeKv"
+        "V1kL1/VzbEOpadcTfzxYC9dRPLureVxJ/E5qLVx3z7UBpSB3E39cWAuXlwGm8RLAqd4c3YAWtB94"
+        "V3QT0gzvwvsB2sDf8dP4FMALRkl3/49HN6J5XQ78ZXQT0iwuA+6NbkLzOkR6GsD7NqhndaQxYBXw"
+        "MuBsYAntONPwr3H45+4jOPyVr78k7aO/HN2I5jROWujN3yNUcwZglPSBXgq8ifTmLJddVNX2AOfh"
+        "c7zK2xjwdeCc4D40t48B10U3kYNhAsAq0of486Rv+lKdLgI2RTch9WGC9Ppg5ekx4JXRTbTVStKy"
+        "iieJv6PTKqNuQ2qX24g/bqy5a9Xcm06zGQXeg8/JW83WPrw3Q+0zjm8UzblcR4T+b85bSVr3+v24"
+        "kIKa9eukO3elNjlE2neVp8ujG8hBP/cATJAWuVhacy/STFuB10c3IQ1hC7A+ugmdxpcDsfAZgCtI"
+        "z7U6/BXhl6IbkIbkPpynMeAN0U1Emy8AXALchaf8FeNPSWcApDbbStqXlZ+LohuINtclgLXAV3H4"
+        "K8YJ4EfwTX/qhhXAPwJnRTeiUzwAvDG6iUiznQEYJ13zd/gryn/D4a/u2Evap5WXdRQ+52Y7A3AX"
+        "8JamG5GmHAN+GHgyuhGpQsuA3RQ+cDJ0EQUvMDbzDMAVOPwV6w9w+Kt7niTt28rLpdENRJp+BmAU"
+        "+BauYa04R4BXYABQNy0j/Y5dEt2I/tlW4Heim5jDJPAscADYRQ2PLE5/ac9/wuGvWJ/A4a/uepK0"
+        "j/u2wHyspz2vcN5LCix/A/w16Z0GQ+mdAfDbv6JNku78/3Z0I1KNVpKeCPCNqRrWVtJ7ef6YRZ4d"
+        "6N0DcBkOf8X6DA5/dd+3Sfu6NKz1wEeB7wA3sIgbTHtnALzzX9FeB3wtugmpARcAD0U3oc7ZC1wH"
+        "3NPvP3AG6VTUYXw8RXGKX5BDxdkMbIhuQp30KeDd9PEStRHSesgOf0W6NboBqWHu86rL20kvoVq9"
+        "0N84QnrbnxTlEPC56Cakhn0OX3Ot+qwmLec/75soR0jXXqUon6TwV3KqSMdI+75Ul7OB+0jv9pnV"
+        "CLCqsXak0308ugEpiPu+6raEtM7BrHN+hPSmKinCDuCR6CakII+QjgGpTsuBzzLLvX4jwEsab0dK"
+        "Ph3dgBTMY0BNWAu8f+b/eAbwfPO9SAC8kgqWs5RabDWwM7oJFeOUtx/OfBug1JRHcPhLj+FlMDXn"
+        "o0yb+wYARflsdANSJjwW1JTzSesEAF4CUJzX4A1QEsAaYHt0EyrGDtLvXwOAQuwBfji6CSkju/GF"
+        "bGrORcAmLwEowl9ENyBlxmNCTfoF8B4AxbgvugEpMx4TatKVwIiXANS0SeAHcR10abpx4CnS21ml"
+        "JrzeMwBq2g4c/tJMh/CmWDVrwgCgpm1a+G+RiuSxoSa9zgCgpn01ugEpUx4batKrDABq2t9FNyBl"
+        "ymNDTVruTYBq0l7gpdFNSBn7Lr6hVc044RkANck1z6X5eYyoKWcZANSkr0U3IGXOY0SNMQCoSa53"
+        "Ls3PY0SNMQCoSd+IbkDKnMeIGuNNgGrKJPDiqT8lzW4UOI4rAqoBngFQU57A4S8tZJJ0rEi1MwCo"
+        "KY9HNyC1hMeKGmEAUFN2RTcgtYTHihphAFBTvhPdgNQSHitqhAFATdkb3YDUEh4raoQBQE3xl5rU"
+        "H48VNcIAoKbsj25AagmPFTXCAKCmHIhuQGoJjxU1wgCgpjwd3YDUEh4raoQrAaoJk8D3RTchtchJ"
+        "XA1QNfMMgJpwLLoBqWU8ZlQ7A4Ca4C8zaTAeM6qdAUBNOBHdgNQyHjOqnQFATXg2ugGpZTxmVDsD"
+        "gCRJBTIASJJUIAOAJEkFMgCoCWdGNyC1jMeMamcAUBPOim5AahmPGdXOAKAmjEU3ILWMx4xq51LA"
+        "aoJLAUuDcSlg1c4zAGrCKH6jkfo1hsNfDTAAqClnRzcgtYTHihphAFBTlkY3ILWEx4oaYQBQU5ZH"
+        "NyC1hMeKGmEAUFNWRDcgtYTHihphAFBT/KUm9cdjRY0wAKgpL49uQGoJjxU1wgCgpqyKbkBqCY8V"
+        "NcIAoKacG92A1BIeK2qEKwGqKZPAi6f+lDS7UeA4LgSkBngGQE0ZBV4V3YSUuVfh8FdDDABq0quj"
+        "G5Ay5zGixhgA1KTXRDcgZc5jRI0xAKhJF0Q3IGXOY0SNGQFORDehYqyNbkDKnMeIGjMCHIpuQsVY"
+        "AayMbkLK1EpcBVANGgH2Rzehovx4dANSpjw21KgR4JvRTagoF0Y3IGXKY0ONGgEeim5CRZmIbkDK"
+        "lMeGGjUCbIpuQkVZA4xHNyFlZpx0bEiNGQEexBsB1ZxR4OLoJqTMXIwrAKphI8BzwD3Rjagol0Y3"
+        "IGXGY0KN6y0EdFtoFyrNv4tuQMqMx4Qa1wsAm4AdkY2oKOfg9U6pZw3pmJAaNX0p4N8P60IlujK6"
+        "ASkTHgsKcca0vx4BHgbOD+pFZXkEeG10E1IGHsYlgBXgjBn/93pgS0QjKtIrgceim5ACrQZ2Rjeh"
+        "Ms18G+BW4GMRjahIV0U3IAXzGFCUEzPPAEB6FvXv8ZSU6rcD33+usm3HG2IV4+mZZwAAJoE340uC"
+        "VL81GDRVrrU4/BVn72wBAGAXcDlwpMFmVKZfjG5ACuK+r0i7ZrsEMN064F7g7AaaUZkOAS8FjkU3"
+        "IjVoDPguvhdDcW6c6wxAz4OkV1R6p7bqMg78bHQTUsN+Foe/Ym1aKABAGv6vBz5VczMq17uiG5Aa"
+        "5j6vSMeAv+0nAEA6TfsO4GeAvbW1pFJtAC6IbkJqyAWkfV6K8hfAZL8BoOce4BXAjcCByltSyX49"
+        "ugGpIe7rivYncPpKgIMYA64B3klaQVAaxiTwI8C3oxuRarQS+EfSeitShD2kL/KTLxriX3KStHLg"
+        "fwfuIN0r8CywBPj+IRtUeUaAFwF/Gd2IVKP/Avyb6CZUtN9iasn/Yc4AzGcMWAUsBc4k37T7u3j2"
+        "IidHSMn0yehGpBosA75F+pIkRdjD1Ld/qG8wHyMt85q7dRgAcrIE+DXgvdGNSDX4NRz+ivVLTA1/"
+        "qO8MQFtMAF+JbkKnOAb8MJ4FULcsA3aTzo5KET4DvHX6/zDoUwBd8yBwIroJnWKMdI1K6pLfwuGv"
+        "OHuYZenp0s8AAGzGZ3Jzc4L0RIBrTqgLVpDu/D8ruhEV6RjwRuBrM/8fpZ8BALg/ugGd5izg5ugm"
+        "pIrcjMNfMU4AP80swx8MAOA9ALm6Gm/QVPutJ+3LUtNOkK75f3Guv8FLAOm63FN4fS5HW0nvoZDa"
+        "agsGWTXvAGnp/k3z/U2eAUjXR+6PbkKz8tuT2syzWIqwFXgtCwx/MAD03BvdgOb0fnxtqtpnnLTv"
+        "Sk05RnrPxIX0uaS6ASD5i+gGNKflwIeim5AG9CHSvivVbRL4U+BHgQ8wbaGfhXgPwAt2Aqujm9Cc"
+        "LqKPU1pSBlxgTE14GvifwC3ArsX8C3Jdoz/CFzEA5OxPgPNIp7mkXI0x9apVqWKTpCX2vwTcR5pZ"
+        "fX/bn41nAF5wGd4LkLuPAL8S3YQ0jw8DvxzdhOb1AeD/RDfRh+dIL0h7GniC9C2/0i9ABoAXjJIe"
+        "B/SGs7xdjq8MVp78EpG/Q8APMuQ3567wJsAXTAKfj25CC7qN9GIVKSfLSPum8vZ5HP7/zABwqs9G"
+        "N6AFLQdujW5CmuFWvOu/DfwdrzmNAUeB563s6/o5tqHUtOuJPx6shesorviqBdxN/I5qLVwnSY9b"
+        "SZEmSPti9PFgLVx3zbENi+UlgNO5k7TDKPBp0qtWpQgrSPugj1O3g7/bZ/ApgNP5cqB2eQD4Cbyx"
+        "R80aBb4MbIhuRH05Rrr733VEpvEMwOmOAZ+LbkJ92wB8PLoJFefjOPzb5HM4/E/zougGMnUc30LX"
+        "JmuB/4dLBasZNwC/Gt2EBvJrLHK5XJVnFNhH/E0r1mC1cbaNKVVoI/H7uTVY7cOz3bPyQ5ndJHBn"
+        "dBMa2P/AJwNUnwnSPqZ2+SRpWV2pb+uIT67W4HUYWD/L9pSGsY60b0Xv39bgtXaW7SktaBvxO681"
+        "eD0DrJlle0qLsYa0T0Xv19bg9fAs21NTvAQwP5ecbaelpNdl+npnDWs1aV9aGt2IFsUnhObhOgDz"
+        "Gwe+i2sCtNVe0hoBj0U3olZaTXrW38Wm2ukY8FLSGwA1C88AzO8QrgnQZiuAr+DlAA1uDWnfcfi3"
+        "1504/DWkCeKvY1nD1TOkm7ikfqzDa/5dKG8GViW2E78zW8PVYXxEUAubwLv9u1DbZm5Ync5LAP35"
+        "w+gGNLQlwF/hYkGa20bSPrIkuhENzRu4VZkx4CDxqdaqpm5AOtUNxO+XVjX1DN643RffBdCfk8DZ"
+        "wBuiG1El3gScA3wBVwgr3ShpdT/X9u+OjwL3RjehbllFCgLR6daqrjbjXd4lW0HaB6L3Q6u6Ogms"
+        "RH3xHoD+7QI+H92EKrUBeAhvDizRBGnb+0rfbrkH+HZ0E+omHwnsZp0ErkeluB7P5nW1fPRPtdpC"
+        "/E5u1VNfAJahrlpG2sbR+5lVT21GqtkVxO/oVn21D7gEdc0lpG0bvX9Z9dUVSA3wLYHdrw/io0Rd"
+        "MEbaltH7k1VvufCPGrOR+B3eqr924g2CbTZB2obR+5FVf12F1JBRYDfxO73VTN1KejOk2mGctM2i"
+        "9xurmdqJT7SpYdcQv+NbzdU+XEa4DTbitf7S6hqkhnkWoMzago8a5Wg9PqFTYu0m/S6WGnc18QeA"
+        "FVO34yqCOVhB2hbR+4MVU1cjBRnBm4xKruOkO8xdO6B5y0if/XHi9wMrprz2r3BXEX8gWLF1FLgJ"
+        "bxRswjjpsz5K/Ha3Yss7/xVuBNcFsFIdJn0r9WUk1VtJ+mwPE7+drfjaht/+lYFRXF7UOrVOAnfg"
+        "zYJVWEf6LF2735pervqncKPAXcQfDFa+tYX0mJKrCvZvjPSZeVe/NVvdhxTM4W8NUgeBW4A1aC5r"
+        "SJ/RQeK3l5VnnQTWokqcEd1AS42STku+JboRtdKjpPB4J/BYcC/RVpNu5norcH5wL8rfJ4BfiG6i"
+        "KwwAg3P4q0qPAJ8F7gF2BPfSlDXAlcCb8duc+ncMeAWwN7qRrjAADMbhrzrtAf4auBe4HzgU2UyF"
+        "xoGLgcuBnwLOiWxGrfV7wI3RTXSJAaB/Dn81aZJ0RmAT8FXgAdrzzWcFsAG4kPRGvjW4XKuGs5f0"
+        "7f9YdCNdYgDoj8NfOdhLumTwNWA78A3gm6SwEGEUeBXwauA1wAWkU/oukayqvY10z4wqZABYmMNf"
+        "OZsEngAeB3YB3yFdSnga2A8cmPrrQb85jQFnA0uB5VN/fQ7wcmAVcC7wMvxmr8VGSMsAAAtfSURB"
+        "VPp9Ebg0uokuMgDMz+GvrpgEvgecmCqAZ6f+PHPqz7Om6iU42JWHE8CP4dMytfAgn5vDX10yiu8q"
+        "UPt8AId/bTwDMDuHvyTF2gOchzf+1caXKZzO4S9J8cZJN5iqJp4BOJXDX5LycYh0A+CD0Y10kQHg"
+        "BQ5/ScqPIaAmBoDE4S9J+TIE1MAA4PCXpDYwBFSs9ADg8Jek9jAEVKjkAODwl6T2MQRUpNQA4PCX"
+        "pPYyBFSgxADg8Jek9jMEDKm0AODwl6TuMAQMoaQA4PCXpO4xBCxSKQHA4S9J3WUIWIQSAoDDX5K6"
+        "zxAwoK4HAIe/JJXDEDCALgcAh78klccQ0KeuBgCHvySVyxDQhy4GAIe/JMkQsICuBQCHvySpxxAw"
+        "j5HoBio0AtyOw1+SlIwD9wHrohvJUZcCwO8Db49uQpKUFUPAHLpyCeAq4NPRTUiSsuXlgBm6EABW"
+        "AF8npTxJkuZiCJimC5cAPojDX5K0MC8HTNP2MwATwFeim5AktYpnAmh/ANgMbIhuQpLUOsWHgDYH"
+        "gPXAlugmJEmtVXQIaPM9AO+ObkCS1GpF3xPQ1jMAY8A+YEl0I5Kk1jsE/ATwSHQjTWrrGYA34fCX"
+        "JFVjHLgXWBndSJPaGgAuim5AktQpy4E/J51hLkJbA8BEdAOSpM5ZS1pWvghtvQfgMF4CkCRVbxK4"
+        "ENga3Ujd2ngGYBkOf0lSPUaBj9LO+TiQNv6AK6IbkCR12noKeLV8GwOA3/4lSXX7zegG6tbGAHBm"
+        "dAOSpM5bS8dvOG9jAHg2ugFJUhF+LrqBOrUxAByJbkCSVIS30M452Zc2/mB7ohuQJBVhKelSQCe1"
+        "MQAcAg5ENyFJKsIbohuoSxsDAMA3ohuQJBXhddEN1KWtAeD+6AYkSUU4N7qBurQ1ANwX3YAkqQir"
+        "ohuoS1vfBTACfJf09iZJkupyBPiB6Cbq0NYzAM8Bd0Y3IUnqvM6+HritZwAAVgNfJ724QZKkOpwA"
+        "XhzdRB3aegYA4DHg89FNSJI67XvRDdSlzQEA4EbSu5slSarD/ugG6tL2ALAD+Fh0E5Kkzno8uoG6"
+        "tD0AAPwOLg8sSarHY9EN1KULAeAQ8Da8FCBJqt7m6Abq0oUAALAV+JXoJiRJnTIJPBDdRF1eFN1A"
+        "hf6e9EjgRHQjkqRO+BLw8egm6tKlAADwZdKiDRdGNyJJar3/Cjwc3URduhYAAL6IIUCSNJxDwH8m"
+        "LQTUSV0MAGAIkCQN5yN0fLG5rgYAMARIkhbnCPAO4Gh0I3XqcgAAQ4AkaXA3UMBr57seAMAQIEnq"
+        "36PANaS3znZaCQEADAGSpIUdAy6nw+v/T1dKAABDgCRpfteQZkURSgoAYAiQJM3uRuAPoptoUmkB"
+        "AAwBTTkA/F9gPLoRSVrA+4Dfjm6iaSUGADAE1O0A8JPATcDzwHrSMs2SlJv3Ae+NbiJCqQEADAF1"
+        "6Q3/R4CTpOWZ7wJ+FFgV2JckzVTs8IeyAwAYAqo2ffhP9wxwO/APpM/6+xvuS5JmKnr4gwEADAFV"
+        "mWv4T/d14I9IlwXWAd/XQF+SNFPxwx8MAD2GgOH0M/x7epcFPgH8S2ANMFJbZ5J0Kof/FAPACwwB"
+        "izPI8J/un4A/B/4XKQSsrLgvSZrJ4T+NAeBUhoDBLHb4T7cfuA14CHg1sLyCvqRcPUra118R3UiB"
+        "HP7qy82k69TW3PUMsHaxH/A8rgK2Z/DzWVaVtZ20b4+QHom9K4OeSqqbkQZgCJi76hr+PSPA1cDu"
+        "DH5WyxqmdpP25Zn3uRgCmiuHvxbFEHB61T38pxslrc29s+afybKqrt2kfXe+BbAMAfWXw19DMQS8"
+        "UE0O/+lGSKdPHx6wX8tqurYBG+n/yRZDQH3l8FclDAFxw3+my4DNxH8eljW9tgBXsDiGgOrL4a9K"
+        "lRwCchn+060H7iCtKxD9+Vhl1kngbmCC4RkCqiuHv2pRYgjIcfhPt5K0XZ4h/rOyyqiDwPup/t0W"
+        "hoDhy+GvWpUUAnIf/tONAdeSrsFGf25WN2sncD1pX6uLIWDx5fBXI0oIAW0a/jOtJy0udJT4z9Fq"
+        "dx0nvciqitP8/TIEDF4OfzWqyyGgzcN/unHSNzbPCliD1jbSvjNODENA/+XwV4guhoCuDP+Z1gIf"
+        "BPYR/xlbedZTwIdJZ5ByYAhYuBz+CtWlENDV4T/dCHAJ6bTuYeI/cyu2jpKeJrmM+RftiWIImLsc"
+        "/spCF0JACcN/pjHSAkN3YBgoqY6SHt/bSL039FXFEHB6OfyVlTaHgBKH/0xjpIVcbsNHCrtYB0ln"
+        "fa6kHUN/JkPAC+XwV5baGAIc/qcbpZ3b0jq1dgK3kC755Hh6f1CGAIe/MtemweHwn9u1xG8fa7A6"
+        "CnyBdPd+1Yv05KLkEODwVyu0IQQ4/OdnAMi/jpPeC3ET3fmW348SQ4DDX62Scwg4CKyr70fvBANA"
+        "nrWFNPAnaOe1/KqUFAIc/mqlHEOAw78/BoA867L5NlphSggBDn+1Wk4hwOHfPwNAnmUAOFWXQ4DD"
+        "X51wA/EH0z685j8IA0CeZQA4XRdDgMNfnbKRuJfTbCG9Nlf9MwDkWQaA2XUpBDj81UlraPbFNCdJ"
+        "a5uXcnd0lQwAeZYBYG5dCAEOf3XaKPAe6l96dgv5vNSkjQwAeZYBYH5tDgEOfxVjGWmHP0i1B9HD"
+        "pPXtR5r7UTrJAJBnGQAW1sYQ4PBXkcaAa4D7SKfsF3PwPAXcSno2WtUwAORZBoD+tCkEOPyDeG04"
+        "3jHgj6dqHNgAvBFYDZwLLCeFhDOn/t7vAbuAx4GHgAeAR4Hnmm5cUrYmgXdM/fVbIhtZwPuA90Y3"
+        "IUnTeQYgz/IMwGByPhPgN/9gXieWpO7qnQn4THQjM/jNPwMGAEnqtl4I+FR0I1N+D4d/FgwAktR9"
+        "k8DPkb55R/ZwHXBjYA+axgAgSWV4jvTN+23AoYb/23uAnwQ+1vB/V/MwAEhSWe4EzqOZSwKTwEeA"
+        "1wKbGvjvaQAGAEkqz17SfQEXkR4lrtokcA9p8P8KzZ9xUB8MAJJUrk2kdUdeD3wCODLkv28/6Rv/"
+        "ecDPADuG/PepRi4EJEnaOlXXAW8inRmYAF4FLJnnnzsAfAO4n7Sa6QO4KFlrGAAkST3HgM9PVc8y"
+        "YAUpCJxJOktwDHgCT+23mgFAkjSfJ6dKHeM9AJIkFcgAIElSgQwAkiQVyAAgSVKBDACSJBXIACBJ"
+        "UoEMAJIkFcgAIElSgQwAkiQVyAAgSVKBDACSJBXIACBJUoEMAJIkFcgAIElSgQwAkiQVyAAgSVKB"
+        "DACSJBXIACBJUoEMAJLaZDK6AakrDADS7I5EN6BZPRvdgNQVBgBpdoeiG9CsDkQ3IHWFAUCa3Z7o"
+        "BjSrXdENSF1hAJBmtwuvN+dmL3AsugmpKwwA0uyOATuim9AptkY3IHWJAUCa25eiG9Ap7otuQOoS"
+        "A4A0NwdOXr4Y3YDUJWdENyBlbBT4DrA8uhGxFXh9dBNSl3gGQJrbJPDJ6CYEwO3RDUhd4xkAaX6r"
+        "gJ2kswGKcQB4OT4BIFXKMwDS/HYBfxrdROE+hMNfqpxnAKSFrQT+ARiLbqRAe4FXYACQKvei6Aak"
+        "FjhMWoP+p6IbKdDPA9ujm5AklWsU2Aw8bzVWd/S1ZSRJqtkK4CniB2MJtRMvuUiSMrIeOEr8gOxy"
+        "PQWs7neDSJLUlCuA48QPyi7WYWBd/5tCkqRmXUIaVtEDs0u1D1g7yEaQJCnCWmA38YOzC/UwadEl"
+        "SZJaYRy4i/gB2ua6BVdalCS11BV4NmDQ2ka6qVKSpFYbA67FINDP4L8KlyKXJHXMKHAZaSEbHxlM"
+        "dRC4FZgY4nOVVCHfBSDVaxR4A2nw/RhwLrCcdO/AWYF91eUE6e19T5BepPQQcD/wNeC5uLYkzfT/"
+        "AUdGVGNr3iWxAAAAAElFTkSuQmCC"
+    ),
+    'speedmeter.png': (
+        "iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAYAAAD0eNT6AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAg"
+        "AElEQVR4nO3dT4hl130n8G+V5BbMoiLJ3YpbNbShusYMLbBhaOMYvBhkI0sLZ8gsWsokQyCQMUgE"
+        "usliFlkYM3iRxdANgwPBYAhMoj8bk3hhS1haGRxjzcJmuhfBakYC2ZbV3RVrl0pUbxa3Xnd1qf68"
+        "V+++e8699/OBi1pSd9VP3ao6v/s7v/M7CQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA"
+        "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA"
+        "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA"
+        "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA"
+        "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAi1opHQDQirUkp/f8/aN7frxxwM9/fM+Pf7Hnxzf3"
+        "/PhOklu7P/5goeiA6kgAoD7TxfzR3Fu8H0/yySSfSPLYnr+ePugDdOBWkl/v/vhXu3/d+/c/SpNM"
+        "3Mn9SQVQCQkAdG8tyafSLO7Thf3TaRb1CwXjWrYbSX6WJkF4O03l4WaSf4wKA3ROAgDLMV3kv5B7"
+        "b+6fzrAX+EXdSJMc/CwSBFg6CQAsbiPJxSSfT7PQfynlSvNDdSvJD5L8OMkPIymAhUkAYHZ73+o/"
+        "F2/0pUkKYAESADjc3jf7p2Kx7wNJAcxIAgD3XMy9t3tl/OHYnxS8WTYcqIMEgDGbLvhfSfJk4Vjo"
+        "1ktJvpMmGXBMkVGSADAm05L+7yV5rnAs1ONGkteS/E1UBxgRCQBDdzHJH8QePrN7Kc12wd9HdYAB"
+        "kwAwNN7yaZPqAIMlAWAINpL8bpI/ibd8luuNJN+N6gADIAGgryz6lHYryTciGQBYurUkl5NcTzLx"
+        "eCp6Xk9yKc3/owC0YLrov57y3+Q9nlmeF9P0oQBwApdi0ff0+3k/ydXcu9IZgENspPmGWfobt8fT"
+        "9nM9TSXLFgHV0ARIDS4l+WpM42McplMIXykdCEAJ3vY9nuZrQL8AMAqXoovf49n/XE/ztQEwKNNO"
+        "/tLfZD2e2p/303ytAPSaMr/Hc/JH0yDQOxfTnIUu/Q3U4xnC4yghUD37+x7P8p4XIxEAKnM5zd5l"
+        "6W+QHs8Yntfj5ABQmIXf4yn3ODnAQgwC4iQuJflmktOlAwHu3kr47SQfFI6FHpEAMA8LP9TtSpJr"
+        "pYOgH1ZLB0AvXEpT6n85Fn+o2dXYGmBGEgCOMu3qt/BDf1xI8zWrWZAj2QLgIBeT/HWabyRAv72U"
+        "5M+T3CwdCHVRAWCvjTRnjX8Siz8MxXNJ3kqzPWCyIHepAJA03xS+HjPIYQw0CpIkeaB0ABR3Kcn/"
+        "SfI7pQPhSLeS/L8kZwrHcZwbaV4s/k3pQDjU02m+7m+l6fFhpFQAxss+f31uJPlZkl8leTvJL5K8"
+        "mXt7txfTbM/U7LNpYk6aLaVHd//6eJLPJXksyaejqbQWbyT577n3Z8aISADGZyPN0JDnSgcyQjfS"
+        "LO4/y70F/maSf8xsA1z6lgAcZy3Jp3J/gvClSA5K0Cg4QhKAcbka+/xduZHktTQL/Q/TzhvW0BKA"
+        "w0wTgy8k+WSSp6JS1RX9ASMiARiHi0m+F29Wy3IryQ+S/DjNYj/rG/28xpIAHGYjze/B59NsIzy5"
+        "pM8zdreSPBPbAtBra2ne+ktfWjKk5/00RyUvp1mMujxWdbHF/45lPV0PntlI82fxYlxM1fbj2CD0"
+        "1KWU/wYyhOf9NN8IL6X8N0MJwPH2JgSlfy+G8Lyf8n+mwIymw3xKf+Po8/N6mkVkY87f+2WTAMxP"
+        "QtDOoxoAlbuc8t8o+vjU9JZ/FAnA4qYJwfWU/73q26MaABXaSPPWWvobRJ+eWt/yjyIBaNdamv8H"
+        "fO3M96gGQCW89c/29OUt/ygSgOVZS/P/hq2C2b+e+vpnDb3nrX+258UM5xuVBKAbkoH5vr76mlBD"
+        "L+nwP/p5Pf1+0z+MBKCMi5EMHPW8n+brDVgi5/qP/ibUtz39eUkAyppWBjQQHvyoBsCSXIxBJwc9"
+        "VzPsRWcvCUA9NiIZP+hRCYCWafS7/3kx4/xGIwGo06Xoxxnrnz0sjUa/e8+0xD/mEqMEoG7TGQNj"
+        "q9Rdz7C33qBzGv3ufXMZ49v+QSQA/XEx40je7ftDy+wtDuv4XlskAP0z5NHcrhaHFq1lHG8NRz1X"
+        "o5x4GAlAfw2taVBVDlo09i7/se/vz0IC0H/T8cN9/Vo3ARBaNtb9fo1985EADEcfZwq8Hl+r0Koh"
+        "lQVnfTT2nYwEYJj6cIzw6tL+62GENtKv7L+N53osEIuQAAzbxdT5PaHKZr/bZzcubK1vvr21vvl8"
+        "6VhgHn34Rt7mY1Z4O/rw/40EYHGXUk+PQJV/nnfWzz+99W//3eTus76pQnECq6UDGKHLSX5SOogO"
+        "XUlyJskrpQOBnnglzdfMlSS3CsVwK8n5JG8W+vyH2lrffH5lZfV79/3DlZXLkoD5SQC6dTXj2Uu7"
+        "luS3dv8KzO9amkX4Ssef943dz3uz4897rK31zVezsvLNA/9lkwS82nFIvSYB6MZammEgVe6ltWzv"
+        "N60PCscCffdBuk2mryX5Yir72n3vzLmHt9Y3387KylNH/sSVlae21jdffe/MuYc7Cq3XJADLt5bk"
+        "R0meKx3Ikr2Uewt/dW8O0HMfpPnaOp/lJQLPpvtqw7Fun924cOqhh7aysnJupl+wsvLUqVOnfioJ"
+        "ON5K6QAGbiPJj5OcLh3IEt1I8kepcK9wgDaSfLd0EMf4SiSAXdhI8q0kT7b08T6bCr+G76yff/oj"
+        "+/2zmkze2d7e/sxvv//OP7Uc1mBIAJbnYobd7HcryQvR3AclXUry8gK//kYqTdq21jevZmXl5Num"
+        "k8m1R979eXUVjZpIAJZj0S/K2l1LhaVCGKm1JF/P/D1GLyX5airc7z916tTLx+73H2Uyee2Rd3/+"
+        "5RbDGiQJQPsuZ7id/tW+LQC5mOSvk1yY4edWmcTfPrtxYXV19Xsz7/cfROl/ZhKAdl3NcDv9r8SR"
+        "PuiD415Cnk2FW3e3z25cWH3ggeuLfpydDz984uO/vHmjjZiGzimA9gz1mN/0TLDFH/phemzwpX3/"
+        "/FaaZr/qFv+t9c3n21j8J5OdZyz+s1MBaMeLGeYxvyrfFICZXUzyvSS/TvL5VLbfn7TQ7Del6W9u"
+        "EoDFvZ72juLUosrmIGA4Wmn2m9L0dyIPlg6gx9aSfCfDWvwd7QOWrpVmv6mm6e/ZFsIaHQnAyUyn"
+        "+83SbdsX15J8Ld76gSVaaLjPAXZ2dp7R8X8yEoD5DW3xv5XkmVQ4BQwYlq31zecPvcznBDT9LcYp"
+        "gPkMbfGfzu+3+ANLtdvs19rin8nk2qPvvvX91j7eCGkCnN3Q5vo71w8sXavNflOa/lphC2A2axnO"
+        "4q/kD3Si1Wa/KU1/rbEFcLxp2X8Ii7+SP9CJO+vnn1594IHrrS7+0fTXJgnA0Ya0538lye9Hlz+w"
+        "ZFvrm8+32ek/pemvXbYADjc959/3xV/JH+jM1vrmq63u909p+mudJsDDDWHCn4l+QCd2m/1+2nbJ"
+        "P4mmvyVRATjYi+n/4q/LH+hEWzf5HUjT39LoAfiovl/sM73xy+IPLF1bN/kdRtPf8kgA7nc1/V78"
+        "E/v9QEdaH+6zj6a/5dIDcM/VJItfSVnerSSfS3KzdCDAMC1luM9+rvddOglA43KaBGAoJAHAUixl"
+        "uM9+mv46YQsguZRhLf5JM7Tox2nGFwO0YlnDfe6j6a8zY68AXEzyk9JBLJFKANCKtm/yO8zOhx8+"
+        "Yd+/G2OuAGxk2It/ohIAtGDZzX5Tmv66NdY5AGtJvls6iI5MkwCVAGAunTT7TZn017mxVgCGMOJ3"
+        "HioBwFxun924sDvZr4vF/7XCHf9D6wObyRgTgCFM+TsJSQAwk06a/abKN/29mOGdBJvJ2BKAy+n/"
+        "oJ9FSAKAIy3rJr/DFJ70t3dNuJzmVNhojOkUwKUkL5cOohJOBwD32d3v/1pWVjobiDaZ7DxTcN//"
+        "sFNgn81IpqmOJQEY+nG/k5AEAEmWfJPfYSaTFx559+d/2dnnu99GkrcO+Xe3kpzPCG5RHUMCsJbm"
+        "D/p06UAqJAmAkVvqTX6HKTvpby3Jj3J0I/gbSb7YTTjljKEH4Dux+B9GTwCM2N1mvy6Vb/r7qxx/"
+        "CuzJjKApcOgJwOWMs+N/HpIAGKGt9c2rXTb7TVXU9DfLzx10U+CQtwA0/c3HdgCMQKfDffaptOnv"
+        "OOcz0O+LQ00Ajmrw4HCSABiwIs1+U/U2/R3nRpLPZ4BNgUPcAhjTmN+22Q6Agbqzfv7pUw89tFVo"
+        "8X+t4OK/6JpwIU3fwOAMMQGYpcGDw0kCYGC6Hu5zn340/R3nuTQ9AYMytC2AUY5zXBLbATAAuzf5"
+        "FVu8Cl/v2/aaMKghQUNKAAz7aZ8kAHqqZLPfVE+b/o4zmKbAoWwBrCUpU94aNtsB0EOd3uR3mMnk"
+        "hYKL/0aW90L4rSV93M4NJQH4qxj2syySAOiRTm/yO0y/m/6OM5ghQUNIAC5l3Df8dUESAD1QtNlv"
+        "ahhNf8cZxJCgvvcAOO/fLT0BUKnSzX5TA2v6O06v+wEeLB3Agpz379bpNI01vf0fHoamhma/qclk"
+        "55mCi//FdF+a/26SJzr+nK15oHQAC7ic5L+WDmJknk3ySukggMbtsxsXHnzwwR9mZeU/lI5lt+nv"
+        "xUKffSPJ/y3wec8k+U2SfyjwuRfW1y0AR/66Z/GHitxZP/908f3+qfqv9122Xm4F9LEJsC9H/m6V"
+        "DqBFV2Lxh2pU0ew3NY6mv+P08mhgHxOAvhz5eybN1Ki+ezbJtdJBAI2t9c1Xs7LyzdJxTPXoet9l"
+        "ejI9HBXcty2AvlzxeyX3Fs0+b1fs/e8ACip6k98hBjrpbxG92groUwKwlqbZonbX0iyce9X4P+px"
+        "7PlDJW6f3biw+sAD10vHcZ/+Xu+7TG8k+WLpIGbVpy2Ar5cOYAY38tHFP2kujzjfcSyLsOcPldha"
+        "33y+wsV/yJP+FvFkejQgqC8VgL68QR9X/unDf4c3f6hELcN97tM0/X2m4L7/1dS/3/5bST4oHcRx"
+        "+pAArKUp9dTe+DfrNZG1lq4Se/5QhZqG++xXeNJfUvf30KlebAX0YQvg66l/8b+S2e+Ivpk6Twfo"
+        "9ocKVHGT3yEKT/qbupnm+1XNerEVUHsFoA8l85eS/P4Jfl1NWaw3f6hAVcN99ivb9HcQWwELqj0B"
+        "uJ7yAx6OcivNvv9J/4BrSHDs+UMFttY3n6/pfP99yk76O0rta8RJXxA7UfMWwOXU/QebNDfjLZLd"
+        "lT4doNsfKrDb7Ffr4l960t9RvlI6gGM8l4q3AmqtANRUHj9Mm2/OJSoB3vyhsJqb/aa2//mfHynY"
+        "8T+L2gfELVopXppaKwC1z1W+lnYXz64rAd78obCam/2mJpOiY35n9Urq7mE6nWaEfXVqrADUns0t"
+        "83hHF5UAb/5QWNXNflP1Nf0dpYYbAY8z61HxztSWANR+5r+LUs4ytz90+0NhVTf7TdXb9HeU2reO"
+        "q9sKqG0L4I9T7+KfNDf8LfsPb1lzApzzh8Kqbvabqrvp7yi1zwc4ncpG2tdUAag9e+v67bnN3w9v"
+        "/lBQH5r9pnrQ9HecF1PHFcGHqWY2QE0VgG+UDuAIN9L9AtpWJcCbPxR0++zGhVMPPbTVh8W/J01/"
+        "x/lqmnJ7raqpAtRSAahhIM5RSjZvLFIJ8OYPBfWi2W+qX01/x6m9onzcxXGdqKUC8NelAzjCtZTt"
+        "3DxpJcCbPxS0tb55tUeL/7UBLf5J/f0AVVS8a6gA1Hzs71aSM6WD2DVPRuvNHwraWt98tQ8l/yQ1"
+        "XO+7TDX3AxQ/Flg6Aaj92F/xP6B9Ztkqcc4fCtlt9vtpVlbOlY5lVgNo+jtKzVsBxa8MLr0FUPOx"
+        "v9Kl/4McNzHQ4g+F7Gn2683iP5Cmv6PcTFMRrdGTaV7qiilZAag5M6tuYMM+B1UCLP5QSC+G++w3"
+        "rKa/49R6a+CNJE+U+uQlKwB/WvBzH6eLgT+L2F8JsPhDIb0Y7rPf8Jr+jvNHpQM4xIUUvC2wVAWg"
+        "5rf/a6m3ZLTfxTS/lxZ/6FifhvvcZzJ555F3f/7J0mEUcDXNNfO1KdZsXioBqLUzs/bSP1CB22c3"
+        "Lqyurn6vT/v9UwNv+jtKzU3nRU5uldgC2Eidi3+SvBCLP3CEO+vnn1594IHrfVz8R9D0d5QP0nyP"
+        "r9HVNAlKp0okAFUMQDjAS1FKB46wtb75fG+G++w3mbzw6Ltvfb90GIW9kub4XY3+uOtP2PUWQM17"
+        "/9Vc0ADUZ7fZr8Y95OM1TX996W1aNuvQrq4rALW+/T8biz9wgPfOnHt4d7JfXxf/dyz+96l5NkCn"
+        "FwV1WQGo9cKfl5L8fukggPr0udlvasRNf8epdTZAZxcFdVkB+IsOP9c8/rx0AEB9+tzsNzXypr/j"
+        "1DoboLNKeVcJwMU0Yw9rcy0VXMkI1KXXzX5Tmv6O82bqvDTtuXQ0IrirLYDXU2cCoPEPuE+vbvI7"
+        "jKa/Wa0l+U3pIA7QyUVBXSQAte79uzIXuKuPN/kdaLyT/k6q1ivpl94L0MUWwJ918DnmdSvJt0sH"
+        "AdShjzf5HWZ7e/szpWPomVfSXMpTm6Xfl7PsBKDWqX/fiNI/kD3NfgOg6e/EamwIvJwlTwdcdgJQ"
+        "441/t6L0D6QZ7tP7Zr8pTX+LeDN1Tghc6nTAZfYA1Npc4epcGLne3uR3GE1/baixX22pNwUuswLQ"
+        "+VzjGdyIxR9G7fbZjQu7zX5DWfxN+mtHjVWA02maFJdimRWA91PftYufTfOHDIzQnfXzTw+m5L/L"
+        "pL9W1VgFWNqRwGVVAC6lvsX/jVj8YbQGMdxnH01/rauxCvBkmob61j2wjA+apsy+tH2LE7qU5Bel"
+        "gwC6t3uT3/8oHUermqa/F0uHMUA3kvy30kHsM0nyatsfdBlbADWWUFz4AyM0uGa/KU1/y/Zi6jvC"
+        "3vrk2mUkADWO/e3sdiWgDkO4ye9AJv11YSPJW6WD2Kf16bVt9wBspL7F34U/MDJDuMnvMCb9deJm"
+        "mspxTVq/ubbtBKDGwT9fKx0A0J0hNvtN7Xz44ROa/jpT21XxrR8JbDsB+MOWP96irsTIXxiF986c"
+        "e3i32e+bpWNZisnkhY//8maNM+uHqsYqwFfb/GBt9gDUeKOS635hBAbb7Del6a+UGnsBWutpa7MC"
+        "8Hstfqw2XIvFHwZvcJP99jPpr6Sbqe/umNa22tuqAAw6SwLqNMTJfvuZ9FdcjetbK9XttioAv9vS"
+        "x2nLG7H4w6AN6ia/Q2j6q0KNVYBW7tppqwJQ29x/N/7BQA1+v39qMnnhkXd//pelwyBJfVWAVm4J"
+        "bKMCcDF1Lf63YvGHQdpd/Ie73z/VNP1Z/OtxM3XdEdDKkcA2EoA/a+FjtOkbpQMA2nf77MaFUw89"
+        "tDXE4T73mUxe0/RXpb8qHcA+Cx8JXHQLYC3JbxYNomWO/sHAbK1vPj/Y8/37aPqr2qR0APsstN4t"
+        "WgFopRGhRY7+wcAMerjPPpr+qjeoZsBFKwDXk1xY8GO0ydE/GIjRNPtNafrrg9qaAd9I8sWT/uJF"
+        "KgAbqWvxd/QPBmLww3320/TXF7U1Az6ZZi0+kUUSgNrO/tfWoAGcwJBv8juQSX99U9tac+K1eJEt"
+        "gJrK/62ciQTKGlOz35Smv16qafbNjSRPnOQXnrQCUFv539E/6LkxNftNafrrrZrWnAs54TbASROA"
+        "2sr/3y4dAHAyu9f4vpqVlculY+mU6337rLY150QXBJ00AfiTE/66ZXD0D3pqdM1+U5r++u6DJC+V"
+        "DmKPPzzJLzpJD0BtxyAc/YMeGsNNfgdqJv19uXQYLOxikp+UDmKPzyZ5c55fcJIKQE3lf0f/oIe2"
+        "1jefH+Xin2R7e/vZ0jHQijfTNODV4g/m/QUnSQD+/AS/ZllqO44BHGN3v39UzX5Tmv4G51ulA9hj"
+        "7m2AebcAait5mPsPPbHnJr9xnO/fz6S/IartPpy5tsTnrQDMXWJYojdi8YdeGM1NfofR9DdUtTUD"
+        "zrVFP28CUFOnrvI/9MDdyX5j5XrfofufpQPY4yvz/OR5tgBqK3Uo/0Pldof7jOt8/z4m/Y1CTdcE"
+        "z7w2zlMBePpksSyF8j9UbLTDffbR9DcaNW0DzLxWz5MA/N4JAlkW5X+o1GiH++xn0t+YfKd0AHvM"
+        "vFbPswXQyxIH0J3bZzcujHq/f6pp+rPvPx61bZHPtLbPWgG4uEAgbVP+hwptrW8+b/GPpr9xqu00"
+        "wExr9qwJwBcWCKRt3y0dAHC/Md7kd6DJ5B2T/karpm2AmY7sz7oFcD31XP+r/A+V2B3u8/Lo9/t3"
+        "7Xz44RP2/Uerpm2AW0nOHPeTZqkArKWexV/5Hyqh2W8fTX9j90GaNaoGp9Os3UeaJQGo6fif8j9U"
+        "4O5wn7FO9tvPpD8aNa1Rx67dsyQANR3/+/vSAcDYjfkmvwNp+uOemtaozx/3E2bpAajl+N+NJE+U"
+        "DgLGzGS/fZqmv88Y9sMetfTMHdsHcFwFYKO9WBZW07WLMCom+x1sZ2fnGYs/+9SyVp3OMWv4cQlA"
+        "Tef/ayqtwGho9juEpj8O9sPSAexx5Bp+XAJQy/7/jcxxxzHQDs1+h9D0x+HeTFN+r8GRa/hxCcCX"
+        "WgxkEbWUVGA0NPsdQtMfx/vfpQPYdeQaflQCsJZmD6EGNZVUYPB29/tN9tvPpD9m8zelA9h1ZB/A"
+        "g0f8wprO/79ZOgAYg93Jfj9V8j+Ypj9mVNOadTGHbKEfVQE49gxhR2qZrASDdvvsxoVTDz20ZfE/"
+        "2GSy84ymP+ZQy+VAh/YBHJUA1NLx+7PSAcDQucnvGJPJtUfffev7pcOgV35cOoBdnz7sXxyVANQw"
+        "yCBJflQ6ABgyN/kdQ9MfJ1NL79qFHHIvwGE9ADWd/5d1wxK4yW8Gmv44uZr6AD6VA+I5rALwheXG"
+        "MrMbcfsftM5wn9lo+mNBtfSMHLimH5YAfGWJgczjtdIBwNAY7jMbTX+0oJY17HMH/cPDEoBDmwY6"
+        "Zv8fWmS4z4w0/dGOWtawAwcCHXQb4FqS3yw3lpmdjxHA0Ao3+c2oafr7cukwGISNJG+VDmLXb2Xf"
+        "lvpBTYCf6iaWmVj8YUGa/eag6Y923UxzL0ANU3U/0gh40BZALQ2AtQxRgN7S7DcfTX8swQ9KB7Dr"
+        "I2v7QQnAgc0CBdQyRAF6SbPffDT9sSS1rGUfWdsPSgBqaQCsZYgC9I5mvzlp+mN5alnLPtIIeFAT"
+        "4KSDQGZxUGzAEXb3+7+m2W8Omv5YvirX1f0VgEOvDeyYC4BgTntu8rP4z0rTH92oZWvpvim/+xOA"
+        "WkYAuwAI5uAmv5PR9EdHahkIdN9L/v4E4PEOAzlKLcMToHp3m/2Yi6Y/OlTLmnbfGr8/AahlBLBm"
+        "HJjB1vrmVc1+J6Dpj27VcjHQfScB9jfavZ/yAwtuJTlTOAaomuE+C9D0Rxk1NALeSPLE9G/2VgDW"
+        "Un7xT+z/w5H2NPtZ/Oel6Y9yahhud2Hv3+xNAGpY/BMJABzqzvr5pzX7nZymPwr6VekAdt1tBNyb"
+        "ANRyAuDt0gFAjQz3WYymPwqrZW27u9bvTQBqOQHwi9IBQG12b/L7Zuk4ekvTH+XVMhHw7lq/9zbA"
+        "TxYI5CBuAIQ9ttY3X7Xfv4Cm6e9K6TAYvTulA9h19yTA3grAJwoEcpB/LB0A1MLivyBNf9Sjlpfb"
+        "x6Y/2FsBqOUSoA9KBwClOebXDk1/VOZWyjfc313r91YALhzwE7umQQeSWPwXp+mPCtVwyu1uAjKt"
+        "AKwVCmS/Gn5zoBhv/i3R9Eedfl06gF1rST6YVgA+VTKSPX5cOgAoyeLfAk1/1KuWNe5Tyb0tgFqu"
+        "AXYEkNHS8NcCTX/UrZY1biO5lwDUMgOgli5J6NTW+ubzFv/FafqjcrWscY8n9xKAWmYAOALI6Nw+"
+        "u3HBkJ/FafqjB2pZ4z6Z3EsAHAGEQlZXV6+WjqH3NP3RD7WscZ9I7iUANQwBkrkzOkr/LdD0R7/U"
+        "sNZ9OrmXADx2xE/siiOAjMp7Z849rPS/IE1/9E8NtwI+ltxLAEpPJkrq+E2Bzpw6derl0jH0naY/"
+        "eqiGl93Tyf2TAEur5apEWLo76+efVvpfjKY/eqqWtW5tNfVMAazlqkRYupWs2LNehKY/+quWWQCn"
+        "V1NH+R9GY3fv39v/SWn6o9/eLB3A1GqSR0sHsauWu5JhqU6dOvVfSsfQW5r+6L9bpQPY9ehq6hkD"
+        "XMtvCizbfyodQF9p+oPWbNTUBFjLgARYmt2pf8r/J6Dpj4GoZq1bTT33AMDgra6u/sfSMfSSpj9o"
+        "2+OrqeceABgD5f95afqDZfhkLVsA9v8Zi39fOoBe0fTHMFWx5q2mjnsAYBxWVs6VDqFPNP0xUL8u"
+        "HUCST6ymjnsAavjNgKV678y5h0vH0Cea/mCpHqtlCwAG72OnPvY7pWPojcnkBU1/DFgVd9/UkgBU"
+        "8ZsBVKBp+vvL0mHAwH2ilh4AWwAM3kpWahm6VS9Nf4xDFWteLRUAAE1/0KFaEgBbAAzeJJObpWOo"
+        "maY/RqSGNe+xWk4BwOBNdibvlI6hWpr+oHO1VADeLh0ALNu//uu/1nIPeF00/TE+Vax5q0lOlw4C"
+        "xsDe9gE0/UEpp2upAAAjpOmPkaqiGlhLAlDFbwYs3WTyWukQaqHpD8qqJQGAsfi70gFUQdMfFLeS"
+        "5GrpIJL8rySOSDF475059/Cphx7aKh1HUU3T35dLhwEFbST509JBrJQOAMZma33z1aysPFU6jiKa"
+        "pr/P2PeH8mwBQPdGuw2g6Q/qIQGAjm1vb/9t6RhK0PQHdZEAQMd++/13/ml0p2W1uksAAAKLSURB"
+        "VAE0/UF1JABQwM7OzpXSMXTGpD+okgQACvj4L2/eyGRyrXQcS6fjH6olAYBCtre3v146hqUy5heq"
+        "JgGAQnZ7AV4oHcdSOO4H1TMHAArbWt98Oysr50rH0aadDz98Qsc/1E0FAArb2dl5pnQMbbL4Qz9I"
+        "AKCwj//y5o3JZBhJgLP+0B8SAKjAo+++9f3e9wM46w+9ogcAKrK1vnk1KyuXS8cxr8lk5xmLP/SL"
+        "BAAq06skYDJ5Z2dH2R/6yBYAVOaRd39+pRfbAZPJte3t7c9Y/KGfVACgUnfWzz+9srL6vdJxHGgy"
+        "ecF4X+g3CQBU7L0z5x4+derUy1lZeap0LEmU/GFAbAFAxX77/Xf+aXt7+9kq7g1Q8odBUQGAnrh9"
+        "duPC6urqn3TeINgs/F831heGRQIAPdNZIjCZvLC9vf23Fn4YJgkA9NRuf8DXkvzn1u4SmEzeSfIX"
+        "Gvxg+CQAMADvnTn38MdOfex3VrLy5cyTEEwmryX5u0kmN/9l+1/+wds+jIcEAAbovTPnHn7wwQcf"
+        "3/vPVlbvJQWTnck7mvkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA"
+        "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA"
+        "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA"
+        "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA"
+        "AAAAAAAAAAAAAAAAAAAAAAAW8/8BYnLg2J2TqMEAAAAASUVORK5CYII="
+    ),
+    'trash.png': (
+        "iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAYAAAD0eNT6AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAZ"
+        "gElEQVR4nO3dvW5k15EH8JKtN/ALdDQCRgAlvcBGGymgIlnYVeQn2E0WoODY8AJ+hoUiBaRsLKTA"
+        "T6B8PgIBnKjTfQRH3ICkZ4ZDsj/YfavOqd8PuJAgCGD1V53/Pfd210cBYzuJiFVEPI+IL27+2+cR"
+        "8SyrIKb0JiJe3vz7i4j4NSLWEfE6qyB4qo+yC4A9nEbEt2GhJ99tMPghBAKAoziLiMuIuHI4Ch+X"
+        "cf1eBeAJTiLiPPKbusOxz3Ee1+9hALZ0Gs72HfMcl3H9ngbgARZ+x8zHZdgRAHiPrX5Hp8OlAYC4"
+        "vmEquyE7HBmHmwVJ5WuAZDqPiN9nFwGJLiLim+wi6EkAIMNJRLzKLgIK+Sz8hgAL+012AbRzFhZ/"
+        "uOtV+KYAC/ttdgG0chYRf84uAor6t4j4R0T8kl0IPbgEwFJc74ftuC+ARdgBYAkWf9jep3E93Oqv"
+        "2YUwNwGAY7P4w+6EAI5OAOCYziLiP7KLgEF9Gu4J4IjcA8CxnEbET9lFwAS+ioifs4tgPgIAx+B7"
+        "/nBYfieAgxMAOIbLiHiWXQRM5E1EfJJdBHNxDwCHdh4R/5JdBEzmd+F+AA7MDgCH5Lo/HJdLARyM"
+        "AMAh2fqH43IpgINxCYBDOQu/XgbH5lIAB2MHgEO5yi4AGtG7eTLTADmEs+wCoBmfOZ5MiuSpfOcf"
+        "crghkCexA8BTfZldADTls8eT2AHgqVz7hzx6OHuzA8BTnGYXAM35DLI36ZGn8L1/yOV3AdibHQD2"
+        "dRIWf8j2LK4/i7AzAYB9uQEJavBZZC8uAbAv2/9Qg8sA7EUAYF/u/oc69HJ25hIA+3DnMdTiM8nO"
+        "BAD28Ty7AOA9PpPsTABgH19kFwC8x2eSnbluxD5c/4d69HN2YgcAABoSANiVHx2Bmnw22YkAwK5W"
+        "2QUA91plF8BYBAAAaEgAYFe+bgQ1+WyyEwEAABoSAACgIQEAABoSAACgIQEAABoSAACgIQEAABr6"
+        "OLsASPImIr7OLoISfoyIZ9lFwNIEALp6GRGvs4ughJchANCQSwAA0JAAAAANCQAA0JAAAAANCQAA"
+        "0JAAAAANCQAA0JAAAAANCQAA0JAAAAANCQAA0JAAAAANCQAA0JAAAAANCQAA0JAAAAANCQAA0JAA"
+        "AAANCQAA0JAAAAANCQAA0JAAAAANCQAA0JAAAAANCQAA0JAAAAANCQAA0JAAAAANCQAA0JAAAAAN"
+        "CQAA0JAAAAANCQAA0NBH2QU84jQinkfEFxHx+c1/e5ZXDgBs7c3NP7+PiF8j4ufEWu5VLQCcRcQf"
+        "wkIPwHwuIuJPEfE6u5CIOgHgLCL+nF0EACzgIiK+yS4iOwCcRsRPyTUAQIavIvHSQOZNgGdh8Qeg"
+        "r5/i+kQ4RdYOgC1/ALiWshOQEQBOIuJVwt8FgKo+i4VvDswIAJfhLn8AeNebiPhkyT/42yX/WFxv"
+        "/aff+QgAxfwuIv4REb8s9QeX3gFw9g8AD1tsXV7yWwAnYfEHgMcs9q2AJQPAlwv+LQAY0bdL/aEl"
+        "LwHY/geAzRZZm5fcAbD4A8BmJ0v8kaUCwCIPBgAmsFrijywVAFYL/R0AYAuZswAAgA89X+KPLBUA"
+        "FnkwAMB27AAAQEMCAAA0JAAAQEMCAAA0JAAAQEMCAAA0JAAAQEMCAAA0JAAAQEMCAAA0JAAAQEMC"
+        "AAA0JAAAQEMCAAA0JAAAQEMCAAA0JAAAQEMCAAA0JAAAQEMCAAA0JAAAQEMCAAA0JAAAQEMCAAA0"
+        "JAAAQEMCAAA0JAAAQEMCAAA0JAAAQEMCAAA0JAAAQEMCAAA0JAAAQEMCAAA0JAAAQEMCAAA0JAAA"
+        "QEMCAAA0JAAAQEMCAAA0JAAAQEMCAAA0JAAAQEMCAAA0JAAAQEMCAAA0JAAAQEMCAAA0JAAAQEMC"
+        "AAA0JAAAQEMCAAA0JAAAQEMCAAA0JAAAQEMCAAA0JAAAQEMCAAA09PFCf+fXiLi4899eRMQXC/17"
+        "RMTv9y8fgEbeXa+WXqsirtfMo/toiT9SwElEvMou4hEXEfFDdhEAC/k2ap+UfRYRr7OL4HCuCh9n"
+        "R3zcANWcRX7ffexowT0AANCQAFDD3es/ADPT8wroFADeZBcAQHlt1opOAaCyz7MLAFiQnldApwDw"
+        "MrsAAMprs1Z0CgCVPcsuAGBBel4BnQLAi+wCACivzVrRKQAAADc6BYBFflrxCU6yCwBYQPVeV32t"
+        "OJhOAQAAuNEpAKyzC9hglV0AwAJW2QVssM4uYCmdAgAAcKNTAKg+2el5dgEAC6je66qvFQfTKQAA"
+        "ADcEgDoMxwA60OuK6BYA2gx5AGBnrdaIbgGgMsMxgA70uiK6BYA2Qx4A2FmrNaJbAKjMcAygA72u"
+        "iG4BoM2QBwB21mqN6BYAAIAQAKqpPiQD4Cn0uEK6BYA2U54A2FmrNaJbAFhnF7DBKrsAgCNaZRew"
+        "wTq7gCV1CwAAQPQLANWHPFQfkgHwFNV7XPU14qC6BQAAIASAagzJAGamxxXSMQC0GvYAwFbarQ0d"
+        "A0BlhmQAM9PjCukYAFoNewBgK+3Who4BoDJDMoCZ6XGFdAwArYY9ALCVdmtDxwAAAO0JAPUYlgHM"
+        "SG8rpmMAaDXsAYCttFsbOgaA6lbZBQAcwSq7AN7XMQCsswsAoJx1dgFL6xgAqqs+LANgH3pbMR0D"
+        "QKtpTwBspd3a0DEAALA8g4CKEQDq8SEB4Oi6BoB2U58AeFDLNaFrAKg89MG0LGBGlXtb5TXhaLoG"
+        "gMoMywBmpLcVIwAAQENdA0C7qU8APKjlmtA1AFRnaAYwEz2toK4BoN3QBwAe1HJN6BoAqltlFwBw"
+        "QKvsAvhQ1wCwzi4AgDLW2QVk6BoAqjM0A5iJnlZQ1wDQbugDAA9quSZ0DQAA0JoAUJOBQMBM9LSC"
+        "OgeAlsMfAHhP27WgcwCorPLQDIBd6WkFdQ4ALac/AfCetmtB5wBQmalZwEz0tII6B4CWwx8AeE/b"
+        "teDj7AJgQCdx/0+brqPp94kX5LkHnuw0Iq4KH6Zn1XIaEeex3Wt3efP/nqZUOpfb5/0ytnvuPe/1"
+        "nER+P33s8H5pSABgG2fx9NfybPGqx+d5n4cAQDnelDzmEAuQ13R3xwjmgkAuJ1uUIwBwn5PYfrt5"
+        "n+N8uYcynG0vsexzXIZGn0UAoKTsN95jh7OW5S0VCi1G7zt26NLscx1jN+2QR1udvwYI7zqJiFcL"
+        "/a1nEfFjWIwirp+DH2O574m/Cs87EPnJ87HDVvFysi4HXS7x4Ipb6sz/7iEELOeYl3YOcbTVfQeg"
+        "7RAI3vNj0t99Fr2D3nnk/UJc1mtOLdaAxrLOPpwd1lHh+mTH+z08733os5RUeWvKG/P4Kn0TpJvs"
+        "5/v2cCng+CoHgM47cO0vAVRmeMbx/TG7gHd0Ohut9FgrvQdmpZdRUoVtSGeFOSqd/Xd7vbOf57uH"
+        "XYDjyn59HzsqhdHF2QGgq4pnfh2aUcXHWPG9AByZX6jqK/u1ve/ocN9H1evBHEfFnbZ3j9a/uGoH"
+        "gI6qBqsO10qrPsaq7wk4mu4BYJ1dwAar7AIm9WV2AY+Y+Yyk8mOr/J4Y2Sq7gA3W2QVk6h4A6OmL"
+        "7AIe8Ty7gCOq/NgqvyfgKLoHgNfZBWxQuWECbFK9h1VfA46qewCgp8+zC3jEzGeilR9b5fcEHIUA"
+        "UFvlhgmwiR5WmABgGARAR+17vwBQm21JYGR6WGECQMTL7AIAWFz73i8A1Fb1R1MAtqGHFSYARLzI"
+        "LgCAxbXv/QIAADQkANTnN8qBEeldxQkAEb9mFwDA4tr3fgGgvlV2AQB7WGUXwOMEgObToACaWmcX"
+        "kE0AqK/6MA2A++hdxQkAzadBATTVvvcLAPUZpgGMSO8qTgAAgIYEgGvtp0IBNKLnhwBwq/JQCNO0"
+        "gBFV7l2Ve/5iBID6DNMARqR3FScAAEBDAsC19lOhABrR80MAGIWhGsBI9KwBCADX2g+FAGhEzw8B"
+        "YBSr7AIAdrDKLoDNBIBr6+wCAFjMOruACgSAMRiqAYxEzxqAAHCt/VAIgEb0/BAAAKAlAWAMpmoB"
+        "I9GzBiAAvGU4BMD89PobAsAYKg/VALhLzxqAAPCW6VAA89PrbwgAYzBVCxiJnjUAAeAtwyEA5qfX"
+        "3xAAAKAhAeCt6sMhTNcCRlC9V1Xv9YsRAACgIQHgrXV2ARussgsA2MIqu4AN1tkFVCEAAEBDAsBb"
+        "1YdDmK4FjKB6r6re6xcjAABAQwLAOAzXAEagVw1CAHifIREA89Lj3yEAjMNwDWAEetUgBID3GRIB"
+        "MC89/h0CwDgM1wBGoFcNQgB4nyERAPPS498hAABAQwLA+6oPiag+ZAPorXqPqt7jFyUAAEBDAsD7"
+        "1tkFbLDKLgDgEavsAjZYZxdQiQAAAA0JAO+rPiSi+pANoLfqPap6j1+UAAAADQkAYzFkA6hMjxqI"
+        "APAhwyIA5qO33yEAjMWQDaAyPWogAsCHDIsAmI/efocAMBZDNoDK9KiBCAAfMiwCYD56+x0CAAA0"
+        "JACMp/qwDaAnvWkwAsCHTIsCmI/efocAMJ5VdgEA91hlF8BuBIAPrbMLAODg1tkFVCMAjKf6sA2g"
+        "J71pMALAh0yLApiP3n6HADAewzaAivSmwQgAANCQAHA/U6MA5qGn30MAuF/loRGmbQEVVe5NlXt6"
+        "GgFgPIZtABXpTYMRAACgIQHgfqZGAcxDT7+HADAmQzeASvSkAQkA9zM0AmAeevo9BIAxrbILAHjH"
+        "KrsAdicA3G+dXQAAB7POLqAiAWBMhm4AlehJAxIA7mdoBMA89PR7CAAA0JAAMCZTt4BK9KQBCQAP"
+        "MzwCYHx6+QMEgDFVHroB9KMnDUgAeJjpUQDj08sfIACMydQtoBI9aUACwMMMjwAYn17+AAEAABoS"
+        "AB5WfXiE6VtABdV7UfVenkYAAICGBICHrbML2GCVXQBA1O9F6+wCqhIAAKAhAeBh1YdHmL4FVFC9"
+        "F1Xv5WkEAABoSAAYl+EbQAV60aAEgMcZIgEwLj38EQLAuAzfACrQiwYlADzOEAmAcenhjxAAxmX4"
+        "BlCBXjQoAeBxhkgAjEsPf4QAAAANCQCPqz5EovoQDmBu1XtQ9R6eSgAAgIYEgMetswvYYJVdANDa"
+        "KruADdbZBVQmAABAQwLA46oPkag+hAOYW/UeVL2HpxIAAKAhAWBshnAAmfSggQkAmxkmATAevXsD"
+        "AWBshnAAmfSggQkAmxkmATAevXsDAWBshnAAmfSggQkAmxkmATAevXsDAQAAGhIAxld9GAcwJ71n"
+        "cALAZqZJAYxH795AABjfKrsAoKVVdgE8jQCw2Tq7AAB2ts4uoDoBYHzVh3EAc9J7BicAbGaaFMB4"
+        "9O4NBIDxGcYBZNB7BicAAEBDAsB2TJUCGIeevQUBYDuVh0qYxgVkqNx7KvfsMgSA8RnGAWTQewYn"
+        "AABAQwLAdkyVAhiHnr0FAWAOhnIAS9JzJiAAbMdQCYBx6NlbEADmsMouAGhllV0ATycAbGedXQAA"
+        "W1tnFzACAWAOhnIAS9JzJiAAbMdQCYBx6NlbEAAAoCEBYA6mcgFL0nMmIABsz3AJgPr06i0JAHOo"
+        "PJQDmI+eMwEBYHumSwHUp1dvSQCYg6lcwJL0nAkIANszXAKgPr16SwIAADQkAGyv+nAJ07mAJVTv"
+        "NdV7dRkCAAA0JABsb51dwAar7AKAFlbZBWywzi5gFAIAADQkAGyv+nAJ07mAJVTvNdV7dRkCAAA0"
+        "JADMw3AOYAl6zSQEgN0YMgFQlx69AwFgHoZzbK/yb4XP/CtmlR9b5fdENXrNJASA3WgSc6i8EJHD"
+        "e2IOevQOBIB5GM4xh79nF3BEMz+2TvSaSQgAu3GWMIfKC9HMX2Gq/NgqvyfYnh69AwGAjl5HzZuF"
+        "LrILWEDFx/gmaocTOAoBYDfVh0xUH9JRyffZBdzjh+wCFlDxMVZ8L1RVvcdU79GlCAB0VXHL9+fs"
+        "AhZQ8TFWfC/A0QkAu1lnF7DBKruAgbyOWtvR32UXsKBKj/UibP/vYpVdwAbr7AKY10lEXBU+To/3"
+        "0KdU6fXsJvv5vj2qb2lXcxr5r5nX80DsAOym+plC9SEd1byOGmejX2UXkKDCY/4u6n+mq6neY7ye"
+        "HFV2wn3sODvi457ZeeS9ZucLPL6qPO/jOYv8PvfYAUeV/QbX1I7jMrxeGTJCwOUij2xOmaFtm4Md"
+        "uASwu4rfH+fpvo5lX9s3EfHNgn+vqm9i+ef96wX/HsvRmzm6jDNFZzbLWeL1deb/oSXOLH0+nk7/"
+        "m4gdgN0ZNjG3T+K4Xw/8Lpz53+ebOO4NmRdx/doyL72Zo3MNrIfTOOzZzmX4itI2TuLwz7uvxx5O"
+        "dn977LCzxtG5C7aXpwaB87AA7eM0nha2LfzHkd3fHjt8C4qjEwB6Oonr136bRen85v91xv90nvda"
+        "svubAHBAH2cXwMGdhB/DOIbX8fZ5vb2Gf3eh8bwfnue9DsFqMgLA7kyb4paFJ4fnnfvozTvyLYD5"
+        "rLILAKa0yi6AwxIAdrfOLgCAD6yzCxiNADCf6sM6gDHpLZMRAHbn+iNAPXrzjgSA+XyRXQAwJb1l"
+        "MgIAADQkAOzH1CmAOvTkPQgA+6k8dOLz7AKAKVXuLZV7clkCwHyeZRcATElvmYwAAAANCQD7eZFd"
+        "AAD/pCfvQQCYk6EdwCHpKRMSAPZj6ARAHXryHgSAOa2yCwCmssougMMTAPazzi4AgH9aZxcwIgFg"
+        "ToZ2AIekp0xIANiPoRMAdejJexAA5mRoB3BIesqEBID9Vf7t6co/2QmMp3JPqdyLSxMA5uQnO4FD"
+        "0lMmJADsr/rwCT/cARxC9V5SvReXJQDsr/pPT66yCwCmsMouYIPqvbgsAWBevrYDHIJeMikBYH/V"
+        "f3ryD9kFAFOo3kuq9+KyBID9rbML2MBNO8AhVO8l6+wC6Omq+HF6vIcONHAa+X1s08Ge7AA8TfXv"
+        "n36bXQAwtOo9pHoPZmLnkZ9+pWPgWLL716bj/HgPfX52AJ5mhK+fVP8OL1DTCJcQR+jBZQkATzPC"
+        "3ad/zC4AGFL17f+IMXpwWR9lFzCBEbbZvc7ArvS2ydkBeLoRbkIZYSsPqGOEnjFC7y1NAHi6EX6H"
+        "+i/ZBQBDGaFnjNB7mdwI35O9CjcDAtsZpaeNsEtBA9kfBF+XAQ7lMvL71TYHlDDKB8YuAPCYk8jv"
+        "U9scl8d6AjpxD8BhfJ9dwJZ8JRB4zI/ZBWxplJ5LA6Ok5qtw3Qy43yjX/u1mHojvUB7OVXYBW3oT"
+        "EZ9kFwGUM0oPi7B2HYRLAIdzkV3Alp5FxFl2EUApI/WEUXotjYy0fWYLDbg10iXMq3AZ82BsoxzW"
+        "SFtoLgUAEdd31D/LLmIH1q0DcQngsEbamnIpADiLsRb/kXoszYy2lWY7Dfoa7bLlVbh0SXGj/CiQ"
+        "DxX0NeLJih//OTCXAA7v++wC9jDKj38AT3cSEa+yi9jDiL21NDdTHMdVdgF7cFMg9DDaTX+3rFcH"
+        "ZgfgOEa8UeVZGBgEsxt18R+xp9LUiNfXbg8hAOY04v1Jt4f7lBjKyB82IQDmMnI/cvMfwxnxKzZ3"
+        "P3RSN4ztJMZe/K/CV5UZ1OgfvKsQAmBUo5+EXIWzfwY2wwfwKvxiIIzmLPL7xiEOZ/8MbYZdgKtw"
+        "SQBGMMOW/7s9B4Y2yy7A7WE3AGqa5az/9nD2zxRmSeS3x2X4cEIVs51k3PYYmMLIvwsgCEBNZzHf"
+        "ycXt4XIjUzmP/A/VMY+z8KGFYzuJ+bb67x5+h4QpZX+wljguQxiAQ7pd9Gc927976B1Mafbkfl8Y"
+        "OI/rywQ+1LCdk7j+zJxHn0X/9nCT8YJMV1reqMM4DuXNzT9fRsSLzEKgiC8i4vObf+/eG0wkXZAA"
+        "sLxRZ3EDHNNnEfE6u4hOfptdQEP/FxH/iIh/zS4EoIjvIuJv2UV0YwcgT/dLAQARtv7T/Ca7gMa+"
+        "zi4AoAC9MIlLAHlcCgC6s/WfSADI9UtEPI+IT7MLAVjYRUT8Z3YRnbkHoAb3AwDdWH+SuQegBtfA"
+        "gE4+yy4AAaCK1xHxVXYRAAv4KnzfvwT3ANRxGW4KBOb2XUT8T3YRXBMAanFTIDArN/0V4yaMmtwU"
+        "CMzEj/0UJADUJQQAM7D4F+UmwLo+ibeT8wBG9CZ8y6ksOwD12QkARmXCX2F2AOr7OuwEAGN5Exb/"
+        "8uwAjMNOADCC221/i39xAsBYhACgMjf8DcQlgLF8EtffpQWo5iIs/kPxQ0Dj+Wv4xUCglouI+Ca7"
+        "CHbjEsC4TiPip+wigPa+i4j/zi6C3QkAYzuJiFfZRQBtfRURP2cXwX4EgDm4ORBYkjv9J+AmwDl8"
+        "EtfbcADH9l1c9xyL/+DsAMzlJCJ+DLsBwHHY8p+IHYC5vA67AcDhXcT1CaPFfyJ2AOZlNwB4qjcR"
+        "8V9h4Z+SHYB52Q0AnuL2Wr/Ff1J+CGh+v0TE/0bE7yLi0+RagPouIuLfI+Jv2YVwXC4B9HISEX+M"
+        "iN9nFwKU46t9zQgAPbk/ALjlOn9T7gHo6fb+gM/CcCHo6iKuv9bnOn9TdgCIcGkAOrmIiD+Frf72"
+        "BADuOo2Iv4TLAzCTNxHxfRjawzsEAB5yEhFfRsQfQhiAEd0u+n8PZ/vcQwBgG8IAjMGiz9YEAPZx"
+        "GhHfRsTnIRBApjcR8TIifgg38rEjAYBDOI2I5xHxRQgFcCy3i/2LiPg1LPg8kQDAsZxExCqug0HE"
+        "dTiIuA4IEUICvOvNzT9f3vzzxc0/f42IddjO5wj+H/PUQU+Rd+dfAAAAAElFTkSuQmCC"
+    ),
+}
@@ -0,0 +1,461 @@
+"""
+Headless cleanup agent. Accepts cleanup jobs over a local HTTP API (TCP on
+127.0.0.1 or a Unix socket) and runs them with CleanupEngine.
+
+    POST   /jobs              submit a job, returns {"id", "status", "coalesced"}
+    GET    /jobs              status of every known job
+    GET    /jobs/<id>         status and progress of one job
+    GET    /jobs/<id>/events  progress/error/done events as newline-delimited JSON,
+                              streamed until the job ends
+    GET    /jobs/<id>/result  summary of a finished job
+    DELETE /jobs/<id>         cancel a job
+
+Job body: {"directories": {path: enabled} or [paths], "mode": "delete" | "trash",
+"background": bool, "max_items_per_sec": n, "max_mb_per_sec": n,
+"skip_errors": bool, "skip_in_use_files": bool, "time_budget": seconds}.
+Without "directories" the directories from the user settings are used, and
+without "mode" the user's trash setting decides. A job identical to one that
+is still queued is merged into it instead of queued again, and a job whose
+directories overlap those of a running job waits until that job has finished.
+
+Every request must carry the per-install token from the token file (created
+with owner-only permissions on first start) in the X-Insomnia-Token header.
+POST bodies must be sent as application/json, and TCP requests must name
+127.0.0.1:<port> or localhost:<port> as Host, which keeps web pages out through
+cross-site requests and DNS rebinding. Jobs may only clean the directories
+configured in the settings or listed in "agent_allowed_directories" there.
+"""
+import os
+import sys
+import hmac
+import json
+import time
+import uuid
+import secrets
+import socket
+import argparse
+import threading
+import socketserver
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scripts.TempFilesDeleter.cleanup_engine import CleanupEngine
+from scripts.TempFilesDeleter.settings_manager import load_settings
+
+DEFAULT_PORT = 8765
+DEFAULT_WORKERS = 2
+# Finished jobs kept for status and result queries
+MAX_FINISHED_JOBS = 200
+TOKEN_HEADER = "X-Insomnia-Token"
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATES = (DONE, FAILED, CANCELLED)
+
+
+def default_token_file():
+    # Per-user locations; on Windows LOCALAPPDATA is only readable by its owner
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+    return os.path.join(base, "Insomnia", "agent_token")
+
+def load_or_create_token(path):
+    """
+    Read the agent token, creating it with owner-only permissions the first time.
+    """
+    try:
+        if sys.platform != "win32" and os.stat(path).st_mode & 0o077:
+            os.chmod(path, 0o600)
+        with open(path, 'r') as f:
+            token = f.read().strip()
+        if token:
+            return token
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    token = secrets.token_urlsafe(32)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, 'w') as f:
+        f.write(token + "\n")
+    return token
+
+def resolve_directory(directory):
+    return os.path.normcase(os.path.realpath(os.path.expandvars(directory)))
+
+def is_within(path, root):
+    return path == root or path.startswith(root.rstrip(os.sep) + os.sep)
+
+def is_allowed_directory(directory, allowed_roots):
+    path = resolve_directory(directory)
+    return any(is_within(path, root) for root in allowed_roots)
+
+def job_from_request(body):
+    """
+    Turn a request body into CleanupEngine keyword arguments. Raises ValueError
+    for invalid requests.
+    """
+    if not isinstance(body, dict):
+        raise ValueError("Job must be a JSON object")
+    settings = load_settings()
+    configured = settings.get('directories', {})
+    directories = body.get('directories')
+    if directories is None:
+        directories = configured
+    if isinstance(directories, list):
+        directories = {directory: True for directory in directories}
+    if not isinstance(directories, dict) or not any(directories.values()):
+        raise ValueError("Job needs at least one enabled directory")
+    allowed_roots = [resolve_directory(directory)
+                     for directory in list(configured) + list(settings.get('agent_allowed_directories', []))]
+    for directory, enabled in directories.items():
+        if enabled and not is_allowed_directory(str(directory), allowed_roots):
+            raise PermissionError(f"{directory} is not a configured cleanup directory")
+    mode = body.get('mode', 'trash' if settings.get('move_to_trash', True) else 'delete')
+    if mode not in ('delete', 'trash'):
+        raise ValueError("mode must be 'delete' or 'trash'")
+    return {
+        'directories': {str(directory): bool(enabled) for directory, enabled in directories.items()},
+        'move_to_trash': mode == 'trash',
+        'skip_errors': bool(body.get('skip_errors', True)),
+        'background_mode': bool(body.get('background', False)),
+        'max_items_per_sec': float(body.get('max_items_per_sec', 200)),
+        'max_mb_per_sec': float(body.get('max_mb_per_sec', 20)),
+        'skip_in_use_files': bool(body.get('skip_in_use_files', True)),
+        'time_budget_seconds': float(body.get('time_budget', 0)),
+    }
+
+
+class CleanupJob:
+    def __init__(self, spec, key):
+        self.id = uuid.uuid4().hex[:12]
+        self.spec = spec
+        self.key = key
+        self.roots = [resolve_directory(directory) for directory, enabled in spec['directories'].items() if enabled]
+        self.status = QUEUED
+        self.progress = 0
+        self.requests = 1
+        self.summary = None
+        self.events = []
+        self.condition = threading.Condition()
+        self.cancel_event = threading.Event()
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+
+    def overlaps(self, other):
+        return any(is_within(root, other_root) or is_within(other_root, root)
+                   for root in self.roots for other_root in other.roots)
+
+    def add_event(self, kind, value):
+        with self.condition:
+            self.events.append({'event': kind, 'value': value})
+            self.condition.notify_all()
+
+    def set_progress(self, value):
+        self.progress = value
+        self.add_event('progress', value)
+
+    def finish(self, status, summary=None):
+        self.finished = time.time()
+        self.summary = summary
+        self.status = status
+        self.add_event(status, summary)
+
+    def run(self):
+        if self.cancel_event.is_set():
+            self.finish(CANCELLED)
+            return
+        self.status = RUNNING
+        self.started = time.time()
+        try:
+            engine = CleanupEngine(**self.spec,
+                                   on_progress=self.set_progress,
+                                   on_error=lambda message: self.add_event('error', message),
+                                   should_stop=self.cancel_event.is_set)
+            summary = engine.run()
+        except Exception as e:
+            self.finish(FAILED, {'error': str(e)})
+            return
+        self.finish(CANCELLED if self.cancel_event.is_set() else DONE, summary)
+
+    def status_dict(self):
+        return {'id': self.id, 'status': self.status, 'progress': self.progress,
+                'requests': self.requests, 'created': self.created,
+                'started': self.started, 'finished': self.finished,
+                'directories': [directory for directory, enabled in self.spec['directories'].items() if enabled]}
+
+
+class JobQueue:
+    """
+    FIFO job queue running up to max_concurrent jobs at once. Each job runs on
+    its own thread, so a background job lowering its thread priority does not
+    affect later jobs. Jobs with overlapping directories never run at the same
+    time, so no tree is walked by two engines at once.
+    """
+    def __init__(self, max_concurrent=DEFAULT_WORKERS):
+        self.max_concurrent = max_concurrent
+        self.lock = threading.Lock()
+        self.jobs = {}
+        self.pending = deque()
+        self.queued_by_key = {}
+        self.running = []
+
+    def submit(self, spec):
+        """
+        Queue a job. Returns (job, coalesced), where coalesced is True when an
+        identical queued job was reused.
+        """
+        key = json.dumps(spec, sort_keys=True)
+        with self.lock:
+            job = self.queued_by_key.get(key)
+            if job is not None:
+                job.requests += 1
+                return job, True
+            job = CleanupJob(spec, key)
+            self.jobs[job.id] = job
+            self.queued_by_key[key] = job
+            self.pending.append(job)
+            self.prune_locked()
+            self.dispatch_locked()
+        return job, False
+
+    def get(self, job_id):
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def all(self):
+        with self.lock:
+            return list(self.jobs.values())
+
+    def cancel(self, job_id):
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return None
+            job.cancel_event.set()
+            if job.status == QUEUED:
+                # Identical requests must not merge into a cancelled job
+                self.queued_by_key.pop(job.key, None)
+                self.dispatch_locked()
+            return job
+
+    def dispatch_locked(self):
+        # Start queued jobs in order, skipping those that overlap a running or
+        # earlier queued job so overlapping jobs keep their order
+        waiting = deque()
+        while self.pending:
+            job = self.pending.popleft()
+            if job.cancel_event.is_set():
+                self.queued_by_key.pop(job.key, None)
+                job.finish(CANCELLED)
+                continue
+            if (len(self.running) >= self.max_concurrent
+                    or any(job.overlaps(other) for other in self.running)
+                    or any(job.overlaps(other) for other in waiting)):
+                waiting.append(job)
+                continue
+            self.queued_by_key.pop(job.key, None)
+            self.running.append(job)
+            job.status = RUNNING
+            threading.Thread(target=self.run_job, args=(job,), daemon=True).start()
+        self.pending = waiting
+
+    def run_job(self, job):
+        try:
+            job.run()
+        finally:
+            with self.lock:
+                self.running.remove(job)
+                self.dispatch_locked()
+
+    def prune_locked(self):
+        finished = [job for job in self.jobs.values() if job.status in FINISHED_STATES]
+        for job in sorted(finished, key=lambda job: job.finished)[:-MAX_FINISHED_JOBS]:
+            del self.jobs[job.id]
+
+
+class AgentRequestHandler(BaseHTTPRequestHandler):
+    server_version = "InsomniaAgent/1.0"
+
+    def address_string(self):
+        # Unix socket clients have no address
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "local"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def send_json(self, status, data):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def check_request(self):
+        """
+        Send an error response and return False unless the request carries the
+        token and, over TCP, a loopback Host header.
+        """
+        if self.server.allowed_hosts is not None:
+            host = (self.headers.get("Host") or "").lower()
+            if host not in self.server.allowed_hosts:
+                self.send_json(403, {'error': "Invalid Host header"})
+                return False
+        token = self.headers.get(TOKEN_HEADER) or ""
+        if not hmac.compare_digest(token.encode("utf-8"), self.server.token.encode("utf-8")):
+            self.send_json(401, {'error': f"Missing or invalid {TOKEN_HEADER} header"})
+            return False
+        return True
+
+    def route(self):
+        parts = [part for part in self.path.split("?", 1)[0].split("/") if part]
+        if not parts or parts[0] != "jobs" or len(parts) > 3:
+            return None, None
+        job_id = parts[1] if len(parts) > 1 else None
+        action = parts[2] if len(parts) > 2 else None
+        return job_id, action
+
+    def do_POST(self):
+        if not self.check_request():
+            return
+        if self.path.rstrip("/") != "/jobs":
+            self.send_json(404, {'error': "Not found"})
+            return
+        content_type = (self.headers.get("Content-Type") or "").split(";", 1)[0].strip().lower()
+        if content_type != "application/json":
+            self.send_json(415, {'error': "Content-Type must be application/json"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            spec = job_from_request(json.loads(self.rfile.read(length) or b"{}"))
+        except (ValueError, TypeError) as e:
+            self.send_json(400, {'error': str(e)})
+            return
+        except PermissionError as e:
+            self.send_json(403, {'error': str(e)})
+            return
+        except OSError as e:
+            self.send_json(500, {'error': f"Could not load settings: {str(e)}"})
+            return
+        job, coalesced = self.server.queue.submit(spec)
+        self.send_json(202, {'id': job.id, 'status': job.status, 'coalesced': coalesced})
+
+    def do_GET(self):
+        if not self.check_request():
+            return
+        if self.path.split("?", 1)[0].rstrip("/") == "/jobs":
+            self.send_json(200, [job.status_dict() for job in self.server.queue.all()])
+            return
+        job_id, action = self.route()
+        job = self.server.queue.get(job_id) if job_id else None
+        if job is None:
+            self.send_json(404, {'error': "Unknown job"})
+        elif action is None:
+            self.send_json(200, job.status_dict())
+        elif action == "result":
+            if job.status not in FINISHED_STATES:
+                self.send_json(409, {'error': "Job has not finished", 'status': job.status})
+            else:
+                self.send_json(200, {'id': job.id, 'status': job.status, 'summary': job.summary})
+        elif action == "events":
+            self.stream_events(job)
+        else:
+            self.send_json(404, {'error': "Not found"})
+
+    def do_DELETE(self):
+        if not self.check_request():
+            return
+        job_id, action = self.route()
+        job = self.server.queue.cancel(job_id) if job_id and action is None else None
+        if job is None:
+            self.send_json(404, {'error': "Unknown job"})
+        else:
+            self.send_json(200, job.status_dict())
+
+    def stream_events(self, job):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+        sent = 0
+        while True:
+            with job.condition:
+                while sent == len(job.events) and job.status not in FINISHED_STATES:
+                    job.condition.wait()
+                events = job.events[sent:]
+                ended = job.status in FINISHED_STATES
+            for event in events:
+                self.wfile.write((json.dumps(event) + "\n").encode("utf-8"))
+            self.wfile.flush()
+            sent += len(events)
+            if ended and sent == len(job.events):
+                return
+
+
+class AgentHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, queue, token, verbose=False):
+        super().__init__(address, AgentRequestHandler)
+        self.queue = queue
+        self.token = token
+        self.verbose = verbose
+        port = self.server_address[1]
+        self.allowed_hosts = {f"127.0.0.1:{port}", f"localhost:{port}"}
+
+
+if hasattr(socket, "AF_UNIX"):
+    class AgentUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+        def __init__(self, path, queue, token, verbose=False):
+            if os.path.exists(path):
+                os.unlink(path)
+            super().__init__(path, AgentRequestHandler)
+            # Only the owner may submit jobs
+            os.chmod(path, 0o600)
+            self.queue = queue
+            self.token = token
+            self.verbose = verbose
+            # Browsers cannot reach a Unix socket
+            self.allowed_hosts = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Insomnia cleanup agent")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="TCP port on 127.0.0.1")
+    parser.add_argument("--socket", help="Listen on this Unix socket instead of TCP")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Jobs run at the same time")
+    parser.add_argument("--token-file", default=default_token_file(),
+                        help=f"File holding the token clients send in {TOKEN_HEADER}")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    token = load_or_create_token(args.token_file)
+    queue = JobQueue(max(1, args.workers))
+    if args.socket:
+        server = AgentUnixServer(args.socket, queue, token, args.verbose)
+        print(f"Insomnia agent listening on {args.socket}")
+    else:
+        server = AgentHTTPServer(("127.0.0.1", args.port), queue, token, args.verbose)
+        print(f"Insomnia agent listening on http://127.0.0.1:{args.port}")
+    print(f"Token: {args.token_file}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,317 @@
+import os
+import stat
+import time
+
+from scripts.TempFilesDeleter.throttle import BackgroundThrottle, lower_thread_priority
+from scripts.TempFilesDeleter.trash_backend import get_trash_backend
+from scripts.TempFilesDeleter.open_files import build_open_file_index
+from scripts.TempFilesDeleter.run_stats import RunStats
+from scripts.TempFilesDeleter.space_analyzer import estimate_tree_size, loaded_directory_cache, ESTIMATE_MAX_ENTRIES
+from scripts.TempFilesDeleter.safe_walk import SafeWalker, is_link_stat, remove_link, tree_size, first_link_seen
+
+# Items handed to the trash backend per call when not throttled
+TRASH_BATCH_SIZE = 256
+# Share of the time budget that size estimates may use, and the entries they
+# may list over a whole run; past either limit unlisted directories count as 0
+ESTIMATE_BUDGET_SHARE = 0.1
+ESTIMATE_RUN_MAX_ENTRIES = 20000
+
+class CleanupEngine:
+    """
+    Deletes the contents of the enabled directories. Has no Qt dependency so it
+    can run in a QThread, in the cleanup worker process or headless.
+
+    With a time budget the directories most likely to free the most bytes per
+    second go first, larger items before smaller ones, and the run stops when
+    the budget is used up.
+    """
+    def __init__(self, directories, move_to_trash, skip_errors, background_mode=False,
+                 max_items_per_sec=0, max_mb_per_sec=0, skip_in_use_files=False, time_budget_seconds=0,
+                 on_progress=None, on_error=None, on_item=None, should_stop=None):
+        self.directories = directories
+        self.move_to_trash = move_to_trash
+        self.skip_errors = skip_errors
+        self.background_mode = background_mode
+        self.skip_in_use_files = skip_in_use_files
+        self.in_use = None
+        self.time_budget_seconds = time_budget_seconds
+        self.deadline = None
+        self.estimate_deadline = None
+        self.estimate_entries_left = 0
+        self.stats = None
+        self.estimates = {}
+        # Set when the size of something freed could not be measured
+        self.bytes_unknown = False
+        # Hard-linked files already counted, shared by every tree this run removes
+        self.hard_links = set()
+        self.on_progress = on_progress or (lambda value: None)
+        self.on_error = on_error or (lambda message: None)
+        self.on_item = on_item or (lambda: None)
+        self.should_stop = should_stop or (lambda: False)
+        self.trash_backend = get_trash_backend() if move_to_trash else None
+        self.throttle = None
+        if background_mode:
+            self.throttle = BackgroundThrottle(max_items_per_sec, max_mb_per_sec, should_stop=self.stopped)
+        self.items_removed = 0
+        self.errors = 0
+        self.skipped_in_use = []
+        self.in_use_unavailable = False
+        self.bytes_freed = 0
+        self.bytes_remaining = 0
+        self.timed_out = False
+
+    def run(self):
+        if self.background_mode:
+            lower_thread_priority()
+        directories = [directory for directory, enabled in self.directories.items() if enabled]
+        if self.skip_in_use_files:
+            self.in_use = build_open_file_index([os.path.expandvars(directory) for directory in directories])
+            self.in_use_unavailable = self.in_use is None
+        estimates = {}
+        if self.time_budget_seconds:
+            now = time.monotonic()
+            self.deadline = now + self.time_budget_seconds
+            self.estimate_deadline = now + self.time_budget_seconds * ESTIMATE_BUDGET_SHARE
+            self.estimate_entries_left = ESTIMATE_RUN_MAX_ENTRIES
+            self.stats = RunStats()
+            directories, estimates = self.order_by_rate(directories)
+        for i, directory in enumerate(directories):
+            if self.stopped():
+                self.bytes_remaining += sum(estimates.get(rest, 0) for rest in directories[i:])
+                break
+            started = time.monotonic()
+            bytes_before = self.bytes_freed
+            items_before = self.items_removed
+            self.bytes_unknown = False
+            self.clean_directory(os.path.expandvars(directory))
+            # A rate from unmeasured bytes would outrank real estimates on later runs
+            if self.stats is not None and not self.bytes_unknown:
+                self.stats.record(directory, self.bytes_freed - bytes_before,
+                                  self.items_removed - items_before, time.monotonic() - started)
+            self.on_progress(int((i + 1) / len(directories) * 100))
+        if self.stats is not None:
+            try:
+                self.stats.save()
+            except OSError:
+                pass
+        return self.summary()
+
+    def stopped(self):
+        if self.should_stop():
+            return True
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            self.timed_out = True
+            return True
+        return False
+
+    def estimating_done(self):
+        return (self.stopped() or self.estimate_entries_left <= 0
+                or time.monotonic() >= self.estimate_deadline)
+
+    def clean_directory(self, expanded_path):
+        if not os.path.exists(expanded_path):
+            return
+        try:
+            item_paths = [os.path.join(expanded_path, item) for item in os.listdir(expanded_path)]
+            held_dirs = []
+            if self.in_use:
+                item_paths, held_dirs = self.filter_in_use(item_paths)
+            if self.move_to_trash and self.throttle is None and self.deadline is None:
+                self.trash_items(item_paths)
+            else:
+                sizes = {}
+                if self.deadline is not None:
+                    sizes = {item_path: self.estimate_size(item_path) for item_path in item_paths}
+                    item_paths.sort(key=sizes.get, reverse=True)
+                for index, item_path in enumerate(item_paths):
+                    if self.stopped():
+                        self.bytes_remaining += sum(sizes.get(rest, 0) for rest in item_paths[index:])
+                        return
+                    try:
+                        if self.delete_item(item_path):
+                            self.items_removed += 1
+                    except Exception as e:
+                        self.handle_failure(item_path, e)
+                    self.on_item()
+            for held_dir in held_dirs:
+                self.delete_held_directory(held_dir)
+        except Exception as e:
+            self.errors += 1
+            if not self.skip_errors:
+                self.on_error(f"Error accessing {expanded_path}: {str(e)}")
+
+    def order_by_rate(self, directories):
+        """
+        Sort directories by expected bytes freed per second, highest first.
+        Returns the sorted list and the estimated bytes per directory.
+        """
+        estimates = {}
+        rates = {}
+        for directory in directories:
+            if self.stopped():
+                break
+            expanded_path = os.path.expandvars(directory)
+            estimated_bytes = 0
+            estimated_items = 0
+            try:
+                for item in os.listdir(expanded_path):
+                    if self.stopped():
+                        break
+                    estimated_bytes += self.estimate_size(os.path.join(expanded_path, item))
+                    estimated_items += 1
+            except OSError:
+                pass
+            estimates[directory] = estimated_bytes
+            rates[directory] = self.stats.expected_rate(directory, estimated_bytes, estimated_items)
+        return sorted(directories, key=lambda directory: rates.get(directory, 0), reverse=True), estimates
+
+    def estimate_size(self, path):
+        # Exact for files; directories are sampled and extrapolated while the
+        # estimate limits last
+        size = self.estimates.get(path)
+        if size is None:
+            try:
+                st = os.lstat(path)
+            except OSError:
+                return 0
+            if is_link_stat(st):
+                size = 0
+            elif stat.S_ISDIR(st.st_mode):
+                if self.estimating_done():
+                    size = 0
+                else:
+                    size, entries = estimate_tree_size(path, loaded_directory_cache(),
+                                                       min(ESTIMATE_MAX_ENTRIES, self.estimate_entries_left),
+                                                       self.estimating_done)
+                    self.estimate_entries_left -= entries
+            else:
+                size = st.st_size
+            self.estimates[path] = size
+        return size
+
+    def measure(self, path):
+        # Actual size of an item about to be trashed
+        try:
+            return tree_size(path, SafeWalker(counted=self.hard_links))
+        except OSError:
+            self.bytes_unknown = True
+            return 0
+
+    def filter_in_use(self, item_paths):
+        """
+        Split items into those that can go as a whole and directories that
+        contain open files. Open files themselves are skipped.
+        """
+        free = []
+        held_dirs = []
+        for item_path in item_paths:
+            if self.in_use.is_open(item_path):
+                self.skipped_in_use.append(item_path)
+            elif self.in_use.contains_open(item_path):
+                held_dirs.append(item_path)
+            else:
+                free.append(item_path)
+        return free, held_dirs
+
+    def delete_held_directory(self, path):
+        # Remove everything in the tree except the open files and their parents
+        item_paths, held_dirs = self.filter_in_use([entry.path for entry in os.scandir(path)])
+        for item_path in item_paths:
+            if self.stopped():
+                return
+            try:
+                if self.delete_item(item_path):
+                    self.items_removed += 1
+            except Exception as e:
+                self.handle_failure(item_path, e)
+            self.on_item()
+        for held_dir in held_dirs:
+            self.delete_held_directory(held_dir)
+
+    def trash_items(self, item_paths):
+        for start in range(0, len(item_paths), TRASH_BATCH_SIZE):
+            if self.stopped():
+                break
+            batch = item_paths[start:start + TRASH_BATCH_SIZE]
+            failures = self.trash_backend.trash_many(batch)
+            self.items_removed += len(batch) - len(failures)
+            for item_path, e in failures:
+                self.handle_failure(item_path, e)
+            self.on_item()
+
+    def handle_failure(self, item_path, e):
+        if not self.skip_errors:
+            self.errors += 1
+            self.on_error(f"Error deleting {item_path}: {str(e)}")
+            return
+        try:
+            if self.delete_item(item_path):
+                self.items_removed += 1
+        except:
+            self.errors += 1
+
+    def summary(self):
+        return {'items_removed': self.items_removed, 'errors': self.errors,
+                'skipped_in_use': list(self.skipped_in_use), 'in_use_unavailable': self.in_use_unavailable,
+                'bytes_freed': self.bytes_freed,
+                'bytes_remaining': self.bytes_remaining, 'timed_out': self.timed_out}
+
+    def delete_item(self, item_path):
+        """
+        Delete or trash one item. Returns False if the run was stopped before
+        the item was completely removed.
+        """
+        if self.move_to_trash:
+            # Only the time budget report and RunStats use the bytes trashed
+            size = self.measure(item_path) if self.deadline is not None else 0
+            # Same-volume moves are cheap, so only the item count is limited
+            self.throttled(self.trash_backend.trash, item_path, 0)
+            self.bytes_freed += size
+            return True
+        st = os.lstat(item_path)
+        if is_link_stat(st):
+            # Symlinks and junctions are removed, never followed
+            self.throttled(remove_link, item_path, 0)
+        elif stat.S_ISDIR(st.st_mode):
+            return self.remove_tree(item_path)
+        else:
+            self.throttled(os.unlink, item_path, st.st_size)
+            if first_link_seen(st, self.hard_links):
+                self.bytes_freed += st.st_size
+        return True
+
+    def remove_tree(self, path):
+        """
+        Delete a directory file by file so rate limits and the deadline apply
+        inside large trees. Returns False when stopped part way; raises OSError
+        when part of the tree could not be listed or removed.
+        """
+        def raise_error(e):
+            raise e
+
+        # A fresh walker per tree, so a retry walks the tree again
+        walker = SafeWalker(should_stop=self.stopped, counted=self.hard_links)
+        for root, dirs, files, links in walker.walk(path, topdown=False, onerror=raise_error):
+            for name, st in files:
+                if self.stopped():
+                    return False
+                self.throttled(os.unlink, os.path.join(root, name), st.st_size)
+                self.bytes_freed += walker.count_once(st)
+            for name in links:
+                self.throttled(remove_link, os.path.join(root, name), 0)
+            self.throttled(os.rmdir, root, 0)
+            if root == path:
+                return True
+        if self.stopped():
+            return False
+        # The walk ended without reaching the top, e.g. it was already visited through another mount
+        raise OSError(f"Could not remove {path}")
+
+    def throttled(self, operation, path, size):
+        if self.throttle is None:
+            operation(path)
+            return
+        self.throttle.wait(size)
+        start = time.monotonic()
+        operation(path)
+        self.throttle.record(time.monotonic() - start)
@@ -0,0 +1,103 @@
+"""
+Cleanup worker process. Runs the deletion engine outside the GUI process and
+talks to it over stdin/stdout, one JSON array per line:
+
+    GUI -> worker:  ["j", job]            run a cleanup job (CleanupEngine kwargs)
+                    ["q"]                 quit
+    worker -> GUI:  ["r"]                 ready for a job
+                    ["h"]                 heartbeat each second in which a job made progress
+                    ["p", percent]        progress
+                    ["e", message]        error
+                    ["d", summary]        job done
+"""
+import os
+import sys
+import json
+import threading
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scripts.TempFilesDeleter.cleanup_engine import CleanupEngine
+
+JOB = "j"
+QUIT = "q"
+READY = "r"
+HEARTBEAT = "h"
+PROGRESS = "p"
+ERROR = "e"
+DONE = "d"
+
+HEARTBEAT_INTERVAL = 1.0
+
+send_lock = threading.Lock()
+
+def encode_message(kind, *args):
+    return (json.dumps([kind, *args], separators=(",", ":")) + "\n").encode("utf-8")
+
+def decode_message(line):
+    message = json.loads(line.decode("utf-8"))
+    return message[0], message[1:]
+
+def send(kind, *args):
+    with send_lock:
+        sys.stdout.buffer.write(encode_message(kind, *args))
+        sys.stdout.buffer.flush()
+
+def run_job(job, on_activity=None):
+    on_activity = on_activity or (lambda: None)
+
+    def should_stop():
+        # The engine checks this between files and directories, so it doubles
+        # as a sign of progress inside large trees
+        on_activity()
+        return False
+
+    engine = CleanupEngine(**job,
+                           on_progress=lambda value: send(PROGRESS, value),
+                           on_error=lambda message: send(ERROR, message),
+                           on_item=on_activity,
+                           should_stop=should_stop)
+    return engine.run()
+
+def run_job_thread(job, result):
+    def on_activity():
+        result['activity'] += 1
+
+    try:
+        result['summary'] = run_job(job, on_activity)
+    except Exception as e:
+        send(ERROR, f"Cleanup worker error: {str(e)}")
+
+def run_job_with_heartbeat(job):
+    """
+    Run a job on its own thread, so a background job's lowered priority ends
+    with it. Sends a heartbeat each interval in which the engine made
+    progress, so a job stuck in one operation stops sending and the GUI can
+    restart the worker.
+    """
+    result = {'summary': {}, 'activity': 0}
+    thread = threading.Thread(target=run_job_thread, args=(job, result), daemon=True)
+    thread.start()
+    last_activity = 0
+    while True:
+        thread.join(HEARTBEAT_INTERVAL)
+        if not thread.is_alive():
+            return result['summary']
+        if result['activity'] != last_activity:
+            last_activity = result['activity']
+            send(HEARTBEAT)
+
+def main():
+    send(READY)
+    for line in sys.stdin.buffer:
+        if not line.strip():
+            continue
+        kind, args = decode_message(line)
+        if kind == QUIT:
+            break
+        if kind == JOB:
+            send(DONE, run_job_with_heartbeat(args[0]))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from scripts.TempFilesDeleter.trash_backend import get_trash_backend
+
+class EmptyTrashThread(QThread):
+    """
+    Empties the trash in the background. The size is queried first; cancel with
+    requestInterruption().
+    """
+    sized = pyqtSignal(int, int)
+    progress = pyqtSignal(int)
+    error = pyqtSignal(str)
+    finished = pyqtSignal()
+
+    def __init__(self, backend=None):
+        super().__init__()
+        self.backend = backend or get_trash_backend()
+        self.items_total = 0
+        self.bytes_total = 0
+        self.items_removed = 0
+        self.cancelled = False
+
+    def run(self):
+        try:
+            self.items_total, self.bytes_total = self.backend.query_size()
+            self.sized.emit(self.items_total, self.bytes_total)
+            if self.items_total > 0:
+                self.items_removed = self.backend.empty(
+                    on_progress=lambda fraction: self.progress.emit(int(fraction * 100)),
+                    should_stop=self.isInterruptionRequested
+                )
+                failures = self.backend.empty_failures
+                if failures:
+                    path, e = failures[0]
+                    self.error.emit(f"{len(failures)} items could not be removed, first {path}: {str(e)}")
+            self.cancelled = self.isInterruptionRequested()
+        except Exception as e:
+            self.error.emit(str(e))
+        self.finished.emit()
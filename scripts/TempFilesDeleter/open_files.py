@@ -0,0 +1,98 @@
+import os
+import sys
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+def normalize_path(path):
+    return os.path.normcase(os.path.normpath(path))
+
+class OpenFileIndex:
+    """
+    Set of files held open by running processes, plus every directory between
+    those files and the cleanup roots, so both checks are a single set lookup.
+    Open files are matched against the roots' resolved paths and stored under
+    the roots as given, so a symlinked root or an 8.3 short name in %TEMP%
+    still matches without resolving every lookup.
+    """
+    def __init__(self, files, roots):
+        # (resolved root, root as given)
+        roots = [(normalize_path(os.path.realpath(root)), normalize_path(root)) for root in roots]
+        self.files = set()
+        self.dirs = set()
+        for path in files:
+            path = normalize_path(os.path.realpath(path))
+            match = next(((real_root, root) for real_root, root in roots
+                          if path.startswith(real_root + os.sep)), None)
+            if match is None:
+                continue
+            real_root, root = match
+            path = root + path[len(real_root):]
+            self.files.add(path)
+            parent = os.path.dirname(path)
+            while parent not in self.dirs and len(parent) > len(root):
+                self.dirs.add(parent)
+                parent = os.path.dirname(parent)
+
+    def __len__(self):
+        return len(self.files)
+
+    def is_open(self, path):
+        return normalize_path(path) in self.files
+
+    def contains_open(self, path):
+        return normalize_path(path) in self.dirs
+
+
+def linux_open_files():
+    files = []
+    try:
+        pids = [pid for pid in os.listdir("/proc") if pid.isdigit()]
+    except OSError:
+        return files
+    for pid in pids:
+        fd_dir = f"/proc/{pid}/fd"
+        try:
+            fds = os.listdir(fd_dir)
+        except OSError:
+            # Process exited or belongs to another user
+            continue
+        for fd in fds:
+            try:
+                target = os.readlink(os.path.join(fd_dir, fd))
+            except OSError:
+                continue
+            if target.startswith("/") and not target.endswith(" (deleted)"):
+                files.append(target)
+    return files
+
+def psutil_open_files():
+    # psutil enumerates the system handle table on Windows
+    files = []
+    if psutil is None:
+        return files
+    for process in psutil.process_iter():
+        try:
+            files.extend(open_file.path for open_file in process.open_files())
+        except (psutil.Error, OSError):
+            continue
+    return files
+
+def open_file_detection_available():
+    # Without psutil there is no way to list open files outside Linux
+    return sys.platform.startswith("linux") or psutil is not None
+
+def build_open_file_index(roots):
+    """
+    Build the index of open files below the given (expanded) root directories.
+    Returns None when open files cannot be listed on this system.
+    """
+    if sys.platform.startswith("linux"):
+        files = linux_open_files()
+    elif psutil is not None:
+        files = psutil_open_files()
+    else:
+        return None
+    return OpenFileIndex(files, roots)
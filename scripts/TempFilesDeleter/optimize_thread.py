@@ -1,53 +1,22 @@
 from PyQt6.QtCore import QThread, pyqtSignal
-import os
-import shutil
-import send2trash
+
+from scripts.TempFilesDeleter.cleanup_engine import CleanupEngine
 
 class OptimizeThread(QThread):
     progress = pyqtSignal(int)
     error = pyqtSignal(str)
     finished = pyqtSignal()
 
-    def __init__(self, directories, move_to_trash, skip_errors):
+    def __init__(self, directories, move_to_trash, skip_errors, background_mode=False,
+                 max_items_per_sec=0, max_mb_per_sec=0, skip_in_use_files=False, time_budget_seconds=0):
         super().__init__()
-        self.directories = directories
-        self.move_to_trash = move_to_trash
-        self.skip_errors = skip_errors
+        self.summary = {}
+        self.engine = CleanupEngine(directories, move_to_trash, skip_errors, background_mode,
+                                    max_items_per_sec, max_mb_per_sec, skip_in_use_files,
+                                    time_budget_seconds,
+                                    on_progress=self.progress.emit, on_error=self.error.emit,
+                                    should_stop=self.isInterruptionRequested)
 
     def run(self):
-        total = len(self.directories)
-        for i, (directory, enabled) in enumerate(self.directories.items()):
-            if not enabled:
-                continue
-            expanded_path = os.path.expandvars(directory)
-            if os.path.exists(expanded_path):
-                try:
-                    for item in os.listdir(expanded_path):
-                        item_path = os.path.join(expanded_path, item)
-                        try:
-                            if self.move_to_trash:
-                                send2trash.send2trash(item_path)
-                            else:
-                                if os.path.isfile(item_path):
-                                    os.unlink(item_path)
-                                elif os.path.isdir(item_path):
-                                    shutil.rmtree(item_path)
-                        except Exception as e:
-                            if not self.skip_errors:
-                                self.error.emit(f"Error deleting {item_path}: {str(e)}")
-                            else:
-                                try:
-                                    if self.move_to_trash:
-                                        send2trash.send2trash(item_path)
-                                    else:
-                                        if os.path.isfile(item_path):
-                                            os.unlink(item_path)
-                                        elif os.path.isdir(item_path):
-                                            shutil.rmtree(item_path)
-                                except:
-                                    pass
-                except Exception as e:
-                    if not self.skip_errors:
-                        self.error.emit(f"Error accessing {expanded_path}: {str(e)}")
-            self.progress.emit(int((i + 1) / total * 100))
+        self.summary = self.engine.run()
         self.finished.emit()
@@ -0,0 +1,49 @@
+import os
+import json
+
+from scripts.TempFilesDeleter.space_analyzer import CACHE_DIR
+
+STATS_FILE = os.path.join(CACHE_DIR, "run_stats.json")
+
+# Used for directories that have never been cleaned
+DEFAULT_BYTES_PER_SEC = 50 * 1024 * 1024
+DEFAULT_SECONDS_PER_ITEM = 0.002
+
+class RunStats:
+    """
+    Bytes freed per second for each cleaned directory, averaged over past runs.
+    """
+    def __init__(self, path=STATS_FILE):
+        self.path = path
+        try:
+            with open(path, 'r') as f:
+                self.directories = json.load(f)
+        except (OSError, ValueError):
+            self.directories = {}
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, 'w') as f:
+            json.dump(self.directories, f, indent=2)
+
+    def record(self, directory, bytes_freed, items, seconds):
+        if items == 0 or seconds <= 0:
+            return
+        rate = bytes_freed / seconds
+        entry = self.directories.get(directory)
+        if entry is None:
+            self.directories[directory] = {'bytes_per_sec': rate, 'runs': 1}
+        else:
+            entry['bytes_per_sec'] = 0.7 * entry['bytes_per_sec'] + 0.3 * rate
+            entry['runs'] += 1
+
+    def expected_rate(self, directory, estimated_bytes, estimated_items):
+        """
+        Expected bytes freed per second: from past runs when there are any,
+        otherwise from the estimated size and item count.
+        """
+        entry = self.directories.get(directory)
+        if entry is not None:
+            return entry['bytes_per_sec']
+        seconds = estimated_items * DEFAULT_SECONDS_PER_ITEM + estimated_bytes / DEFAULT_BYTES_PER_SEC
+        return estimated_bytes / seconds if seconds > 0 else 0
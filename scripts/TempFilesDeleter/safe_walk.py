@@ -0,0 +1,190 @@
+import os
+import sys
+import stat
+
+FILE_ATTRIBUTE_REPARSE_POINT = getattr(stat, 'FILE_ATTRIBUTE_REPARSE_POINT', 0x400)
+
+def is_link_stat(st):
+    """
+    True for symlinks and for directories that are reparse points (junctions,
+    mount points, directory symlinks on Windows), using an lstat result.
+    """
+    if stat.S_ISLNK(st.st_mode):
+        return True
+    return stat.S_ISDIR(st.st_mode) and bool(getattr(st, 'st_file_attributes', 0) & FILE_ATTRIBUTE_REPARSE_POINT)
+
+def is_link_entry(entry):
+    if entry.is_symlink():
+        return True
+    if hasattr(entry, 'is_junction') and entry.is_junction():
+        return True
+    if sys.platform == "win32":
+        # DirEntry.stat is cached on Windows, so this costs no system call
+        return is_link_stat(entry.stat(follow_symlinks=False))
+    return False
+
+def entry_lstat(entry):
+    """
+    lstat of a scandir entry with st_dev, st_ino and st_nlink filled in.
+    DirEntry.stat leaves them at 0 on Windows, so there it costs a real lstat.
+    """
+    st = entry.stat(follow_symlinks=False)
+    if st.st_ino == 0:
+        st = os.lstat(entry.path)
+    return st
+
+def remove_link(path):
+    try:
+        os.unlink(path)
+    except OSError:
+        if sys.platform != "win32":
+            raise
+        # Directory junctions and directory symlinks
+        os.rmdir(path)
+
+def first_link_seen(st, counted):
+    """
+    False for a hard link to a file already in counted. Records files with
+    several links, so a file is still recognised after the others were deleted
+    and its link count dropped to 1.
+    """
+    key = (st.st_dev, st.st_ino)
+    if key in counted:
+        return False
+    if st.st_nlink > 1:
+        counted.add(key)
+    return True
+
+
+class SafeWalker:
+    """
+    Directory walker that never follows symlinks or junctions and lists each
+    directory at most once by (device, inode). Hard-linked files are counted
+    once by count_once. One walker can be shared by several walks so that
+    both checks span all of them; passing the same counted set to several
+    walkers shares only the hard-link check.
+    """
+    def __init__(self, should_stop=None, dedupe_hard_links=True, counted=None):
+        self.should_stop = should_stop or (lambda: False)
+        self.dedupe_hard_links = dedupe_hard_links
+        self.visited = set()
+        self.counted = counted if counted is not None else set()
+
+    def visit(self, st):
+        """
+        Record a directory. Returns False if it was already visited.
+        """
+        key = (st.st_dev, st.st_ino)
+        if st.st_ino and key in self.visited:
+            return False
+        self.visited.add(key)
+        return True
+
+    def seen_before(self, st):
+        """
+        True for a hard link to a file already seen. Records the file otherwise.
+        """
+        return not first_link_seen(st, self.counted)
+
+    def count_once(self, st):
+        """
+        Bytes a file adds to a total: 0 for a hard link to a file already counted.
+        """
+        return 0 if self.seen_before(st) else st.st_size
+
+    def list_directory(self, path):
+        """
+        Return (subdirectory names, [(file name, lstat)], link names) for one
+        directory. Subdirectories already visited are left out.
+        """
+        dirnames = []
+        files = []
+        links = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if is_link_entry(entry):
+                        links.append(entry.name)
+                    elif entry.is_dir(follow_symlinks=False):
+                        if self.visit(entry_lstat(entry)):
+                            dirnames.append(entry.name)
+                    elif self.dedupe_hard_links:
+                        files.append((entry.name, entry_lstat(entry)))
+                    else:
+                        files.append((entry.name, entry.stat(follow_symlinks=False)))
+                except OSError:
+                    continue
+        return dirnames, files, links
+
+    def walk(self, top, topdown=True, onerror=None):
+        """
+        Like os.walk, but yields (dirpath, dirnames, files, links) where files
+        holds (name, lstat) pairs. Yields nothing when top is a link, not a
+        directory or already visited. Directories that cannot be listed are
+        skipped after passing the error to onerror, if given.
+        """
+        try:
+            st = os.lstat(top)
+        except OSError as e:
+            if onerror is not None:
+                onerror(e)
+            return
+        if is_link_stat(st) or not stat.S_ISDIR(st.st_mode) or not self.visit(st):
+            return
+        # Bottom-up walks push each result below its subdirectories
+        stack = [(top, None)]
+        while stack:
+            if self.should_stop():
+                return
+            path, result = stack.pop()
+            if result is not None:
+                yield result
+                continue
+            try:
+                dirnames, files, links = self.list_directory(path)
+            except OSError as e:
+                if onerror is not None:
+                    onerror(e)
+                continue
+            result = (path, dirnames, files, links)
+            if topdown:
+                yield result
+            else:
+                stack.append((path, result))
+            stack.extend((os.path.join(path, name), None) for name in reversed(dirnames))
+
+def tree_size(path, walker=None):
+    """
+    Bytes in a file or directory tree, without following links and counting
+    hard-linked files once.
+    """
+    walker = walker or SafeWalker()
+    st = os.lstat(path)
+    if is_link_stat(st):
+        return 0
+    if not stat.S_ISDIR(st.st_mode):
+        return walker.count_once(st)
+    total = 0
+    for root, dirs, files, links in walker.walk(path):
+        for name, file_st in files:
+            total += walker.count_once(file_st)
+    return total
+
+def remove_tree(path, walker=None):
+    """
+    Delete a directory tree. Links inside it are removed, never followed.
+    """
+    walker = walker or SafeWalker(dedupe_hard_links=False)
+    st = os.lstat(path)
+    if is_link_stat(st):
+        remove_link(path)
+        return
+    if not stat.S_ISDIR(st.st_mode):
+        os.unlink(path)
+        return
+    for root, dirs, files, links in walker.walk(path, topdown=False):
+        for name, file_st in files:
+            os.unlink(os.path.join(root, name))
+        for name in links:
+            remove_link(os.path.join(root, name))
+        os.rmdir(root)
@@ -0,0 +1,182 @@
+import os
+import time
+from array import array
+from bisect import bisect_right
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from scripts.TempFilesDeleter.safe_walk import SafeWalker, is_link_entry, entry_lstat
+
+# Values of the type column
+FILE = 0
+DIR = 1
+LINK = 2
+OTHER = 3
+# Hard link to a file already in the store; left out of totals and histograms
+DUPLICATE = 4
+
+SECONDS_PER_DAY = 24 * 60 * 60
+# Upper bounds of the histogram buckets; the last bucket is open-ended
+DEFAULT_AGE_BINS_DAYS = (1, 7, 30, 90, 365)
+DEFAULT_SIZE_BINS = (4 * 1024, 64 * 1024, 1024 * 1024, 16 * 1024 * 1024, 256 * 1024 * 1024, 1024 * 1024 * 1024)
+
+class ScanStore:
+    """
+    Scan results kept as one array per column instead of one object per entry.
+    Parent directories are interned and names are packed into a single buffer,
+    so an entry costs about 40 bytes plus its name. Aggregations run over the
+    columns directly, with numpy when it is installed.
+    """
+    def __init__(self):
+        self.sizes = array('q')
+        self.mtimes = array('q')
+        self.types = array('B')
+        self.root_ids = array('I')
+        self.parent_ids = array('I')
+        self.name_offsets = array('Q', [0])
+        self.names = bytearray()
+        self.roots = []
+        self.root_index = {}
+        self.parents = []
+        self.parent_index = {}
+        # Shared by every scan so directories and hard links are seen once across roots
+        self.walker = None
+
+    def __len__(self):
+        return len(self.sizes)
+
+    def intern_root(self, root):
+        index = self.root_index.get(root)
+        if index is None:
+            index = self.root_index[root] = len(self.roots)
+            self.roots.append(root)
+        return index
+
+    def intern_parent(self, parent):
+        index = self.parent_index.get(parent)
+        if index is None:
+            index = self.parent_index[parent] = len(self.parents)
+            self.parents.append(parent)
+        return index
+
+    def add(self, root_id, parent_id, name, size, mtime, kind=FILE):
+        self.sizes.append(size)
+        self.mtimes.append(int(mtime))
+        self.types.append(kind)
+        self.root_ids.append(root_id)
+        self.parent_ids.append(parent_id)
+        self.names += os.fsencode(name)
+        self.name_offsets.append(len(self.names))
+
+    def name(self, index):
+        return os.fsdecode(bytes(self.names[self.name_offsets[index]:self.name_offsets[index + 1]]))
+
+    def path(self, index):
+        return os.path.join(self.parents[self.parent_ids[index]], self.name(index))
+
+    def nbytes(self):
+        """
+        Memory held by the columns and the name buffer, not counting the
+        interned root and parent strings.
+        """
+        columns = (self.sizes, self.mtimes, self.types, self.root_ids, self.parent_ids, self.name_offsets)
+        return sum(column.itemsize * len(column) for column in columns) + len(self.names)
+
+    def scan(self, root, should_stop=None):
+        """
+        Add every entry below root to the store. Links and junctions are
+        recorded but not followed, and each directory is listed once.
+        """
+        if self.walker is None:
+            self.walker = SafeWalker()
+        should_stop = should_stop or (lambda: False)
+        root = os.path.abspath(os.path.expandvars(root))
+        root_id = self.intern_root(root)
+        try:
+            if not self.walker.visit(os.stat(root)):
+                return
+        except OSError:
+            return
+        stack = [root]
+        while stack and not should_stop():
+            current = stack.pop()
+            parent_id = self.intern_parent(current)
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            if is_link_entry(entry):
+                                kind, st = LINK, entry.stat(follow_symlinks=False)
+                            elif entry.is_dir(follow_symlinks=False):
+                                kind, st = DIR, entry_lstat(entry)
+                            elif entry.is_file(follow_symlinks=False):
+                                st = entry_lstat(entry)
+                                kind = DUPLICATE if self.walker.seen_before(st) else FILE
+                            else:
+                                kind, st = OTHER, entry.stat(follow_symlinks=False)
+                        except OSError:
+                            continue
+                        self.add(root_id, parent_id, entry.name,
+                                 st.st_size if kind in (FILE, DUPLICATE) else 0, st.st_mtime, kind)
+                        if kind == DIR and self.walker.visit(st):
+                            stack.append(entry.path)
+            except OSError:
+                continue
+
+    def column(self, name):
+        # Zero-copy numpy view of a column
+        column = getattr(self, name)
+        return numpy.frombuffer(column, dtype=column.typecode) if len(column) else numpy.zeros(0, column.typecode)
+
+    def totals_by_root(self):
+        """
+        Return {root: (bytes, files)} for every root in the store.
+        """
+        if numpy is not None:
+            is_file = self.column('types') == FILE
+            root_ids = self.column('root_ids')[is_file]
+            sizes = self.column('sizes')[is_file]
+            byte_totals = numpy.bincount(root_ids, weights=sizes, minlength=len(self.roots))
+            file_counts = numpy.bincount(root_ids, minlength=len(self.roots))
+            return {root: (int(byte_totals[i]), int(file_counts[i])) for i, root in enumerate(self.roots)}
+        byte_totals = [0] * len(self.roots)
+        file_counts = [0] * len(self.roots)
+        for root_id, size, kind in zip(self.root_ids, self.sizes, self.types):
+            if kind == FILE:
+                byte_totals[root_id] += size
+                file_counts[root_id] += 1
+        return {root: (byte_totals[i], file_counts[i]) for i, root in enumerate(self.roots)}
+
+    def histogram(self, values, bins):
+        """
+        Return (files, bytes) per bucket, where bucket i holds files whose value
+        is below bins[i] and the last bucket holds the rest.
+        """
+        if numpy is not None:
+            is_file = self.column('types') == FILE
+            buckets = numpy.digitize(values[is_file], bins)
+            sizes = self.column('sizes')[is_file]
+            counts = numpy.bincount(buckets, minlength=len(bins) + 1)
+            byte_totals = numpy.bincount(buckets, weights=sizes, minlength=len(bins) + 1)
+            return [int(count) for count in counts], [int(total) for total in byte_totals]
+        counts = [0] * (len(bins) + 1)
+        byte_totals = [0] * (len(bins) + 1)
+        for value, size, kind in zip(values, self.sizes, self.types):
+            if kind == FILE:
+                bucket = bisect_right(bins, value)
+                counts[bucket] += 1
+                byte_totals[bucket] += size
+        return counts, byte_totals
+
+    def age_histogram(self, bins_days=DEFAULT_AGE_BINS_DAYS, now=None):
+        now = int(now if now is not None else time.time())
+        bins = [days * SECONDS_PER_DAY for days in bins_days]
+        if numpy is not None:
+            return self.histogram(now - self.column('mtimes'), bins)
+        return self.histogram((now - mtime for mtime in self.mtimes), bins)
+
+    def size_histogram(self, bins=DEFAULT_SIZE_BINS):
+        return self.histogram(self.column('sizes') if numpy is not None else self.sizes, list(bins))
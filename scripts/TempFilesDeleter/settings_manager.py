@@ -1,5 +1,6 @@
 import os
 import json
+import copy
 
 ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 SETTINGS_DIR = os.path.join(ROOT_DIR, "settings")
@@ -8,6 +9,12 @@ USER_SETTINGS_DIR = os.path.join(SETTINGS_DIR, "UserSettings")
 USER_SETTINGS_FILE = os.path.join(USER_SETTINGS_DIR, "TempFileDSettings.json")
 DEFAULT_SETTINGS_FILE = os.path.join(DEFAULT_SETTINGS_DIR, "TempFileDSettings.json")
 
+MINIMAL_DEFAULT_SETTINGS = {'directories': {"%TEMP%": True}, 'move_to_trash': True, 'skip_errors': False, 'clear_recycle_bin': False,
+                            'background_mode': False, 'max_items_per_sec': 200, 'max_mb_per_sec': 20,
+                            'out_of_process': False, 'skip_in_use_files': True, 'time_budget_seconds': 0,
+                            'watch_mode': False, 'watch_max_mb': 500, 'watch_max_items': 10000, 'watch_thresholds': {},
+                            'agent_allowed_directories': []}
+
 def load_settings():
     if os.path.exists(USER_SETTINGS_FILE):
         with open(USER_SETTINGS_FILE, 'r') as f:
@@ -24,7 +31,7 @@ def fetch_default_settings():
         print("Successfully loaded default settings from file.")
     else:
         print("Default settings file not found. Using minimal default settings.")
-        settings = {'directories': {"%TEMP%": True}, 'move_to_trash': True, 'skip_errors': False, 'clear_recycle_bin': False}
+        settings = copy.deepcopy(MINIMAL_DEFAULT_SETTINGS)
     
     # Save to user settings
     with open(USER_SETTINGS_FILE, 'w') as f:
@@ -0,0 +1,73 @@
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from scripts.TempFilesDeleter.settings_manager import (load_settings, save_settings, fetch_default_settings,
+                                                       MINIMAL_DEFAULT_SETTINGS)
+
+# Settings passed straight through to CleanupEngine
+JOB_KEYS = ['move_to_trash', 'skip_errors', 'background_mode', 'max_items_per_sec', 'max_mb_per_sec', 'skip_in_use_files',
+            'time_budget_seconds']
+
+class SettingsModel(QObject):
+    """
+    Single in-memory copy of the Temp Files settings shared by every settings
+    view. Every change is saved and announced through `changed` with the key
+    that changed ("" when everything may have changed).
+    """
+    changed = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.settings = load_settings()
+
+    def get(self, key):
+        return self.settings.get(key, MINIMAL_DEFAULT_SETTINGS.get(key))
+
+    def set(self, key, value):
+        if self.settings.get(key) == value:
+            return
+        self.settings[key] = value
+        self.save_and_notify(key)
+
+    @property
+    def directories(self):
+        return self.settings.setdefault('directories', {})
+
+    def set_directory(self, directory, enabled):
+        if self.directories.get(directory) == enabled:
+            return
+        self.directories[directory] = enabled
+        self.save_and_notify('directories')
+
+    def set_all_directories(self, enabled):
+        for directory in self.directories:
+            self.directories[directory] = enabled
+        self.save_and_notify('directories')
+
+    def add_directory(self, directory):
+        if not directory or directory in self.directories:
+            return False
+        self.directories[directory] = True
+        self.save_and_notify('directories')
+        return True
+
+    def remove_directory(self, directory):
+        if directory not in self.directories:
+            return
+        del self.directories[directory]
+        self.save_and_notify('directories')
+
+    def reset(self):
+        self.settings = fetch_default_settings()
+        self.save_and_notify('')
+
+    def cleanup_job(self):
+        """
+        Return the current settings as CleanupEngine keyword arguments.
+        """
+        job = {key: self.get(key) for key in JOB_KEYS}
+        job['directories'] = dict(self.directories)
+        return job
+
+    def save_and_notify(self, key):
+        save_settings(self.settings)
+        self.changed.emit(key)
@@ -0,0 +1,286 @@
+import os
+import json
+import time
+import heapq
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from scripts.TempFilesDeleter.safe_walk import SafeWalker, is_link_entry, entry_lstat
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+CACHE_DIR = os.path.join(ROOT_DIR, "cache")
+CACHE_FILE = os.path.join(CACHE_DIR, "space_analyzer.json")
+
+DEFAULT_WORKERS = 8
+DEFAULT_TOP_N = 20
+# Minimum time between two partial results
+PARTIAL_INTERVAL = 0.25
+# Entries estimate_tree_size looks at before extrapolating
+ESTIMATE_MAX_ENTRIES = 2000
+
+def format_size(size):
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+class DirectoryCache:
+    """
+    Per-directory scan records keyed by path and validated by the directory's
+    mtime. A directory whose mtime has not changed is not listed again; only its
+    subdirectories are checked. Files modified in place do not change their
+    directory's mtime, so their new size is picked up on the next real change.
+    Shared by the analyzer and cleanup threads, so changes go through a lock.
+    """
+    def __init__(self, path=CACHE_FILE):
+        self.path = path
+        self.records = {}
+        self.loaded = False
+        self.lock = threading.Lock()
+
+    def load(self):
+        with self.lock:
+            if self.loaded:
+                return
+            try:
+                with open(self.path, 'r') as f:
+                    self.records = json.load(f)
+            except (OSError, ValueError):
+                self.records = {}
+            self.loaded = True
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp_path = self.path + ".tmp"
+        with self.lock:
+            with open(temp_path, 'w') as f:
+                json.dump(self.records, f, separators=(",", ":"))
+            os.replace(temp_path, self.path)
+
+    def get(self, path, mtime):
+        record = self.records.get(path)
+        if record is not None and record['mtime'] == mtime:
+            return record
+        return None
+
+    def put(self, path, record):
+        with self.lock:
+            self.records[path] = record
+
+    def prune(self, root, visited):
+        # Forget directories under root that no longer exist
+        prefix = root.rstrip(os.sep) + os.sep
+        with self.lock:
+            for path in [path for path in self.records if path.startswith(prefix) and path not in visited]:
+                del self.records[path]
+
+_cache = DirectoryCache()
+
+def get_directory_cache():
+    _cache.load()
+    return _cache
+
+def loaded_directory_cache():
+    # The shared cache if something already loaded it, without reading the file
+    return _cache if _cache.loaded else None
+
+
+class SpaceAnalyzer:
+    """
+    Sizes a directory tree with a pool of scandir workers. on_partial receives
+    the current result every PARTIAL_INTERVAL seconds while the scan runs.
+    Links and junctions are not followed, each directory is scanned once by
+    (device, inode) and hard-linked files are counted once.
+    """
+    def __init__(self, root, cache=None, workers=DEFAULT_WORKERS, top_n=DEFAULT_TOP_N,
+                 on_partial=None, should_stop=None):
+        self.root = os.path.abspath(os.path.expandvars(root))
+        self.cache = cache if cache is not None else get_directory_cache()
+        self.workers = workers
+        self.top_n = top_n
+        self.on_partial = on_partial or (lambda result: None)
+        self.should_stop = should_stop or (lambda: False)
+        self.totals = {}
+        self.top_files = []
+        self.visited_ids = set()
+        self.linked_seen = set()
+        self.file_count = 0
+        self.dir_count = 0
+        self.cached_dirs = 0
+        self.errors = 0
+
+    def scan_directory(self, path):
+        """
+        Return (record, from_cache, (device, inode)) for one directory, listing
+        it only when its mtime changed.
+        """
+        st = os.stat(path)
+        mtime = st.st_mtime_ns
+        record = self.cache.get(path, mtime)
+        if record is not None:
+            return record, True, (st.st_dev, st.st_ino)
+        own_bytes = 0
+        count = 0
+        subdirs = []
+        top_files = []
+        linked = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    link = is_link_entry(entry)
+                    if not link and entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                        continue
+                    entry_st = entry_lstat(entry)
+                except OSError:
+                    continue
+                size = entry_st.st_size
+                if entry_st.st_nlink > 1 and not link:
+                    linked.append((entry_st.st_dev, entry_st.st_ino, size))
+                own_bytes += size
+                count += 1
+                if len(top_files) < self.top_n:
+                    heapq.heappush(top_files, (size, entry.name))
+                elif size > top_files[0][0]:
+                    heapq.heapreplace(top_files, (size, entry.name))
+        record = {'mtime': mtime, 'bytes': own_bytes, 'count': count,
+                  'subdirs': subdirs, 'top_files': top_files, 'linked': linked}
+        self.cache.put(path, record)
+        return record, False, (st.st_dev, st.st_ino)
+
+    def add_record(self, path, record):
+        self.dir_count += 1
+        self.file_count += record['count']
+        # Add this directory's own bytes to itself and every ancestor up to the root
+        own_bytes = record['bytes'] - linked_duplicates(record, self.linked_seen)
+        current = path
+        while True:
+            self.totals[current] = self.totals.get(current, 0) + own_bytes
+            if current == self.root:
+                break
+            current = os.path.dirname(current)
+        for size, name in record['top_files']:
+            item = (size, os.path.join(path, name))
+            if len(self.top_files) < self.top_n:
+                heapq.heappush(self.top_files, item)
+            elif size > self.top_files[0][0]:
+                heapq.heapreplace(self.top_files, item)
+
+    def result(self, complete=False):
+        top_dirs = heapq.nlargest(self.top_n, ((size, path) for path, size in self.totals.items()
+                                               if path != self.root))
+        return {
+            'root': self.root,
+            'total': self.totals.get(self.root, 0),
+            'files': self.file_count,
+            'dirs': self.dir_count,
+            'cached_dirs': self.cached_dirs,
+            'errors': self.errors,
+            'top_dirs': top_dirs,
+            'top_files': sorted(self.top_files, reverse=True),
+            'complete': complete,
+        }
+
+    def run(self):
+        visited = set()
+        last_partial = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            pending = {pool.submit(self.scan_directory, self.root): self.root}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path = pending.pop(future)
+                    try:
+                        record, from_cache, directory_id = future.result()
+                    except OSError:
+                        self.errors += 1
+                        continue
+                    if directory_id in self.visited_ids:
+                        # Same directory reached through another mount
+                        continue
+                    self.visited_ids.add(directory_id)
+                    visited.add(path)
+                    self.cached_dirs += from_cache
+                    self.add_record(path, record)
+                    if not self.should_stop():
+                        for name in record['subdirs']:
+                            subdir = os.path.join(path, name)
+                            pending[pool.submit(self.scan_directory, subdir)] = subdir
+                now = time.monotonic()
+                if now - last_partial >= PARTIAL_INTERVAL:
+                    last_partial = now
+                    self.on_partial(self.result())
+        complete = not self.should_stop()
+        if complete:
+            self.cache.prune(self.root, visited)
+        return self.result(complete)
+
+
+def linked_duplicates(record, seen):
+    """
+    Bytes of the record's hard-linked files already counted elsewhere. Adds the
+    others to seen.
+    """
+    duplicates = 0
+    for dev, ino, size in record.get('linked', ()):
+        if (dev, ino) in seen:
+            duplicates += size
+        else:
+            seen.add((dev, ino))
+    return duplicates
+
+def cached_tree_size(path, cache=None):
+    """
+    Size of a directory tree from the analyzer cache alone, without touching the
+    disk. Parts of the tree that were never analyzed count as 0.
+    """
+    cache = cache if cache is not None else get_directory_cache()
+    total = 0
+    linked_seen = set()
+    stack = [os.path.abspath(path)]
+    while stack:
+        current = stack.pop()
+        record = cache.records.get(current)
+        if record is None:
+            continue
+        total += record['bytes'] - linked_duplicates(record, linked_seen)
+        stack.extend(os.path.join(current, name) for name in record['subdirs'])
+    return total
+
+def estimate_tree_size(path, cache=None, max_entries=ESTIMATE_MAX_ENTRIES, should_stop=None):
+    """
+    Quick size estimate of a directory tree. Returns (bytes, entries listed).
+    Uses the given analyzer cache when the tree was analyzed since the
+    directory last changed. Otherwise lists the tree breadth first until
+    max_entries entries were seen or should_stop returns True, and
+    extrapolates the average size of the listed directories to the ones
+    still unlisted.
+    """
+    should_stop = should_stop or (lambda: False)
+    path = os.path.abspath(path)
+    try:
+        if cache is not None and cache.get(path, os.stat(path).st_mtime_ns) is not None:
+            return cached_tree_size(path, cache), 0
+    except OSError:
+        return 0, 0
+    walker = SafeWalker()
+    total = 0
+    listed = 0
+    seen = 0
+    queue = deque([path])
+    while queue and seen < max_entries and not should_stop():
+        current = queue.popleft()
+        try:
+            dirnames, files, links = walker.list_directory(current)
+        except OSError:
+            continue
+        listed += 1
+        seen += len(dirnames) + len(files) + len(links)
+        total += sum(walker.count_once(st) for name, st in files)
+        queue.extend(os.path.join(current, name) for name in dirnames)
+    if queue and listed:
+        total += total * len(queue) // listed
+    return total, seen
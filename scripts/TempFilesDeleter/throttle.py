@@ -0,0 +1,168 @@
+import os
+import sys
+import time
+import threading
+import subprocess
+
+# Never slow down below this fraction of the configured rates
+MIN_SPEED_FACTOR = 0.1
+# Longest single sleep, so a throttled worker still notices when it is stopped
+MAX_SLEEP = 0.25
+
+
+class TokenBucket:
+    """
+    Token bucket limiting a rate (units per second). A rate of 0 means unlimited.
+    """
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity is not None else max(self.rate, 1.0)
+        self.tokens = self.capacity
+        self.timestamp = time.monotonic()
+
+    def consume(self, amount, speed_factor=1.0, should_stop=None):
+        """
+        Block until `amount` tokens are available. Requests larger than the
+        bucket put it into debt, so the following requests pay for them.
+        """
+        if self.rate <= 0:
+            return
+        rate = self.rate * speed_factor
+        needed = min(amount, self.capacity)
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.timestamp) * rate)
+            self.timestamp = now
+            if self.tokens >= needed:
+                self.tokens -= amount
+                return
+            if should_stop is not None and should_stop():
+                return
+            time.sleep(min((needed - self.tokens) / rate, MAX_SLEEP))
+
+
+class LoadMonitor:
+    """
+    Samples system load and disk activity and turns them into a speed factor
+    between MIN_SPEED_FACTOR and 1.0.
+    """
+    def __init__(self, interval=1.0):
+        self.interval = interval
+        self.cpu_count = os.cpu_count() or 1
+        self.last_sample = 0.0
+        self.factor_value = 1.0
+        self.disk_ticks = self._read_disk_ticks()
+        self.disk_timestamp = time.monotonic()
+        self.latency = None
+        self.baseline_latency = None
+
+    def record_latency(self, seconds):
+        """
+        Record how long a single delete took. Used as a disk latency signal on
+        platforms without /proc/diskstats.
+        """
+        if self.latency is None:
+            self.latency = seconds
+        else:
+            self.latency = 0.8 * self.latency + 0.2 * seconds
+        if self.baseline_latency is None or self.latency < self.baseline_latency:
+            self.baseline_latency = max(self.latency, 1e-5)
+
+    def factor(self):
+        now = time.monotonic()
+        if now - self.last_sample < self.interval:
+            return self.factor_value
+        self.last_sample = now
+
+        factor = 1.0
+        load = self._cpu_load()
+        if load is not None and load > 0.75:
+            factor = min(factor, 0.75 / load)
+        busy = self._disk_busy(now)
+        if busy is not None and busy > 0.5:
+            factor = min(factor, 0.5 / busy)
+        if self.latency is not None and self.baseline_latency:
+            ratio = self.latency / self.baseline_latency
+            if ratio > 2.0:
+                factor = min(factor, 2.0 / ratio)
+
+        self.factor_value = max(MIN_SPEED_FACTOR, factor)
+        return self.factor_value
+
+    def _cpu_load(self):
+        if not hasattr(os, "getloadavg"):
+            return None
+        try:
+            return os.getloadavg()[0] / self.cpu_count
+        except OSError:
+            return None
+
+    def _disk_busy(self, now):
+        ticks = self._read_disk_ticks()
+        if ticks is None or self.disk_ticks is None:
+            return None
+        elapsed_ms = (now - self.disk_timestamp) * 1000
+        busy = max((ticks[dev] - self.disk_ticks.get(dev, ticks[dev])) for dev in ticks) if ticks else 0
+        self.disk_ticks = ticks
+        self.disk_timestamp = now
+        if elapsed_ms <= 0:
+            return None
+        return busy / elapsed_ms
+
+    @staticmethod
+    def _read_disk_ticks():
+        # Field 13 of /proc/diskstats is the time (ms) the device spent doing I/O
+        try:
+            with open("/proc/diskstats", "r") as f:
+                ticks = {}
+                for line in f:
+                    fields = line.split()
+                    if len(fields) >= 13 and not fields[2].startswith(("loop", "ram")):
+                        ticks[fields[2]] = int(fields[12])
+                return ticks
+        except OSError:
+            return None
+
+
+class BackgroundThrottle:
+    """
+    Rate limits deletes by items/sec and MB/sec, backing off when the system is busy.
+    """
+    def __init__(self, max_items_per_sec, max_mb_per_sec, should_stop=None):
+        self.items = TokenBucket(max_items_per_sec)
+        self.bytes = TokenBucket(max_mb_per_sec * 1024 * 1024)
+        self.monitor = LoadMonitor()
+        self.should_stop = should_stop
+
+    def wait(self, size):
+        speed_factor = self.monitor.factor()
+        self.items.consume(1, speed_factor, self.should_stop)
+        self.bytes.consume(size, speed_factor, self.should_stop)
+
+    def record(self, seconds):
+        self.monitor.record_latency(seconds)
+
+
+def lower_thread_priority():
+    """
+    Lower the CPU and I/O priority of the calling thread.
+    """
+    if sys.platform == "win32":
+        import ctypes
+        THREAD_MODE_BACKGROUND_BEGIN = 0x00010000
+        kernel32 = ctypes.windll.kernel32
+        kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_MODE_BACKGROUND_BEGIN)
+        return
+
+    # On Linux every thread has its own nice value and I/O class
+    tid = threading.get_native_id()
+    try:
+        os.setpriority(os.PRIO_PROCESS, tid, 19)
+    except (AttributeError, OSError):
+        pass
+    if sys.platform.startswith("linux"):
+        try:
+            subprocess.run(["ionice", "-c", "3", "-p", str(tid)],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        except OSError:
+            pass
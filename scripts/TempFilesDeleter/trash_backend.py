@@ -0,0 +1,314 @@
+import os
+import sys
+import stat
+import time
+from urllib.parse import quote
+
+import send2trash
+
+from scripts.TempFilesDeleter.safe_walk import SafeWalker, remove_tree, tree_size
+
+class TrashBackend:
+    """
+    Moves files to the platform trash, reports its size and empties it.
+    """
+    # Whether empty() does anything on this platform
+    supports_empty = False
+
+    def __init__(self):
+        # (path, exception) for each entry the last empty() could not remove
+        self.empty_failures = []
+
+    def trash(self, path):
+        failures = self.trash_many([path])
+        if failures:
+            raise failures[0][1]
+
+    def trash_many(self, paths):
+        """
+        Trash several paths at once. Returns a list of (path, exception) for the
+        paths that could not be trashed.
+        """
+        failures = []
+        for path in paths:
+            try:
+                send2trash.send2trash(path)
+            except Exception as e:
+                failures.append((path, e))
+        return failures
+
+    def query_size(self):
+        """
+        Return (item count, total bytes) currently in the trash.
+        """
+        return 0, 0
+
+    def empty(self, on_progress=None, should_stop=None):
+        """
+        Empty the trash. on_progress receives a fraction between 0 and 1 and
+        should_stop is polled between items so the job can be cancelled.
+        Returns the number of items removed.
+        """
+        return 0
+
+
+class WindowsTrashBackend(TrashBackend):
+    """
+    Recycle Bin via the shell API. Emptying goes drive by drive, which is the
+    finest granularity SHEmptyRecycleBinW offers for progress and cancellation.
+    """
+    SHERB_NOCONFIRMATION = 0x1
+    SHERB_NOPROGRESSUI = 0x2
+    SHERB_NOSOUND = 0x4
+    supports_empty = True
+
+    def __init__(self):
+        super().__init__()
+        import ctypes
+        from ctypes import wintypes
+        self.ctypes = ctypes
+        self.shell32 = ctypes.windll.shell32
+        self.kernel32 = ctypes.windll.kernel32
+
+        class SHQUERYRBINFO(ctypes.Structure):
+            # shellapi.h packs this struct to 1 byte on 32-bit Windows
+            _pack_ = 8 if ctypes.sizeof(ctypes.c_void_p) == 8 else 1
+            _fields_ = [("cbSize", wintypes.DWORD),
+                        ("i64Size", ctypes.c_longlong),
+                        ("i64NumItems", ctypes.c_longlong)]
+        self.SHQUERYRBINFO = SHQUERYRBINFO
+
+    def trash_many(self, paths):
+        # One shell operation for the whole batch is much faster than one per file
+        try:
+            send2trash.send2trash(list(paths))
+            return []
+        except Exception:
+            return super().trash_many([path for path in paths if os.path.lexists(path)])
+
+    def drives(self):
+        mask = self.kernel32.GetLogicalDrives()
+        return [f"{chr(ord('A') + i)}:\\" for i in range(26) if mask & (1 << i)]
+
+    def query_drive(self, root):
+        info = self.SHQUERYRBINFO()
+        info.cbSize = self.ctypes.sizeof(info)
+        if self.shell32.SHQueryRecycleBinW(root, self.ctypes.byref(info)) != 0:
+            return 0, 0
+        return info.i64NumItems, info.i64Size
+
+    def query_size(self):
+        return self.query_drive(None)
+
+    def empty(self, on_progress=None, should_stop=None):
+        drives = [(root, *self.query_drive(root)) for root in self.drives()]
+        drives = [drive for drive in drives if drive[1] > 0]
+        total_bytes = sum(size for _, _, size in drives) or 1
+        done_bytes = 0
+        removed = 0
+        self.empty_failures = []
+        flags = self.SHERB_NOCONFIRMATION | self.SHERB_NOPROGRESSUI | self.SHERB_NOSOUND
+        for root, items, size in drives:
+            if should_stop is not None and should_stop():
+                break
+            result = self.shell32.SHEmptyRecycleBinW(None, root, flags)
+            done_bytes += size
+            if on_progress is not None:
+                on_progress(done_bytes / total_bytes)
+            # S_OK, or E_UNEXPECTED when the bin was emptied in the meantime
+            if result not in (0, -2147418113):
+                self.empty_failures.append(
+                    (root, OSError(f"Could not empty the recycle bin (HRESULT {result & 0xFFFFFFFF:#010x})")))
+                continue
+            removed += items
+        return removed
+
+
+class FreedesktopTrashBackend(TrashBackend):
+    """
+    freedesktop.org Trash (XDG trash spec). Files are renamed into the trash of
+    their own volume, so trashing never copies data.
+    """
+    supports_empty = True
+
+    def __init__(self):
+        super().__init__()
+        data_home = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+        self.home_trash = os.path.join(data_home, "Trash")
+        self.uid = os.getuid()
+        self.trash_dirs = {}
+
+    def trash_many(self, paths):
+        failures = []
+        groups = {}
+        for path in paths:
+            path = os.path.abspath(path)
+            try:
+                trash_dir, topdir = self.trash_dir_for(path)
+            except OSError as e:
+                failures.append((path, e))
+                continue
+            if trash_dir is None:
+                # No usable trash on that volume, fall back to a copying trash
+                failures.extend(super().trash_many([path]))
+                continue
+            groups.setdefault((trash_dir, topdir), []).append(path)
+
+        for (trash_dir, topdir), group in groups.items():
+            failures.extend(self.trash_group(trash_dir, topdir, group))
+        return failures
+
+    def trash_group(self, trash_dir, topdir, paths):
+        files_dir = os.path.join(trash_dir, "files")
+        info_dir = os.path.join(trash_dir, "info")
+        os.makedirs(files_dir, mode=0o700, exist_ok=True)
+        os.makedirs(info_dir, mode=0o700, exist_ok=True)
+
+        # List the trash once for the whole batch instead of probing per file
+        taken = set(os.listdir(files_dir))
+        taken.update(name[:-len(".trashinfo")] for name in os.listdir(info_dir) if name.endswith(".trashinfo"))
+        deletion_date = time.strftime("%Y-%m-%dT%H:%M:%S")
+
+        # Write all metadata first, then do the renames
+        reserved = []
+        failures = []
+        for path in paths:
+            original = os.path.relpath(path, topdir) if topdir is not None else path
+            info = f"[Trash Info]\nPath={quote(original)}\nDeletionDate={deletion_date}\n".encode("utf-8")
+            try:
+                name = self.reserve_name(info_dir, os.path.basename(path), taken, info)
+                reserved.append((path, name))
+            except OSError as e:
+                failures.append((path, e))
+
+        for path, name in reserved:
+            try:
+                os.rename(path, os.path.join(files_dir, name))
+            except OSError as e:
+                os.unlink(os.path.join(info_dir, name + ".trashinfo"))
+                failures.append((path, e))
+        return failures
+
+    @staticmethod
+    def reserve_name(info_dir, base_name, taken, info):
+        name = base_name
+        counter = 1
+        while True:
+            if name not in taken:
+                try:
+                    fd = os.open(os.path.join(info_dir, name + ".trashinfo"),
+                                 os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+                except FileExistsError:
+                    pass
+                else:
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(info)
+                    taken.add(name)
+                    return name
+            counter += 1
+            name = f"{base_name}.{counter}"
+
+    def trash_dir_for(self, path):
+        """
+        Return (trash directory, topdir) for a path. topdir is None for the home
+        trash, and trash directory is None when the volume has no usable trash.
+        """
+        device = os.lstat(path).st_dev
+        if device in self.trash_dirs:
+            return self.trash_dirs[device]
+
+        home_base = self.home_trash if os.path.exists(self.home_trash) else os.path.dirname(self.home_trash)
+        os.makedirs(home_base, exist_ok=True)
+        if os.stat(home_base).st_dev == device:
+            result = (self.home_trash, None)
+        else:
+            topdir = self.mount_point(path)
+            result = (self.topdir_trash(topdir), topdir)
+        self.trash_dirs[device] = result
+        return result
+
+    @staticmethod
+    def mount_point(path):
+        path = os.path.realpath(os.path.dirname(path))
+        while not os.path.ismount(path):
+            path = os.path.dirname(path)
+        return path
+
+    def topdir_trash(self, topdir):
+        shared = os.path.join(topdir, ".Trash")
+        try:
+            st = os.lstat(shared)
+            if stat.S_ISDIR(st.st_mode) and st.st_mode & stat.S_ISVTX:
+                user_trash = os.path.join(shared, str(self.uid))
+                os.makedirs(user_trash, mode=0o700, exist_ok=True)
+                return user_trash
+        except OSError:
+            pass
+        user_trash = os.path.join(topdir, f".Trash-{self.uid}")
+        try:
+            os.makedirs(user_trash, mode=0o700, exist_ok=True)
+        except OSError:
+            return None
+        return user_trash
+
+    def existing_trash_dirs(self):
+        trash_dirs = [self.home_trash]
+        try:
+            with open("/proc/mounts", "r") as f:
+                mounts = [line.split()[1].replace("\\040", " ") for line in f]
+        except OSError:
+            mounts = []
+        for topdir in mounts:
+            trash_dirs.append(os.path.join(topdir, ".Trash", str(self.uid)))
+            trash_dirs.append(os.path.join(topdir, f".Trash-{self.uid}"))
+        return [d for d in dict.fromkeys(trash_dirs) if os.path.isdir(os.path.join(d, "files"))]
+
+    def entries(self):
+        for trash_dir in self.existing_trash_dirs():
+            files_dir = os.path.join(trash_dir, "files")
+            for name in os.listdir(files_dir):
+                yield trash_dir, name
+
+    def query_size(self):
+        items = 0
+        total = 0
+        walker = SafeWalker()
+        for trash_dir, name in self.entries():
+            items += 1
+            total += tree_size(os.path.join(trash_dir, "files", name), walker)
+        return items, total
+
+    def empty(self, on_progress=None, should_stop=None):
+        entries = list(self.entries())
+        self.empty_failures = []
+        removed = 0
+        for done, (trash_dir, name) in enumerate(entries, 1):
+            if should_stop is not None and should_stop():
+                break
+            path = os.path.join(trash_dir, "files", name)
+            try:
+                remove_tree(path)
+            except OSError as e:
+                # Keep going; whatever is left of the entry stays in the trash
+                self.empty_failures.append((path, e))
+                continue
+            finally:
+                if on_progress is not None:
+                    on_progress(done / len(entries))
+            try:
+                os.unlink(os.path.join(trash_dir, "info", name + ".trashinfo"))
+            except FileNotFoundError:
+                pass
+            removed += 1
+        return removed
+
+
+def get_trash_backend():
+    if sys.platform == "win32":
+        return WindowsTrashBackend()
+    if sys.platform.startswith("linux"):
+        return FreedesktopTrashBackend()
+    return TrashBackend()
+
+def can_empty_trash():
+    return get_trash_backend().supports_empty
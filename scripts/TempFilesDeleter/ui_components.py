@@ -1,66 +1,155 @@
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QCheckBox, 
-                             QLineEdit, QLabel, QScrollArea, QFrame)
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QCheckBox,
+                             QLineEdit, QScrollArea, QFrame, QMessageBox, QLabel, QTreeWidget,
+                             QTreeWidgetItem, QFileDialog, QSpinBox)
 from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QIcon
 import os
 
-def create_settings_widget(parent, directories, move_to_trash, skip_errors, clear_recycle_bin, 
-                           update_skip_errors, update_move_to_trash, update_clear_recycle_bin, 
-                           update_directories, confirm_delete_directory, add_directory, reset_settings):
-    settings_widget = QScrollArea()
-    settings_widget.setWidgetResizable(True)
-    settings_widget.setFrameShape(QFrame.Shape.NoFrame)
-    
-    settings_content = QWidget()
-    settings_layout = QVBoxLayout(settings_content)
-
-    skip_errors_checkbox = QCheckBox("Skip errors")
-    skip_errors_checkbox.setObjectName("skip_errors_checkbox")
-    skip_errors_checkbox.setChecked(skip_errors)
-    skip_errors_checkbox.stateChanged.connect(update_skip_errors)
-    settings_layout.addWidget(skip_errors_checkbox)
-
-    move_to_trash_checkbox = QCheckBox("Move files to trash")
-    move_to_trash_checkbox.setObjectName("move_to_trash_checkbox")
-    move_to_trash_checkbox.setChecked(move_to_trash)
-    move_to_trash_checkbox.stateChanged.connect(update_move_to_trash)
-    settings_layout.addWidget(move_to_trash_checkbox)
-
-    clear_recycle_bin_checkbox = QCheckBox("Clear recycle bin after")
-    clear_recycle_bin_checkbox.setObjectName("clear_recycle_bin_checkbox")
-    clear_recycle_bin_checkbox.setChecked(clear_recycle_bin)
-    clear_recycle_bin_checkbox.stateChanged.connect(update_clear_recycle_bin)
-    settings_layout.addWidget(clear_recycle_bin_checkbox)
-
-    directories_header = QWidget()
-    directories_header_layout = QHBoxLayout(directories_header)
-    toggle_all_checkbox = QCheckBox("Toggle all Directories:")
-    toggle_all_checkbox.setChecked(all(directories.values()))
-    toggle_all_checkbox.stateChanged.connect(lambda state: toggle_all_directories(state, directories, directories_layout, update_directories))
-    directories_header_layout.addWidget(toggle_all_checkbox)
-    settings_layout.addWidget(directories_header)
-
-    directories_layout = QVBoxLayout()
-    for directory in directories:
-        add_directory_to_layout(directory, directories, directories_layout, update_directories, confirm_delete_directory)
-    settings_layout.addLayout(directories_layout)
-
-    add_directory_layout = QHBoxLayout()
-    new_directory_input = QLineEdit()
-    add_button = QPushButton("Add")
-    add_button.clicked.connect(lambda: add_directory(new_directory_input.text()))
-    add_directory_layout.addWidget(new_directory_input)
-    add_directory_layout.addWidget(add_button)
-    settings_layout.addLayout(add_directory_layout)
-
-    reset_button = QPushButton("Reset Settings")
-    reset_button.clicked.connect(reset_settings)
-    settings_layout.addWidget(reset_button)
-
-    settings_layout.addStretch(1)
-    settings_widget.setWidget(settings_content)
-    
-    return settings_widget, toggle_all_checkbox, directories_layout, new_directory_input
+from scripts.TempFilesDeleter.asset_cache import get_icon
+from scripts.TempFilesDeleter.analyzer_thread import AnalyzerThread
+from scripts.TempFilesDeleter.space_analyzer import format_size
+from scripts.TempFilesDeleter.trash_backend import can_empty_trash
+from scripts.TempFilesDeleter.open_files import open_file_detection_available
+
+# (settings key, label) for each option checkbox
+OPTION_CHECKBOXES = [
+    ('skip_errors', "Skip errors"),
+    ('move_to_trash', "Move files to trash"),
+    ('clear_recycle_bin', "Clear recycle bin after"),
+    ('background_mode', "Background mode (throttled, low priority)"),
+    ('out_of_process', "Run cleanup in a separate process"),
+    ('skip_in_use_files', "Skip files that are in use"),
+    ('watch_mode', "Watch directories and clean them when they grow"),
+]
+
+class SettingsView(QScrollArea):
+    """
+    Settings editor bound to a SettingsModel. Several views can share one model
+    and stay in sync through its `changed` signal.
+    """
+    def __init__(self, model, parent=None):
+        super().__init__(parent)
+        self.model = model
+        self.setWidgetResizable(True)
+        self.setFrameShape(QFrame.Shape.NoFrame)
+
+        settings_content = QWidget()
+        settings_layout = QVBoxLayout(settings_content)
+
+        self.option_checkboxes = {}
+        for key, label in OPTION_CHECKBOXES:
+            checkbox = QCheckBox(label)
+            checkbox.setObjectName(f"{key}_checkbox")
+            checkbox.setChecked(bool(model.get(key)))
+            checkbox.stateChanged.connect(lambda state, key=key: self.model.set(key, state == Qt.CheckState.Checked.value))
+            settings_layout.addWidget(checkbox)
+            self.option_checkboxes[key] = checkbox
+        # No way to empty the trash on this platform
+        self.option_checkboxes['clear_recycle_bin'].setVisible(can_empty_trash())
+        if not open_file_detection_available():
+            in_use_checkbox = self.option_checkboxes['skip_in_use_files']
+            in_use_checkbox.setEnabled(False)
+            in_use_checkbox.setText("Skip files that are in use (unavailable: install psutil)")
+
+        time_budget_layout = QHBoxLayout()
+        time_budget_layout.addWidget(QLabel("Time budget (seconds, 0 = no limit):"))
+        self.time_budget_input = QSpinBox()
+        self.time_budget_input.setRange(0, 24 * 60 * 60)
+        self.time_budget_input.setValue(int(model.get('time_budget_seconds') or 0))
+        self.time_budget_input.valueChanged.connect(lambda value: self.model.set('time_budget_seconds', value))
+        time_budget_layout.addWidget(self.time_budget_input)
+        time_budget_layout.addStretch(1)
+        settings_layout.addLayout(time_budget_layout)
+
+        directories_header = QWidget()
+        directories_header_layout = QHBoxLayout(directories_header)
+        self.toggle_all_checkbox = QCheckBox("Toggle all Directories:")
+        self.toggle_all_checkbox.setChecked(all(model.directories.values()))
+        self.toggle_all_checkbox.stateChanged.connect(
+            lambda state: self.model.set_all_directories(state == Qt.CheckState.Checked.value))
+        directories_header_layout.addWidget(self.toggle_all_checkbox)
+        settings_layout.addWidget(directories_header)
+
+        self.directories_layout = QVBoxLayout()
+        self.rebuild_directories()
+        settings_layout.addLayout(self.directories_layout)
+
+        add_directory_layout = QHBoxLayout()
+        self.new_directory_input = QLineEdit()
+        self.new_directory_input.setPlaceholderText("Enter custom directory")
+        add_button = QPushButton("Add")
+        add_button.clicked.connect(self.add_directory)
+        add_directory_layout.addWidget(self.new_directory_input)
+        add_directory_layout.addWidget(add_button)
+        settings_layout.addLayout(add_directory_layout)
+
+        reset_button = QPushButton("Reset Settings")
+        reset_button.clicked.connect(self.confirm_reset)
+        settings_layout.addWidget(reset_button)
+
+        settings_layout.addStretch(1)
+        self.setWidget(settings_content)
+
+        model.changed.connect(self.sync_from_model)
+
+    def sync_from_model(self, key):
+        for option, checkbox in self.option_checkboxes.items():
+            if key in (option, ''):
+                checkbox.blockSignals(True)
+                checkbox.setChecked(bool(self.model.get(option)))
+                checkbox.blockSignals(False)
+        if key in ('time_budget_seconds', ''):
+            self.time_budget_input.blockSignals(True)
+            self.time_budget_input.setValue(int(self.model.get('time_budget_seconds') or 0))
+            self.time_budget_input.blockSignals(False)
+        if key in ('directories', ''):
+            self.toggle_all_checkbox.blockSignals(True)
+            self.toggle_all_checkbox.setChecked(all(self.model.directories.values()))
+            self.toggle_all_checkbox.blockSignals(False)
+            if list(self.directory_checkboxes) == list(self.model.directories):
+                for directory, checkbox in self.directory_checkboxes.items():
+                    checkbox.blockSignals(True)
+                    checkbox.setChecked(self.model.directories[directory])
+                    checkbox.blockSignals(False)
+            else:
+                self.rebuild_directories()
+
+    def rebuild_directories(self):
+        for i in reversed(range(self.directories_layout.count())):
+            widget = self.directories_layout.itemAt(i).widget()
+            if widget is not None:
+                self.directories_layout.removeWidget(widget)
+                widget.deleteLater()
+        self.directory_checkboxes = {}
+        for directory in self.model.directories:
+            self.directory_checkboxes[directory] = add_directory_to_layout(
+                directory, self.model.directories, self.directories_layout,
+                lambda dir, state: self.model.set_directory(dir, state == Qt.CheckState.Checked.value),
+                self.confirm_delete_directory)
+
+    def add_directory(self):
+        if self.model.add_directory(self.new_directory_input.text()):
+            self.new_directory_input.clear()
+
+    def confirm_delete_directory(self, directory):
+        reply = QMessageBox.question(
+            self.window(), 'Confirm Deletion',
+            f"Are you sure you want to delete the directory '{directory}' from settings?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            self.model.remove_directory(directory)
+
+    def confirm_reset(self):
+        reply = QMessageBox.question(
+            self.window(), 'Confirm Reset',
+            "Are you sure you want to reset settings to default?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            self.model.reset()
+            QMessageBox.information(self.window(), "Settings Reset", "Settings have been reset to default.")
 
 def add_directory_to_layout(directory, directories, directories_layout, update_directories, confirm_delete_directory):
     directory_widget = QWidget()
@@ -69,9 +158,9 @@ def add_directory_to_layout(directory, directories, directories_layout, update_d
 
     delete_button = QPushButton()
     delete_button.setFixedSize(20, 20)
-    icon_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "assets", "trash.png")
-    if os.path.exists(icon_path):
-        delete_button.setIcon(QIcon(icon_path))
+    trash_icon = get_icon("trash.png")
+    if not trash_icon.isNull():
+        delete_button.setIcon(trash_icon)
     delete_button.setIconSize(QSize(16, 16))
     delete_button.clicked.connect(lambda: confirm_delete_directory(directory))
     delete_button.setStyleSheet("""
@@ -92,15 +181,87 @@ def add_directory_to_layout(directory, directories, directories_layout, update_d
     directory_layout.addWidget(checkbox)
 
     directories_layout.addWidget(directory_widget)
+    return checkbox
+
+class SpaceAnalyzerView(QWidget):
+    """
+    Sizes a drive or folder and lists its largest directories and files while
+    the scan runs.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.thread = None
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        path_layout = QHBoxLayout()
+        self.path_input = QLineEdit(os.path.abspath(os.sep))
+        self.path_input.setPlaceholderText("Drive or folder to analyze")
+        browse_button = QPushButton("Browse")
+        browse_button.clicked.connect(self.browse)
+        self.scan_button = QPushButton("Analyze")
+        self.scan_button.clicked.connect(self.toggle_scan)
+        path_layout.addWidget(self.path_input)
+        path_layout.addWidget(browse_button)
+        path_layout.addWidget(self.scan_button)
+        layout.addLayout(path_layout)
+
+        self.status_label = QLabel("")
+        layout.addWidget(self.status_label)
+
+        lists_layout = QHBoxLayout()
+        self.dirs_list = self.create_list("Largest folders")
+        self.files_list = self.create_list("Largest files")
+        lists_layout.addWidget(self.dirs_list)
+        lists_layout.addWidget(self.files_list)
+        layout.addLayout(lists_layout)
+
+    @staticmethod
+    def create_list(title):
+        tree = QTreeWidget()
+        tree.setColumnCount(2)
+        tree.setHeaderLabels(["Size", title])
+        tree.setRootIsDecorated(False)
+        tree.setColumnWidth(0, 80)
+        return tree
+
+    def browse(self):
+        path = QFileDialog.getExistingDirectory(self, "Select folder", self.path_input.text())
+        if path:
+            self.path_input.setText(path)
+
+    def toggle_scan(self):
+        if self.thread is not None and self.thread.isRunning():
+            self.thread.requestInterruption()
+            self.scan_button.setEnabled(False)
+            return
+        self.thread = AnalyzerThread(self.path_input.text())
+        self.thread.partial.connect(self.show_result)
+        self.thread.error.connect(self.status_label.setText)
+        self.thread.finished.connect(self.scan_finished)
+        self.scan_button.setText("Stop")
+        self.status_label.setText("Scanning...")
+        self.thread.start()
+
+    def stop(self):
+        if self.thread is not None and self.thread.isRunning():
+            self.thread.requestInterruption()
+            self.thread.wait()
+
+    def scan_finished(self, result):
+        self.scan_button.setText("Analyze")
+        self.scan_button.setEnabled(True)
+        self.show_result(result, "Done" if result['complete'] else "Stopped")
 
-def toggle_all_directories(state, directories, directories_layout, update_directories):
-    checked = state == Qt.CheckState.Checked.value
-    for i in range(directories_layout.count()):
-        widget = directories_layout.itemAt(i).widget()
-        if isinstance(widget, QWidget):
-            checkbox = widget.findChild(QCheckBox)
-            if checkbox:
-                checkbox.setChecked(checked)
-                directory = checkbox.text()
-                directories[directory] = checked
-                update_directories(directory, checked)
+    def show_result(self, result, state="Scanning"):
+        for tree, items in ((self.dirs_list, result['top_dirs']), (self.files_list, result['top_files'])):
+            tree.clear()
+            for size, path in items:
+                item = QTreeWidgetItem([format_size(size), path])
+                item.setToolTip(1, path)
+                tree.addTopLevelItem(item)
+        if result['dirs'] == 0:
+            self.status_label.setText(f"Could not read {result['root']}")
+            return
+        self.status_label.setText(f"{state}: {format_size(result['total'])} in {result['files']} files, "
+                                  f"{result['dirs']} folders ({result['cached_dirs']} unchanged since last scan)")
@@ -0,0 +1,376 @@
+from PyQt6.QtCore import QObject, QThread, QTimer, QFileSystemWatcher, pyqtSignal
+import os
+import time
+
+from scripts.TempFilesDeleter.optimize_thread import OptimizeThread
+from scripts.TempFilesDeleter.safe_walk import is_link_entry
+
+# Directories watched per root. Change notifications only cover a directory's
+# direct children, so each directory past this limit is listed again whenever
+# its nearest watched ancestor reports a change
+MAX_WATCHED_DIRS_PER_ROOT = 256
+# Change events arriving within this window are handled together
+DEBOUNCE_MS = 500
+# Seconds before the same root may be cleaned again
+CLEANUP_COOLDOWN = 300
+
+def scan_directory(path):
+    """
+    List one directory without recursing. Returns ({file name: size}, {subdirectory names}).
+    Links and junctions count as files and are never listed as subdirectories.
+    """
+    files = {}
+    subdirs = set()
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False) and not is_link_entry(entry):
+                    subdirs.add(entry.name)
+                else:
+                    files[entry.name] = entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                continue
+    return files, subdirs
+
+def scan_tree(path, snapshots, should_stop=None):
+    """
+    Add a snapshot of every directory below path to snapshots. A directory
+    reached twice through different mounts is only added once. Returns False
+    if should_stop interrupted the scan.
+    """
+    should_stop = should_stop or (lambda: False)
+    visited = set()
+    stack = [path]
+    while stack:
+        if should_stop():
+            return False
+        current = stack.pop()
+        try:
+            st = os.stat(current)
+            if (st.st_dev, st.st_ino) in visited:
+                continue
+            visited.add((st.st_dev, st.st_ino))
+            files, subdirs = scan_directory(current)
+        except OSError:
+            continue
+        snapshots[current] = (files, subdirs)
+        stack.extend(os.path.join(current, name) for name in subdirs)
+    return True
+
+
+class InitialScanThread(QThread):
+    scanned = pyqtSignal(str, object)
+
+    def __init__(self, roots):
+        super().__init__()
+        self.roots = roots
+
+    def run(self):
+        for root in self.roots:
+            snapshots = {}
+            if os.path.isdir(root) and not scan_tree(root, snapshots, self.isInterruptionRequested):
+                return
+            if self.isInterruptionRequested():
+                return
+            self.scanned.emit(root, snapshots)
+
+
+class ChangeScanThread(QThread):
+    """
+    Lists directories that may have changed. Takes (path, known subdirectory
+    names) pairs, scans every subdirectory that is new and emits
+    {path: (files, subdirs)}, with None for directories that are gone.
+    """
+    scanned = pyqtSignal(object)
+
+    def __init__(self, requests):
+        super().__init__()
+        self.requests = requests
+
+    def run(self):
+        results = {}
+        for path, old_subdirs in self.requests:
+            if self.isInterruptionRequested():
+                return
+            try:
+                files, subdirs = scan_directory(path)
+            except OSError:
+                results[path] = None
+                continue
+            results[path] = (files, subdirs)
+            for name in subdirs - old_subdirs:
+                if not scan_tree(os.path.join(path, name), results, self.isInterruptionRequested):
+                    return
+        self.scanned.emit(results)
+
+
+class DirectoryWatcher(QObject):
+    """
+    Keeps a running byte/item tally per root from file system change events.
+    Only the directory that reported a change is listed again, together with
+    the unwatched directories it is the nearest watched ancestor of. All
+    listing happens on scan threads, one change scan at a time.
+    """
+    tally_changed = pyqtSignal(str, object, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self.directory_changed)
+        self.debounce = QTimer(self)
+        self.debounce.setSingleShot(True)
+        self.debounce.setInterval(DEBOUNCE_MS)
+        self.debounce.timeout.connect(self.process_changes)
+        self.roots = set()
+        self.snapshots = {}
+        self.dir_root = {}
+        self.tallies = {}
+        # Unwatched directory -> nearest watched ancestor, and the reverse
+        self.anchors = {}
+        self.unwatched = {}
+        self.dirty = set()
+        self.scan_threads = []
+        self.change_thread = None
+
+    def start(self, roots):
+        self.stop()
+        self.add_roots(roots)
+
+    def add_roots(self, roots):
+        roots = [root for root in roots if root not in self.roots]
+        if not roots:
+            return
+        self.roots.update(roots)
+        thread = InitialScanThread(roots)
+        thread.scanned.connect(self.add_root)
+        self.start_thread(thread)
+
+    def start_thread(self, thread):
+        self.scan_threads = [running for running in self.scan_threads if running.isRunning()]
+        self.scan_threads.append(thread)
+        thread.start()
+
+    def remove_root(self, root):
+        self.roots.discard(root)
+        if root not in self.tallies:
+            # Still being scanned; add_root drops the result
+            return
+        self.remove_tree(root)
+        del self.tallies[root]
+
+    def stop(self):
+        for thread in self.scan_threads:
+            thread.requestInterruption()
+        for thread in self.scan_threads:
+            thread.wait()
+        self.scan_threads = []
+        self.change_thread = None
+        self.debounce.stop()
+        watched = self.watcher.directories()
+        if watched:
+            self.watcher.removePaths(watched)
+        self.roots.clear()
+        self.snapshots.clear()
+        self.dir_root.clear()
+        self.tallies.clear()
+        self.anchors.clear()
+        self.unwatched.clear()
+        self.dirty.clear()
+
+    def add_root(self, root, snapshots):
+        if root not in self.roots or root in self.tallies:
+            # Late result for a root that was removed or already scanned
+            return
+        self.tallies[root] = [0, 0]
+        for path, (files, subdirs) in snapshots.items():
+            self.add_snapshot(root, path, files, subdirs)
+        self.watch(root, snapshots)
+        self.tally_changed.emit(root, *self.tallies[root])
+
+    def add_snapshot(self, root, path, files, subdirs):
+        self.snapshots[path] = (files, subdirs)
+        self.dir_root[path] = root
+        tally = self.tallies[root]
+        tally[0] += sum(files.values())
+        tally[1] += len(files)
+
+    def watch(self, root, paths):
+        """
+        Watch new directories of root while it has watches left, shallow
+        directories first since they see the most churn, and anchor the rest
+        to their nearest watched ancestor. Directories the watcher dropped
+        because they were deleted no longer count against the limit.
+        """
+        watched = set(self.watcher.directories())
+        count = sum(1 for path in watched if self.dir_root.get(path) == root)
+        for path in sorted(paths, key=len):
+            if count < MAX_WATCHED_DIRS_PER_ROOT and self.watcher.addPath(path):
+                watched.add(path)
+                count += 1
+                continue
+            parent = os.path.dirname(path)
+            anchor = parent if parent in watched else self.anchors.get(parent)
+            if anchor is not None:
+                self.anchors[path] = anchor
+                self.unwatched.setdefault(anchor, set()).add(path)
+
+    def remove_tree(self, path):
+        root = self.dir_root.get(path)
+        if root is None:
+            return
+        prefix = path + os.sep
+        removed = [p for p in self.snapshots if p == path or p.startswith(prefix)]
+        for p in removed:
+            files, _ = self.snapshots.pop(p)
+            del self.dir_root[p]
+            self.tallies[root][0] -= sum(files.values())
+            self.tallies[root][1] -= len(files)
+            anchor = self.anchors.pop(p, None)
+            if anchor is not None and anchor in self.unwatched:
+                self.unwatched[anchor].discard(p)
+            self.unwatched.pop(p, None)
+        watched_paths = set(self.watcher.directories())
+        watched = [p for p in removed if p in watched_paths]
+        if watched:
+            self.watcher.removePaths(watched)
+
+    def directory_changed(self, path):
+        self.dirty.add(path)
+        if not self.debounce.isActive():
+            self.debounce.start()
+
+    def process_changes(self):
+        # Changes reported while a scan runs wait for it to finish
+        if self.change_thread is not None or not self.dirty:
+            return
+        dirty, self.dirty = self.dirty, set()
+        requests = {}
+        for path in dirty:
+            if path not in self.snapshots:
+                continue
+            for p in [path, *self.unwatched.get(path, ())]:
+                requests[p] = set(self.snapshots[p][1])
+        if not requests:
+            return
+        thread = ChangeScanThread(list(requests.items()))
+        thread.scanned.connect(lambda results: self.apply_changes(thread, results))
+        thread.finished.connect(lambda: self.change_scan_finished(thread))
+        self.change_thread = thread
+        self.start_thread(thread)
+
+    def change_scan_finished(self, thread):
+        if thread is self.change_thread:
+            self.change_thread = None
+            self.process_changes()
+
+    def apply_changes(self, thread, results):
+        if thread is not self.change_thread:
+            # Result of a scan from before stop()
+            return
+        changed_roots = set()
+        added = {}
+        for path in sorted(results, key=len):
+            snapshot = results[path]
+            root = self.dir_root.get(path)
+            if root is None:
+                # New directory, kept if its parent is still known and lists it
+                parent = os.path.dirname(path)
+                root = self.dir_root.get(parent)
+                if (snapshot is None or root is None
+                        or os.path.basename(path) not in self.snapshots[parent][1]):
+                    continue
+                self.add_snapshot(root, path, *snapshot)
+                added.setdefault(root, []).append(path)
+                changed_roots.add(root)
+                continue
+            if snapshot is None:
+                # The directory itself is gone
+                self.remove_tree(path)
+                changed_roots.add(root)
+                continue
+            old_files, old_subdirs = self.snapshots[path]
+            files, subdirs = snapshot
+            if files == old_files and subdirs == old_subdirs:
+                continue
+            tally = self.tallies[root]
+            tally[0] += sum(files.values()) - sum(old_files.values())
+            tally[1] += len(files) - len(old_files)
+            self.snapshots[path] = (files, subdirs)
+            for name in old_subdirs - subdirs:
+                self.remove_tree(os.path.join(path, name))
+            changed_roots.add(root)
+        for root, paths in added.items():
+            self.watch(root, paths)
+        for root in changed_roots:
+            self.tally_changed.emit(root, *self.tallies[root])
+
+
+class WatchCleaner(QObject):
+    """
+    Watches the enabled directories and starts a cleanup of a single directory
+    when it grows past its size or item threshold.
+    """
+    cleanup_started = pyqtSignal(str)
+    cleanup_finished = pyqtSignal(str)
+    error = pyqtSignal(str)
+
+    def __init__(self, settings, parent=None):
+        super().__init__(parent)
+        self.settings = settings
+        self.watcher = DirectoryWatcher(self)
+        self.watcher.tally_changed.connect(self.check_threshold)
+        self.roots = {}
+        self.cleanups = {}
+        self.last_cleanup = {}
+
+    def apply_settings(self):
+        # Only roots that were added or removed are scanned or dropped
+        if not self.settings.get('watch_mode'):
+            self.watcher.stop()
+            self.roots = {}
+            return
+        roots = {}
+        for directory, enabled in self.settings.directories.items():
+            if enabled:
+                roots[os.path.normpath(os.path.expandvars(directory))] = directory
+        for root in set(self.roots) - set(roots):
+            self.watcher.remove_root(root)
+        self.watcher.add_roots([root for root in roots if root not in self.roots])
+        self.roots = roots
+
+    def thresholds(self, directory):
+        overrides = (self.settings.get('watch_thresholds') or {}).get(directory, {})
+        max_mb = overrides.get('max_mb', self.settings.get('watch_max_mb'))
+        max_items = overrides.get('max_items', self.settings.get('watch_max_items'))
+        return max_mb * 1024 * 1024, max_items
+
+    def check_threshold(self, root, total_bytes, total_items):
+        directory = self.roots.get(root)
+        if directory is None or root in self.cleanups:
+            return
+        if time.monotonic() - self.last_cleanup.get(root, -CLEANUP_COOLDOWN) < CLEANUP_COOLDOWN:
+            return
+        max_bytes, max_items = self.thresholds(directory)
+        if total_bytes > max_bytes or total_items > max_items:
+            self.start_cleanup(root, directory)
+
+    def start_cleanup(self, root, directory):
+        job = self.settings.cleanup_job()
+        job['directories'] = {directory: True}
+        thread = OptimizeThread(**job)
+        thread.error.connect(self.error.emit)
+        thread.finished.connect(lambda: self.cleanup_done(root))
+        self.cleanups[root] = thread
+        self.cleanup_started.emit(directory)
+        thread.start()
+
+    def cleanup_done(self, root):
+        self.cleanups.pop(root, None)
+        self.last_cleanup[root] = time.monotonic()
+        self.cleanup_finished.emit(self.roots.get(root, root))
+
+    def stop(self):
+        self.watcher.stop()
+        for thread in list(self.cleanups.values()):
+            thread.requestInterruption()
+            thread.wait()
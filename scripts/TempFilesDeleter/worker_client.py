@@ -0,0 +1,126 @@
+from PyQt6.QtCore import QObject, QProcess, QTimer, pyqtSignal
+import os
+import sys
+import time
+
+from scripts.TempFilesDeleter.cleanup_worker import (encode_message, decode_message, JOB, QUIT,
+                                                     HEARTBEAT, PROGRESS, ERROR, DONE)
+
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cleanup_worker.py")
+# Restart a crashed worker this many times per job before giving up
+MAX_RESTARTS = 3
+# A running job that sends nothing for this long is treated as hung
+HANG_TIMEOUT = 60
+
+class CleanupWorkerClient(QObject):
+    """
+    Runs cleanup jobs in the cleanup worker process. Exposes the same signals as
+    OptimizeThread and restarts the worker if it dies or hangs mid-job.
+    """
+    progress = pyqtSignal(int)
+    error = pyqtSignal(str)
+    finished = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.process = None
+        self.buffer = b""
+        self.job = None
+        self.summary = {}
+        self.restarts = 0
+        self.last_message = 0.0
+        self.watchdog = QTimer(self)
+        self.watchdog.setInterval(5000)
+        self.watchdog.timeout.connect(self.check_worker)
+
+    def start_job(self, job):
+        self.job = job
+        self.summary = {}
+        self.restarts = 0
+        self.submit()
+
+    def submit(self):
+        self.ensure_worker()
+        if self.job is None:
+            # The worker failed to start and the job was already ended
+            return
+        self.last_message = time.monotonic()
+        self.process.write(encode_message(JOB, self.job))
+        self.watchdog.start()
+
+    def ensure_worker(self):
+        if self.process is not None and self.process.state() != QProcess.ProcessState.NotRunning:
+            return
+        self.buffer = b""
+        self.process = QProcess(self)
+        self.process.setProgram(sys.executable)
+        self.process.setArguments([WORKER_SCRIPT])
+        self.process.setProcessChannelMode(QProcess.ProcessChannelMode.ForwardedErrorChannel)
+        self.process.readyReadStandardOutput.connect(self.read_messages)
+        self.process.finished.connect(self.worker_exited)
+        self.process.errorOccurred.connect(self.worker_error)
+        self.process.start()
+
+    def read_messages(self):
+        process = self.sender()
+        if process is not self.process:
+            return
+        self.buffer += bytes(process.readAllStandardOutput())
+        while b"\n" in self.buffer:
+            line, self.buffer = self.buffer.split(b"\n", 1)
+            if line.strip():
+                self.handle_message(*decode_message(line))
+
+    def handle_message(self, kind, args):
+        self.last_message = time.monotonic()
+        if self.job is None:
+            return
+        if kind == PROGRESS:
+            self.progress.emit(args[0])
+        elif kind == ERROR:
+            self.error.emit(args[0])
+        elif kind == DONE:
+            self.summary = args[0]
+            self.job = None
+            self.watchdog.stop()
+            self.finished.emit()
+        elif kind == HEARTBEAT:
+            pass
+
+    def check_worker(self):
+        if self.job is not None and time.monotonic() - self.last_message > HANG_TIMEOUT:
+            # worker_exited restarts it
+            self.process.kill()
+
+    def worker_exited(self, exit_code, exit_status):
+        if self.sender() is not self.process or self.job is None:
+            return
+        if self.restarts < MAX_RESTARTS:
+            self.restarts += 1
+            self.submit()
+        else:
+            self.job = None
+            self.watchdog.stop()
+            self.error.emit(f"The cleanup worker stopped unexpectedly (exit code {exit_code}).")
+            self.finished.emit()
+
+    def worker_error(self, process_error):
+        # A worker that never started emits no finished signal
+        if self.sender() is not self.process or process_error != QProcess.ProcessError.FailedToStart:
+            return
+        if self.job is None:
+            return
+        self.job = None
+        self.watchdog.stop()
+        self.error.emit(f"The cleanup worker could not be started: {self.process.errorString()}")
+        self.finished.emit()
+
+    def shutdown(self):
+        self.job = None
+        self.watchdog.stop()
+        if self.process is None or self.process.state() == QProcess.ProcessState.NotRunning:
+            return
+        self.process.write(encode_message(QUIT))
+        if not self.process.waitForFinished(1000):
+            self.process.kill()
+            self.process.waitForFinished(1000)
@@ -0,0 +1,81 @@
+import os
+import sys
+import time
+import random
+import argparse
+import tracemalloc
+
+# Define the root directory for the application
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from scripts.TempFilesDeleter import scan_store
+from scripts.TempFilesDeleter.scan_store import ScanStore, FILE, DIR
+
+ROOTS = ["/tmp", "/var/tmp", os.path.expanduser("~/.cache")]
+ENTRIES_PER_DIR = 50
+
+def synthetic_entries(count, seed=0):
+    """
+    Yield (root, parent, name, size, mtime, kind) tuples shaped like a cache tree.
+    """
+    rng = random.Random(seed)
+    now = int(time.time())
+    parent = None
+    for i in range(count):
+        if i % ENTRIES_PER_DIR == 0:
+            root = ROOTS[(i // ENTRIES_PER_DIR) % len(ROOTS)]
+            parent = os.path.join(root, f"dir{i // ENTRIES_PER_DIR:07d}")
+            kind = DIR
+        else:
+            kind = FILE
+        yield (root, parent, f"file{i:08d}.tmp", int(rng.expovariate(1 / 65536)) if kind == FILE else 0,
+               now - rng.randrange(400 * 24 * 60 * 60), kind)
+
+def fill_store(count):
+    store = ScanStore()
+    for root, parent, name, size, mtime, kind in synthetic_entries(count):
+        store.add(store.intern_root(root), store.intern_parent(parent), name, size, mtime, kind)
+    return store
+
+def fill_tuples(count):
+    return [(os.path.join(parent, name), root, size, mtime, kind)
+            for root, parent, name, size, mtime, kind in synthetic_entries(count)]
+
+def measure(build, count):
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = build(count)
+    elapsed = time.perf_counter() - started
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, elapsed
+
+def timed(function):
+    started = time.perf_counter()
+    function()
+    return time.perf_counter() - started
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory benchmark for the scan result store")
+    parser.add_argument("--entries", type=int, nargs="+", default=[1_000_000, 5_000_000])
+    parser.add_argument("--compare", action="store_true", help="Also measure a list of tuples (slow, needs a lot of memory)")
+    args = parser.parse_args()
+
+    print(f"numpy: {'yes' if scan_store.numpy is not None else 'no (pure Python aggregations)'}")
+    for count in args.entries:
+        store, traced, elapsed = measure(fill_store, count)
+        print(f"\n{count:,} entries")
+        print(f"  ScanStore      {traced / count:6.1f} B/entry  {traced / 2**20:8.1f} MB  "
+              f"(columns {store.nbytes() / 2**20:.1f} MB)  built in {elapsed:.1f}s")
+        print(f"  totals_by_root {timed(store.totals_by_root):.3f}s")
+        print(f"  age_histogram  {timed(store.age_histogram):.3f}s")
+        print(f"  size_histogram {timed(store.size_histogram):.3f}s")
+        del store
+        if args.compare:
+            tuples, traced, elapsed = measure(fill_tuples, count)
+            print(f"  list of tuples {traced / count:6.1f} B/entry  {traced / 2**20:8.1f} MB  built in {elapsed:.1f}s")
+            del tuples
+
+if __name__ == "__main__":
+    main()
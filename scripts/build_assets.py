@@ -0,0 +1,33 @@
+import os
+import base64
+
+# Define the root directory for the application
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSETS_DIR = os.path.join(ROOT_DIR, "assets")
+BUNDLE_FILE = os.path.join(ROOT_DIR, "scripts", "TempFilesDeleter", "assets_bundle.py")
+
+LINE_LENGTH = 76
+
+def build_bundle(assets_dir=ASSETS_DIR, bundle_file=BUNDLE_FILE):
+    """
+    Pack every file in the assets directory into one Python module.
+    """
+    lines = ["# Generated by scripts/build_assets.py from the assets directory. Do not edit.",
+             "ASSETS = {"]
+    for name in sorted(os.listdir(assets_dir)):
+        path = os.path.join(assets_dir, name)
+        if not os.path.isfile(path):
+            continue
+        with open(path, 'rb') as f:
+            encoded = base64.b64encode(f.read()).decode("ascii")
+        lines.append(f"    {name!r}: (")
+        for start in range(0, len(encoded), LINE_LENGTH):
+            lines.append(f"        \"{encoded[start:start + LINE_LENGTH]}\"")
+        lines.append("    ),")
+    lines.append("}")
+    with open(bundle_file, 'w', newline="\n") as f:
+        f.write("\n".join(lines) + "\n")
+    print(f"Wrote {bundle_file}")
+
+if __name__ == "__main__":
+    build_bundle()